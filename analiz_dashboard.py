@@ -5,25 +5,36 @@ from tkinter import ttk, messagebox
 import pandas as pd
 import platform
 from veri_analizi import VeriAnalizi
-from dashboard_components import DashboardComponents
+from dashboard_components import DashboardComponents, CanvasCardRenderer
+from dashboard_model import DashboardViewModel
+from izleme import traced
+
+# Arama ve filtre sonuçlarında biçimlendirilip gösterilen en fazla satır
+SEARCH_RESULT_LIMIT = 20
+FILTER_RESULT_LIMIT = 50
 
 class AnalyzDashboard:
-    def __init__(self, parent_notebook, df):
+    def __init__(self, parent_notebook, df, view_model=None):
         """
         Modern Dashboard arayüzü - Refactored version
+        
+        Args:
+            parent_notebook: Dashboard sekmesinin ekleneceği notebook
+            df: Karlılık analizi sonuç verisi
+            view_model: Arka planda hazırlanmış DashboardViewModel (yoksa burada hesaplanır)
         """
         self.notebook = parent_notebook
-        self.df = df.copy() if df is not None and not df.empty else pd.DataFrame()
+        # Kopyalanmaz - sonuç paylaşımlı bellekten eşlenmiş olabilir; dashboard veriyi değiştirmez
+        self.df = df if df is not None and not df.empty else pd.DataFrame()
         
         # Platform belirleme
         self.os_platform = platform.system()
         
-        # VeriAnalizi nesnesini güvenli şekilde oluştur
-        try:
-            self.analiz = VeriAnalizi(self.df)
-        except Exception as e:
-            print(f"VeriAnalizi oluşturma hatası: {e}")
-            self.analiz = None
+        # Görünüm modeli - KPI, listeler ve metinler hazır gelir
+        self.view_model = view_model if view_model is not None else DashboardViewModel(self.df)
+        
+        # VeriAnalizi yalnızca arama/filtre için, ilk ihtiyaçta oluşturulur
+        self._analiz = None
         
         # Renk paletini components'ten al
         self.colors = DashboardComponents.COLORS
@@ -31,11 +42,93 @@ class AnalyzDashboard:
         # Dashboard frame'i oluştur
         self.dashboard_frame = ttk.Frame(self.notebook)
         self.setup_dashboard()
-        
+    
     def get_frame(self):
         """Dashboard frame'ini döndür"""
         return self.dashboard_frame
     
+    @property
+    def analiz(self):
+        """Arama ve filtreler için VeriAnalizi - ilk kullanımda oluşturulur"""
+        if self._analiz is None and not self.df.empty:
+            try:
+                self._analiz = VeriAnalizi(self.df)
+            except Exception as e:
+                print(f"VeriAnalizi oluşturma hatası: {e}")
+        return self._analiz
+    
+    def update(self, df, view_model=None):
+        """Dashboard'u yeni analiz sonucu ile yerinde güncelle
+        
+        Widget ağacı yeniden kurulmaz; yalnızca içeriği değişen kartlar ve
+        listeler yeniden çizilir, eski arama sonuçları yok edilir.
+        
+        Returns:
+            bool: İçerik değiştiyse True
+        """
+        new_df = df if df is not None and not df.empty else pd.DataFrame()
+        
+        # Çerçeveler karşılaştırılmaz (UI thread'inde O(n)); işçinin verdiği sonuç
+        # anahtarları karşılaştırılır - anahtar bilinmiyorsa içerik değişmiş sayılır
+        new_key = getattr(view_model, 'content_key', None)
+        if new_key is not None and new_key == getattr(self.view_model, 'content_key', None):
+            # İçerik aynı; eski bellek serbest bırakılabilsin diye yeni nesneye geç
+            self.df = new_df
+            self.view_model = view_model
+            return False
+        
+        self.df = new_df
+        self.view_model = view_model if view_model is not None else DashboardViewModel(self.df)
+        self._analiz = None
+        
+        self.refresh_content()
+        return True
+    
+    def refresh_content(self):
+        """Veriye bağlı tüm bölümleri mevcut widget'lar üzerinde yenile"""
+        vm = self.view_model
+        try:
+            if getattr(self, 'subtitle_label', None):
+                self.subtitle_label.config(text=vm.subtitle_text)
+            
+            if getattr(self, 'kpi_renderer', None):
+                self.kpi_renderer.set_items(vm.kpi_cards)
+            if getattr(self, 'top_profitable_list', None):
+                self.top_profitable_list.set_items(vm.top_profitable_items)
+            if getattr(self, 'top_selling_list', None):
+                self.top_selling_list.set_items(vm.top_selling_items)
+            if getattr(self, 'profit_renderer', None):
+                self.profit_renderer.set_items(vm.profit_cards)
+            if getattr(self, 'low_profit_list', None):
+                self.low_profit_list.set_items(vm.low_profit_items)
+            if getattr(self, 'stats_renderer', None):
+                self.stats_renderer.set_items(vm.stat_items)
+            
+            # Eski arama sonuçlarını yok et
+            if getattr(self, 'search_result_frame', None):
+                self.clear_search()
+        
+        except Exception as e:
+            print(f"Dashboard yenileme hatası: {e}")
+    
+    def destroy(self):
+        """Dashboard widget ağacını tamamen yok et"""
+        try:
+            if self.dashboard_frame.winfo_exists():
+                self.dashboard_frame.destroy()
+        except tk.TclError:
+            pass
+        
+        self.kpi_renderer = None
+        self.profit_renderer = None
+        self.stats_renderer = None
+        self.top_profitable_list = None
+        self.top_selling_list = None
+        self.low_profit_list = None
+        self._analiz = None
+        self.df = pd.DataFrame()
+    
+    @traced('dashboard')
     def setup_dashboard(self):
         """Modern Dashboard arayüzünü oluştur"""
         try:
@@ -99,38 +192,57 @@ class AnalyzDashboard:
             # Scrollable frame
             self.scrollable_frame = tk.Frame(self.canvas, bg=self.colors['bg_primary'])
             
-            # Scroll region güncellemesi
-            def configure_scroll_region(event=None):
+            # Scroll region güncellemesi - tek pencere öğesi olduğu için bbox yerine
+            # frame'in istediği boyut kullanılır
+            def configure_scroll_region():
                 """Canvas scroll region'ını güncelle"""
                 try:
-                    self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+                    self.canvas.configure(scrollregion=(
+                        0, 0,
+                        self.scrollable_frame.winfo_reqwidth(),
+                        self.scrollable_frame.winfo_reqheight()
+                    ))
                 except (tk.TclError, AttributeError):
                     pass
-                    
-            def configure_canvas_width(event=None):
+            
+            def configure_canvas_width():
                 """Canvas genişliğini ayarla"""
                 try:
                     canvas_width = self.canvas.winfo_width()
-                    if canvas_width > 1 and hasattr(self, 'canvas_window'):
+                    if (canvas_width > 1 and hasattr(self, 'canvas_window')
+                            and canvas_width != self._canvas_width):
+                        self._canvas_width = canvas_width
                         self.canvas.itemconfig(self.canvas_window, width=canvas_width)
                 except (tk.TclError, AttributeError):
                     pass
             
-            # Event binding
-            self.scrollable_frame.bind("<Configure>", configure_scroll_region)
-            self.canvas.bind('<Configure>', configure_canvas_width)
+            # Event binding - <Configure> fırtınası çerçeve başına tek yerleşime indirilir
+            self._canvas_width = 0
+            self.scrollable_frame.bind(
+                "<Configure>", DashboardComponents.coalesce(self.canvas, configure_scroll_region)
+            )
+            self.canvas.bind(
+                '<Configure>', DashboardComponents.coalesce(self.canvas, configure_canvas_width)
+            )
             
             # Canvas window oluştur
             self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
             self.canvas.configure(yscrollcommand=self.scrollbar.set)
             
-            # Mouse wheel scroll - Platform güvenli
+            # Mouse wheel scroll - olaylar biriktirilip çerçeve başına bir kez uygulanır
+            self._pending_scroll = 0
+            
+            def flush_scroll():
+                """Biriken scroll miktarını tek seferde uygula"""
+                delta, self._pending_scroll = self._pending_scroll, 0
+                if delta and self.canvas.winfo_viewable():
+                    self.canvas.yview_scroll(delta, "units")
+            
+            schedule_scroll = DashboardComponents.coalesce(self.canvas, flush_scroll)
+            
             def on_mouse_wheel(event):
                 """Platform bağımsız mouse wheel scroll"""
                 try:
-                    if not self.canvas.winfo_viewable():
-                        return "break"
-                        
                     delta = 0
                     if self.os_platform == "Windows":
                         delta = -1 * int(event.delta / 120)
@@ -144,9 +256,11 @@ class AnalyzDashboard:
                         else:
                             return "break"
                     
-                    self.canvas.yview_scroll(delta, "units")
+                    if delta:
+                        self._pending_scroll += delta
+                        schedule_scroll()
                     return "break"
-                    
+                
                 except (AttributeError, tk.TclError, ValueError, TypeError) as e:
                     print(f"Scroll event hatası: {e}")
                     return "break"
@@ -232,10 +346,11 @@ class AnalyzDashboard:
                     pass
             
             self.canvas.after(100, initial_focus_check)
-            
+        
         except Exception as e:
             print(f"Scrollable frame oluşturma hatası: {e}")
     
+    @traced('dashboard')
     def create_modern_header(self):
         """Modern gradient header"""
         try:
@@ -262,119 +377,39 @@ class AnalyzDashboard:
             title_label.pack(anchor='w')
             
             # Alt başlık - Güvenli uzunluk
-            product_count = len(self.df) if not self.df.empty else 0
-            subtitle_label = tk.Label(
+            self.subtitle_label = tk.Label(
                 content_frame,
-                text=f"Toplam {product_count} ürün detaylı analizi",
+                text=self.view_model.subtitle_text,
                 font=('Segoe UI', 14),
                 fg='#bfdbfe',
                 bg=self.colors['primary']
             )
-            subtitle_label.pack(anchor='w', pady=(5, 0))
+            self.subtitle_label.pack(anchor='w', pady=(5, 0))
             
             # Shadow efekti
             DashboardComponents.create_shadow_effect(header_frame, gradient_frame, 4)
-            
+        
         except Exception as e:
             print(f"Header oluşturma hatası: {e}")
     
+    @traced('dashboard')
     def create_enhanced_kpi_section(self):
         """Geliştirilmiş KPI kartları bölümü"""
         try:
             # Section başlığı
             DashboardComponents.create_section_title(self.main_frame, "🎯 Performans Özeti", "Ana performans metrikleri")
             
-            # KPI verilerini al
-            try:
-                if self.analiz:
-                    kpi_data = self.analiz.get_kpi_summary()
-                else:
-                    kpi_data = self.get_empty_kpi_data()
-            except Exception as e:
-                print(f"KPI verisi alma hatası: {e}")
-                kpi_data = self.get_empty_kpi_data()
-            
             # KPI kartları container
             kpi_container = tk.Frame(self.main_frame, bg=self.colors['bg_primary'])
             kpi_container.pack(fill='x', pady=(0, 40))
             
-            # İlk satır KPI kartları
-            kpi_row1 = tk.Frame(kpi_container, bg=self.colors['bg_primary'])
-            kpi_row1.pack(fill='x', pady=(0, 20))
-            
-            # En karlı ürün adını güvenli şekilde kısalt
-            en_karli_urun_text = str(kpi_data.get('en_karli_urun', 'Veri Yok'))
-            if len(en_karli_urun_text) > 20:
-                en_karli_urun_text = en_karli_urun_text[:20] + "..."
-            
-            # KPI kartlarını oluştur - Güvenli değerlerle
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row1, "💰", "Toplam Net Kar", 
-                f"₺{kpi_data.get('toplam_kar', 0):,.0f}", 
-                self.colors['success'], 0
-            )
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row1, "🏆", "En Karlı Ürün", 
-                en_karli_urun_text, 
-                self.colors['primary'], 1
-            )
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row1, "📈", "Ortalama Kar", 
-                f"₺{kpi_data.get('ortalama_kar', 0):,.0f}", 
-                self.colors['warning'], 2
-            )
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row1, "📦", "Toplam Ürün", 
-                f"{kpi_data.get('toplam_urun', 0)} adet", 
-                self.colors['info'], 3
-            )
-            
-            # İkinci satır KPI kartları
-            kpi_row2 = tk.Frame(kpi_container, bg=self.colors['bg_primary'])
-            kpi_row2.pack(fill='x')
-            
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row2, "✅", "Karlı Ürün", 
-                f"{kpi_data.get('pozitif_kar_urun', 0)} adet", 
-                self.colors['success'], 0
-            )
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row2, "❌", "Zararlı Ürün", 
-                f"{kpi_data.get('negatif_kar_urun', 0)} adet", 
-                self.colors['danger'], 1
-            )
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row2, "🎯", "En Yüksek Kar", 
-                f"₺{kpi_data.get('en_karli_urun_kar', 0):,.0f}", 
-                '#8b5cf6', 2
-            )
-            DashboardComponents.create_modern_kpi_card(
-                kpi_row2, "📊", "Toplam Satış", 
-                f"{kpi_data.get('toplam_satis_miktar', 0):,.0f} adet", 
-                self.colors['info'], 3
-            )
-            
-            # Grid konfigürasyonu
-            for i in range(4):
-                kpi_row1.grid_columnconfigure(i, weight=1)
-                kpi_row2.grid_columnconfigure(i, weight=1)
-                
+            # KPI kartları - iki satır, tek canvas
+            self.kpi_renderer = DashboardComponents.create_kpi_cards(kpi_container, self.view_model.kpi_cards, columns=4)
+        
         except Exception as e:
             print(f"KPI section oluşturma hatası: {e}")
     
-    def get_empty_kpi_data(self):
-        """Boş KPI verisi"""
-        return {
-            'toplam_kar': 0,
-            'en_karli_urun': 'Veri Yok',
-            'en_karli_urun_kar': 0,
-            'ortalama_kar': 0,
-            'toplam_urun': 0,
-            'pozitif_kar_urun': 0,
-            'negatif_kar_urun': 0,
-            'toplam_satis_miktar': 0
-        }
-    
+    @traced('dashboard')
     def create_analysis_tabs(self):
         """Modern analiz sekmeleri"""
         try:
@@ -415,10 +450,11 @@ class AnalyzDashboard:
             self.create_performance_tab()
             self.create_profit_tab()
             self.create_distribution_tab()
-            
+        
         except Exception as e:
             print(f"Analysis tabs oluşturma hatası: {e}")
     
+    @traced('dashboard')
     def create_performance_tab(self):
         """Performans analizi sekmesi"""
         try:
@@ -477,32 +513,18 @@ class AnalyzDashboard:
             DashboardComponents.create_shadow_effect(left_container, left_frame, 3)
             DashboardComponents.create_shadow_effect(right_container, right_frame, 3)
             
-            # Veri listelerini oluştur - Güvenli
-            try:
-                if self.analiz:
-                    top_profitable = self.analiz.get_top_profitable_products(10)
-                    top_selling = self.analiz.get_top_selling_products(10)
-                    miktar_col = self.analiz.find_miktar_column()
-                else:
-                    top_profitable = pd.DataFrame()
-                    top_selling = pd.DataFrame()
-                    miktar_col = None
-            except Exception as e:
-                print(f"Top ürünler hatası: {e}")
-                top_profitable = pd.DataFrame()
-                top_selling = pd.DataFrame()
-                miktar_col = None
-            
-            DashboardComponents.create_modern_product_list(
-                left_frame, top_profitable, 'Net Kar', self.colors['success'], self.analiz
+            # Veri listeleri - öğeler görünüm modelinde hazır
+            self.top_profitable_list = DashboardComponents.create_modern_product_list(
+                left_frame, self.view_model.top_profitable_items
             )
-            DashboardComponents.create_modern_product_list(
-                right_frame, top_selling, miktar_col if miktar_col else 'Miktar', self.colors['info'], self.analiz
+            self.top_selling_list = DashboardComponents.create_modern_product_list(
+                right_frame, self.view_model.top_selling_items
             )
-            
+        
         except Exception as e:
             print(f"Performance tab oluşturma hatası: {e}")
     
+    @traced('dashboard')
     def create_profit_tab(self):
         """Kar analizi sekmesi"""
         try:
@@ -512,16 +534,6 @@ class AnalyzDashboard:
             main_container = tk.Frame(profit_frame, bg=self.colors['bg_secondary'])
             main_container.pack(fill='both', expand=True, padx=20, pady=20)
             
-            # Kar dağılımı - Güvenli veri alma
-            try:
-                if self.analiz:
-                    dist_data = self.analiz.get_profit_distribution()
-                else:
-                    dist_data = {'cok_karli': 0, 'orta_karli': 0, 'dusuk_karli': 0, 'zararda': 0}
-            except Exception as e:
-                print(f"Kar dağılımı hatası: {e}")
-                dist_data = {'cok_karli': 0, 'orta_karli': 0, 'dusuk_karli': 0, 'zararda': 0}
-            
             # Kar dağılım başlığı
             dist_title = tk.Label(
                 main_container,
@@ -536,20 +548,7 @@ class AnalyzDashboard:
             dist_frame = tk.Frame(main_container, bg=self.colors['bg_secondary'])
             dist_frame.pack(fill='x', pady=(0, 20))
             
-            profit_colors = [self.colors['success'], self.colors['warning'], '#f97316', self.colors['danger']]
-            profit_data = [
-                ("📈", "Çok Karlı", dist_data.get('cok_karli', 0)),
-                ("⚖️", "Orta Karlı", dist_data.get('orta_karli', 0)),
-                ("📉", "Düşük Karlı", dist_data.get('dusuk_karli', 0)),
-                ("❌", "Zararda", dist_data.get('zararda', 0))
-            ]
-            
-            for i, ((icon, title, value), color) in enumerate(zip(profit_data, profit_colors)):
-                DashboardComponents.create_profit_card(dist_frame, icon, title, value, color, i)
-            
-            # Grid konfigürasyonu
-            for i in range(4):
-                dist_frame.grid_columnconfigure(i, weight=1)
+            self.profit_renderer = DashboardComponents.create_profit_cards(dist_frame, self.view_model.profit_cards, columns=4)
             
             # Düşük performanslı ürünler
             low_perf_container = tk.Frame(main_container, bg=self.colors['bg_secondary'])
@@ -574,23 +573,14 @@ class AnalyzDashboard:
             # Shadow efekti
             DashboardComponents.create_shadow_effect(low_perf_container, low_perf_frame, 3)
             
-            # Düşük karlı ürünleri al - Güvenli
-            try:
-                if self.analiz:
-                    low_profit_products = self.analiz.get_low_profit_products(10)
-                else:
-                    low_profit_products = pd.DataFrame()
-            except Exception as e:
-                print(f"Düşük karlı ürünler hatası: {e}")
-                low_profit_products = pd.DataFrame()
-            
-            DashboardComponents.create_modern_product_list(
-                low_perf_frame, low_profit_products, 'Net Kar', self.colors['danger'], self.analiz
+            self.low_profit_list = DashboardComponents.create_modern_product_list(
+                low_perf_frame, self.view_model.low_profit_items
             )
-            
+        
         except Exception as e:
             print(f"Profit tab oluşturma hatası: {e}")
     
+    @traced('dashboard')
     def create_distribution_tab(self):
         """Dağılım analizi sekmesi"""
         try:
@@ -600,16 +590,6 @@ class AnalyzDashboard:
             main_container = tk.Frame(dist_frame, bg=self.colors['bg_secondary'])
             main_container.pack(fill='both', expand=True, padx=20, pady=20)
             
-            # İstatistiksel özet - Güvenli veri alma
-            try:
-                if self.analiz:
-                    stats = self.analiz.get_summary_stats()
-                else:
-                    stats = {}
-            except Exception as e:
-                print(f"İstatistik hatası: {e}")
-                stats = {}
-            
             stats_container = tk.Frame(main_container, bg=self.colors['bg_secondary'])
             stats_container.pack(fill='x')
             
@@ -632,84 +612,19 @@ class AnalyzDashboard:
             # Shadow efekti
             DashboardComponents.create_shadow_effect(stats_container, stats_frame, 3)
             
-            # İstatistik kartları - Güvenli
-            if stats:
-                stats_content = tk.Frame(stats_frame, bg=self.colors['bg_secondary'])
-                stats_content.pack(fill='x', padx=20, pady=20)
-                
-                row = 0
-                col = 0
-                for key, value in stats.items():
-                    if col >= 3:
-                        col = 0
-                        row += 1
-                    
-                    # Stat card container
-                    stat_container = tk.Frame(stats_content, bg=self.colors['bg_secondary'])
-                    stat_container.grid(row=row, column=col, padx=8, pady=8, sticky='ew')
-                    
-                    # Stat card
-                    stat_card = tk.Frame(stat_container, bg='#f8fafc', relief='flat')
-                    stat_card.pack(fill='both', expand=True)
-                    
-                    # İç padding
-                    stat_inner = tk.Frame(stat_card, bg='#f8fafc')
-                    stat_inner.pack(fill='both', expand=True, padx=20, pady=15)
-                    
-                    # Başlık
-                    title_text = str(key).replace('_', ' ').title()
-                    title_label = tk.Label(
-                        stat_inner,
-                        text=title_text,
-                        font=('Segoe UI', 10, 'bold'),
-                        fg=self.colors['text_secondary'],
-                        bg='#f8fafc'
-                    )
-                    title_label.pack()
-                    
-                    # Değer - Güvenli formatlama
-                    try:
-                        if isinstance(value, float):
-                            if 'kar' in str(key).lower():
-                                value_text = f"₺{value:,.2f}"
-                            else:
-                                value_text = f"{value:,.2f}"
-                        else:
-                            value_text = f"{value:,}"
-                    except (ValueError, TypeError):
-                        value_text = str(value)
-                        
-                    value_label = tk.Label(
-                        stat_inner,
-                        text=value_text,
-                        font=('Segoe UI', 14, 'bold'),
-                        fg=self.colors['text_primary'],
-                        bg='#f8fafc'
-                    )
-                    value_label.pack(pady=(5, 0))
-                    
-                    # Shadow efekti
-                    DashboardComponents.create_shadow_effect(stat_container, stat_card, 2)
-                    
-                    col += 1
-                
-                # Grid ağırlıkları
-                for i in range(3):
-                    stats_content.grid_columnconfigure(i, weight=1)
-            else:
-                # Stats boşsa mesaj göster
-                no_stats_label = tk.Label(
-                    stats_frame,
-                    text="📊 İstatistik verisi bulunamadı",
-                    font=('Segoe UI', 12),
-                    fg=self.colors['text_secondary'],
-                    bg=self.colors['bg_secondary']
-                )
-                no_stats_label.pack(pady=30)
-                
+            # İstatistik kartları - tek canvas
+            self.stats_renderer = CanvasCardRenderer(
+                stats_frame, 'stat', columns=3, item_height=84, gap=16,
+                bg=self.colors['bg_secondary'],
+                empty_text="📊 İstatistik verisi bulunamadı"
+            )
+            self.stats_renderer.canvas.pack(fill='x', padx=20, pady=20)
+            self.stats_renderer.set_items(self.view_model.stat_items)
+        
         except Exception as e:
             print(f"Distribution tab oluşturma hatası: {e}")
     
+    @traced('dashboard')
     def create_enhanced_search_section(self):
         """Gelişmiş arama bölümü"""
         try:
@@ -875,7 +790,7 @@ class AnalyzDashboard:
             
             # Başlangıç mesajı
             self.show_initial_search_message()
-            
+        
         except Exception as e:
             print(f"Search section oluşturma hatası: {e}")
     
@@ -886,6 +801,7 @@ class AnalyzDashboard:
         except Exception as e:
             print(f"Initial search message hatası: {e}")
     
+    @traced('dashboard')
     def search_product(self):
         """Ürün arama işlemi"""
         try:
@@ -918,13 +834,15 @@ class AnalyzDashboard:
             
             # Arama yap - Güvenli
             try:
-                if self.analiz:
-                    results = self.analiz.search_product(search_term)
+                mask = self.analiz.search_mask(search_term) if self.analiz else None
+                if mask is not None:
+                    # Yalnızca tabloda gösterilecek satırlar biçimlendirilir
+                    results, total = self.analiz.get_display_rows(mask, SEARCH_RESULT_LIMIT)
                 else:
-                    results = pd.DataFrame()
+                    results, total = pd.DataFrame(), 0
             except Exception as e:
                 print(f"Arama hatası: {e}")
-                results = pd.DataFrame()
+                results, total = pd.DataFrame(), 0
             
             if results.empty:
                 no_result_container = tk.Frame(self.search_result_frame, bg=self.colors['bg_secondary'])
@@ -950,18 +868,19 @@ class AnalyzDashboard:
             
             tk.Label(
                 result_header,
-                text=f"🎯 '{search_term}' için {len(results)} sonuç bulundu:",
+                text=f"🎯 '{search_term}' için {total} sonuç bulundu:",
                 font=('Segoe UI', 14, 'bold'),
                 fg=self.colors['success'],
                 bg=self.colors['bg_secondary']
             ).pack(anchor='w')
             
             # Sonuç tablosu
-            DashboardComponents.display_search_results(self.search_result_frame, results, self.analiz)
-            
+            DashboardComponents.display_search_results(self.search_result_frame, results, total, SEARCH_RESULT_LIMIT)
+        
         except Exception as e:
             print(f"Search product hatası: {e}")
     
+    @traced('dashboard')
     def apply_quick_filter(self, filter_type):
         """Hızlı filtre uygula"""
         try:
@@ -973,34 +892,15 @@ class AnalyzDashboard:
                     pass
             
             try:
-                if filter_type == "all":
-                    results = self.df.copy()
-                elif filter_type == "profitable":
-                    results = self.df[self.df['Net Kar'] > 0] if 'Net Kar' in self.df.columns else pd.DataFrame()
-                elif filter_type == "loss":
-                    results = self.df[self.df['Net Kar'] < 0] if 'Net Kar' in self.df.columns else pd.DataFrame()
-                elif filter_type == "high_sales":
-                    if self.analiz:
-                        miktar_col = self.analiz.find_miktar_column()
-                        if miktar_col and miktar_col in self.df.columns:
-                            try:
-                                # Pandas numeric conversion güvenli
-                                miktar_series = pd.to_numeric(self.df[miktar_col], errors='coerce')
-                                threshold = miktar_series.quantile(0.75)
-                                mask = miktar_series >= threshold
-                                results = self.df[mask]
-                            except (ValueError, TypeError):
-                                results = pd.DataFrame()
-                        else:
-                            results = pd.DataFrame()
-                    else:
-                        results = pd.DataFrame()
+                mask = self.analiz.filter_mask(filter_type) if self.analiz else None
+                if mask is not None:
+                    results, total = self.analiz.get_display_rows(mask, FILTER_RESULT_LIMIT)
                 else:
-                    results = pd.DataFrame()
-                    
+                    results, total = pd.DataFrame(), 0
+            
             except Exception as e:
                 print(f"Filtreleme hatası: {e}")
-                results = pd.DataFrame()
+                results, total = pd.DataFrame(), 0
             
             if results.empty:
                 no_filter_container = tk.Frame(self.search_result_frame, bg=self.colors['bg_secondary'])
@@ -1033,15 +933,15 @@ class AnalyzDashboard:
             
             tk.Label(
                 result_header,
-                text=f"🎯 {filter_names.get(filter_type, 'Filtre')}: {len(results)} sonuç",
+                text=f"🎯 {filter_names.get(filter_type, 'Filtre')}: {total} sonuç",
                 font=('Segoe UI', 14, 'bold'),
                 fg=self.colors['info'],
                 bg=self.colors['bg_secondary']
             ).pack(anchor='w')
             
             # Sonuç tablosu - İlk 50 sonuç
-            DashboardComponents.display_search_results(self.search_result_frame, results.head(50), self.analiz)
-            
+            DashboardComponents.display_search_results(self.search_result_frame, results, total, FILTER_RESULT_LIMIT)
+        
         except Exception as e:
             print(f"Quick filter hatası: {e}")
     
@@ -1059,6 +959,6 @@ class AnalyzDashboard:
             
             # Başlangıç mesajını göster
             self.show_initial_search_message()
-            
+        
         except Exception as e:
             print(f"Clear search hatası: {e}")
\ No newline at end of file
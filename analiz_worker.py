@@ -0,0 +1,523 @@
+# analiz_worker.py - Ayrı süreçte çalışan analiz işçisi
+
+import multiprocessing
+import os
+import sys
+import threading
+import queue
+import itertools
+import time
+import izleme
+import profil
+from girdi_onbellegi import INPUT_KINDS
+
+
+# Tk içeren ana süreç fork edilmez; her platformda temiz süreç başlatılır
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+# İşçi sürecinden gelen olayları bekleme aralığı (saniye)
+EVENT_POLL_INTERVAL = 0.2
+
+# İptal isteğine işbirliğiyle uymayan işçi bu süre sonunda sonlandırılır (saniye)
+CANCEL_GRACE_SECONDS = 2.0
+
+# Diyalog cevabı beklenirken iptal kontrol aralığı (saniye)
+ANSWER_POLL_INTERVAL = 0.1
+
+# Açılıştaki ön ısıtma hazırlığının önceliği: POSIX nice artışı ve Windows
+# THREAD_PRIORITY_LOWEST - arayüz süreci ve diğer uygulamalar öne geçer
+BACKGROUND_NICE = 10
+WINDOWS_THREAD_PRIORITY_LOWEST = -2
+
+
+def lower_thread_priority():
+    """Çağıran thread'in işletim sistemi önceliğini düşür
+    
+    Linux'ta nice değeri thread başınadır, thread bitince etkisi de biter.
+    Desteklenmeyen platformda veya izin yoksa sessizce geçilir.
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), WINDOWS_THREAD_PRIORITY_LOWEST)
+        elif sys.platform.startswith('linux'):
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), BACKGROUND_NICE)
+    except Exception as e:
+        print(f"Thread önceliği düşürülemedi: {e}")
+
+
+def worker_main(command_queue, event_queue, cancel_event, prepare_generations):
+    """İşçi süreci giriş noktası
+    
+    command_queue üzerinden ('analyze', {...}), ('prepare', {...}) ve
+    ('answer', {...}) komutları alınır, None gelince süreç kapanır. İlerleme,
+    log, diyalog istekleri ve sonuç event_queue ile ana sürece
+    (message_type, data) olarak gönderilir. cancel_event ana süreç tarafından
+    kurulunca çalışan analiz durur; prepare_generations'daki tür sayacı
+    artınca o türün süren hazırlığı bırakılır.
+    """
+    # Ağır modüller yalnızca işçi sürecinde yüklenir
+    from karlilik import KarlilikAnalizi, CancellationToken, GenerationToken, AnalysisCancelled
+    import asama_grafi
+    import sonuc_onbellegi
+    from sutun_profilleri import ColumnProfiles
+    from uygulama_dizini import app_data_dir
+    from paylasimli_bellek import export_frame, close_blocks
+    
+    izleme.set_process_name("Analiz İşçisi")
+    
+    # KARLILIK_PROFILE açıksa profil özetleri arayüz log'una gider
+    profil.set_log_callback(lambda message, msg_type='info': event_queue.put(
+        ('log', {'message': message, 'type': msg_type})
+    ))
+    cancel_token = CancellationToken(cancel_event)
+    
+    request_ids = itertools.count(1)
+    transfer_ids = itertools.count(1)
+    
+    # Ana süreç eşleyene kadar açık tutulan paylaşımlı bellek blokları
+    pending_transfers = {}
+    
+    # Aşama çıktıları - dosya seçilince hazırlanan girdiler ve yarıda kalan
+    # analizin ara kayıtları; analiz bunları yeniden hesaplamaz
+    checkpoint_dir = None
+    if asama_grafi.checkpoints_enabled:
+        try:
+            checkpoint_dir = app_data_dir('ara_kayitlar')
+        except OSError as e:
+            event_queue.put(('log', {'message': f"Ara kayıt dizini kullanılamıyor: {e}", 'type': 'warning'}))
+    stage_memo = asama_grafi.StageMemo(checkpoint_dir)
+    
+    # Başlık düzenlerine göre kaydedilmiş sütun eşleşmeleri - tanınan düzende sütun sorulmaz
+    column_profiles = ColumnProfiles(log_callback=lambda message, msg_type='warning': event_queue.put(
+        ('log', {'message': message, 'type': msg_type})
+    ))
+    
+    # Diyalog cevabı beklenirken gelen ve sonra işlenecek komutlar
+    deferred_commands = []
+    
+    def handle_release(command, data):
+        """Ana süreç sonucu eşlediyse işçideki blok tutamaçlarını kapat"""
+        if command == 'release':
+            close_blocks(pending_transfers.pop(data.get('transfer_id'), []))
+            return True
+        return False
+    
+    def ask(kind, **kwargs):
+        """Ana süreçten diyalog cevabı iste ve gelene kadar bekle
+        
+        Beklerken gelen diğer komutlar (hazırlık, yeni analiz, eski cevaplar)
+        sırası korunarak sonra işlenir. Kapatma isteği (None) gelirse o da
+        sonraya bırakılır ve analiz iptal edilir; işçi analizden sonra kapanır.
+        """
+        request_id = next(request_ids)
+        event_queue.put(('worker_ask', dict(kwargs, request_id=request_id, kind=kind)))
+        while True:
+            try:
+                item = command_queue.get(timeout=ANSWER_POLL_INTERVAL)
+            except queue.Empty:
+                cancel_token.check()
+                continue
+            except (EOFError, OSError):
+                item = None
+            
+            if item is None:
+                deferred_commands.append(None)
+                raise AnalysisCancelled()
+            
+            command, data = item
+            if handle_release(command, data):
+                continue
+            if command == 'answer' and data.get('request_id') == request_id:
+                return data.get('value')
+            deferred_commands.append(item)
+    
+    def send_trace_events():
+        """İz açıksa bu analizin aralıklarını ana sürece gönder - dosyayı ana süreç yazar"""
+        if izleme.enabled:
+            event_queue.put(('trace_events', izleme.drain()))
+    
+    def send_progress(value, status, detail=None):
+        event_queue.put(('progress', {'value': value, 'status': status, 'detail': detail}))
+    
+    def prepare(data):
+        """Seçilen dosyayı soru sormadan hazırla - eskimiş istek hiç başlamaz"""
+        if prepare_generations[data['kind']].value != data['generation']:
+            return
+        
+        if not data.get('background'):
+            event = run_preparation(data, send_progress)
+        else:
+            # Ön ısıtma düşük öncelikli ayrı thread'de çalışır; ana thread yalnızca
+            # bekler, aşama belleği yine tek thread tarafından kullanılmış olur. Kuyruğa
+            # ana thread yazar - besleyici thread düşük önceliği miras almasın
+            outcome = []
+            
+            def run_in_background():
+                lower_thread_priority()
+                outcome.append(run_preparation(data, None))
+            
+            thread = threading.Thread(target=run_in_background, name="OnIsitma", daemon=True)
+            thread.start()
+            thread.join()
+            event = outcome[0] if outcome else None
+        
+        if event is not None:
+            event_queue.put(event)
+    
+    def run_preparation(data, progress_callback):
+        """Hazırlığı çalıştır ve gönderilecek olayı döndür - geçersiz kılındıysa None"""
+        kind = data['kind']
+        counter = prepare_generations[kind]
+        
+        # Analiz bu hazırlığın arkasında bekliyorsa ilerleme çubuğu bunu gösterir;
+        # ayrıntılı aşama logları gönderilmez, yalnızca sonuç bildirilir
+        preparer = KarlilikAnalizi(
+            progress_callback=progress_callback,
+            cancel_token=GenerationToken(counter, data['generation']),
+            stage_memo=stage_memo,
+            column_profiles=column_profiles
+        )
+        start = time.perf_counter()
+        try:
+            prepared = preparer.prepare_input(kind, data['sources'])
+        except AnalysisCancelled:
+            return None
+        except Exception as e:
+            return ('input_prepare_failed', {'kind': kind, 'path': data['path'], 'error': str(e)})
+        
+        if prepared is None:
+            return ('input_prepare_failed', {'kind': kind, 'path': data['path'], 'error': "dosya boş veya kullanılamaz"})
+        return ('input_prepared', {
+            'kind': kind,
+            'path': data['path'],
+            'needs_columns': prepared['needs_columns'],
+            'rows': prepared.get('rows'),
+            'seconds': time.perf_counter() - start,
+            'background': bool(data.get('background'))
+        })
+    
+    analiz = KarlilikAnalizi(
+        progress_callback=send_progress,
+        log_callback=lambda message, msg_type='info': event_queue.put(
+            ('log', {'message': message, 'type': msg_type})
+        ),
+        column_callback=lambda title, prompt: ask('column', title=title, prompt=prompt),
+        save_path_callback=lambda: ask('save_path'),
+        cancel_token=cancel_token,
+        stage_memo=stage_memo,
+        result_cache=sonuc_onbellegi.ResultCache() if sonuc_onbellegi.enabled else None,
+        column_profiles=column_profiles
+    )
+    
+    while True:
+        if deferred_commands:
+            item = deferred_commands.pop(0)
+        else:
+            try:
+                item = command_queue.get()
+            except (EOFError, KeyboardInterrupt):
+                break
+        if item is None:
+            break
+        
+        command, data = item
+        if handle_release(command, data):
+            continue
+        if command == 'prepare':
+            prepare(data)
+            continue
+        if command != 'analyze':
+            continue
+        
+        try:
+            analiz_sonucu = analiz.analyze(data['karlilik_path'], data['iskonto_path'])
+            
+            # Aşama ölçümleri sonuçtan önce gelir - iptal/hata durumunda da gönderilir
+            if analiz.last_report is not None:
+                event_queue.put(('performance_report', analiz.last_report))
+            
+            if analiz_sonucu is not None:
+                # Dashboard verisini de işçide hazırla - UI süreci yalnızca çizer
+                view_model = None
+                try:
+                    from dashboard_model import DashboardViewModel
+                    view_model = DashboardViewModel(analiz_sonucu, content_key=analiz.last_result_key)
+                except Exception as e:
+                    event_queue.put(('log', {'message': f"Dashboard verisi hazırlanamadı: {e}", 'type': 'warning'}))
+                
+                # Sonuç önbellekten geldiyse arayüz farklı bilgilendirir
+                from_cache = (analiz.last_report or {}).get('result_cache') == 'isabet'
+                result = {'df': analiz_sonucu, 'view_model': view_model, 'from_cache': from_cache}
+                
+                # Sayısal sütunlar paylaşımlı belleğe yazılır, yalnızca tanımları pickle edilir
+                try:
+                    descriptor, blocks = export_frame(analiz_sonucu)
+                    if blocks:
+                        transfer_id = next(transfer_ids)
+                        pending_transfers[transfer_id] = blocks
+                        result = {'shared_df': descriptor, 'transfer_id': transfer_id,
+                                  'view_model': view_model, 'from_cache': from_cache}
+                except Exception as e:
+                    event_queue.put(('log', {'message': f"Paylaşımlı bellek kullanılamadı, sonuç kopyalanarak gönderiliyor: {e}", 'type': 'warning'}))
+                
+                send_trace_events()
+                event_queue.put(('analysis_complete', result))
+            else:
+                send_trace_events()
+                event_queue.put(('analysis_cancelled', None))
+        
+        except Exception as e:
+            send_trace_events()
+            event_queue.put(('analysis_error', str(e)))
+
+
+class AnalizWorker:
+    """Ana süreç tarafında işçi sürecini yöneten sınıf
+    
+    Süreç ilk dosya seçiminde veya ilk analizde başlatılır ve açık tutulur.
+    İşçiden gelen olaylar bir aktarım thread'i ile event_callback'e iletilir.
+    cancel() analizi işbirliğiyle durdurur; terminate() süreci anında
+    sonlandırır ve bir sonraki analizde yenisi açılır.
+    """
+    
+    def __init__(self, event_callback):
+        """
+        Args:
+            event_callback: (message_type, data) alan thread-safe fonksiyon
+        """
+        self.event_callback = event_callback
+        self.process = None
+        self.command_queue = None
+        self.event_queue = None
+        self.relay_thread = None
+        self.cancel_event = None
+        self.prepare_generations = None
+        self.cancel_timer = None
+        self.busy = False
+        self.cancelling = False
+        self._lock = threading.Lock()
+    
+    def is_alive(self):
+        """İşçi süreci çalışıyor mu"""
+        return self.process is not None and self.process.is_alive()
+    
+    def ensure_started(self):
+        """İşçi süreci yoksa başlat"""
+        with self._lock:
+            if self.is_alive():
+                return
+            
+            self.command_queue = MP_CONTEXT.Queue()
+            self.event_queue = MP_CONTEXT.Queue()
+            self.cancel_event = MP_CONTEXT.Event()
+            self.prepare_generations = {kind: MP_CONTEXT.Value('i', 0) for kind in INPUT_KINDS}
+            self.process = MP_CONTEXT.Process(
+                target=worker_main,
+                args=(self.command_queue, self.event_queue, self.cancel_event, self.prepare_generations),
+                name="KarlilikAnalizWorker",
+                daemon=True
+            )
+            self.process.start()
+            
+            self.relay_thread = threading.Thread(
+                target=self._relay_events,
+                args=(self.process, self.event_queue),
+                daemon=True
+            )
+            self.relay_thread.start()
+    
+    def start_analysis(self, karlilik_path, iskonto_path):
+        """Analizi işçi sürecine gönder"""
+        # Önceki iptal hâlâ sürüyorsa beklemeden temiz bir süreçle başla
+        if self.cancelling:
+            self.terminate()
+        
+        self.ensure_started()
+        self.cancel_event.clear()
+        self.busy = True
+        self.command_queue.put(('analyze', {
+            'karlilik_path': karlilik_path,
+            'iskonto_path': iskonto_path
+        }))
+    
+    def prepare_input(self, kind, sources, background=False):
+        """Seçilen dosyanın işçide arka planda hazırlanmasını iste
+        
+        sources seçili tüm dosyalardır ({tür: yol}); diğer dosya da hazırsa
+        sütunlar ve fiyat sözlüğü de hazırlanır. Aynı türün süren veya sırada
+        bekleyen hazırlığı geçersiz olur; işçi onu bir sonraki parça
+        kontrolünde bırakır. Analiz komutu sıradaki hazırlığın arkasından
+        gelirse hazırlanan veriyi kullanır. background True ise (açılıştaki
+        ön ısıtma) düşük öncelikle çalışır.
+        """
+        self.ensure_started()
+        counter = self.prepare_generations[kind]
+        with counter.get_lock():
+            counter.value += 1
+            generation = counter.value
+        self.command_queue.put(('prepare', {
+            'kind': kind,
+            'path': sources[kind],
+            'sources': dict(sources),
+            'generation': generation,
+            'background': background
+        }))
+    
+    def supersede_preparations(self):
+        """Süren ve sırada bekleyen tüm hazırlıkları geçersiz kıl"""
+        if self.prepare_generations is None:
+            return
+        for counter in self.prepare_generations.values():
+            with counter.get_lock():
+                counter.value += 1
+    
+    def answer(self, request_id, value):
+        """İşçinin sorduğu diyaloğun cevabını gönder"""
+        if self.is_alive():
+            try:
+                self.command_queue.put(('answer', {'request_id': request_id, 'value': value}))
+            except (OSError, ValueError) as e:
+                print(f"İşçi cevap gönderme hatası: {e}")
+    
+    def cancel(self):
+        """Çalışan analizi işbirliğiyle iptal et
+        
+        İşçi bir sonraki parça kontrolünde durur ve belleğini bırakır; iptal
+        olayı ana sürece iletilmez, çünkü arayüz hemen boşa alınır. İşçi
+        CANCEL_GRACE_SECONDS içinde durmazsa süreç sonlandırılır.
+        
+        Returns:
+            bool: İptal edilecek bir analiz varsa True
+        """
+        if not self.busy or not self.is_alive():
+            return False
+        
+        self.cancelling = True
+        self.busy = False
+        self.cancel_event.set()
+        
+        # Analiz bir hazırlığın arkasında bekliyorsa o da durur
+        self.supersede_preparations()
+        
+        self.cancel_timer = threading.Timer(CANCEL_GRACE_SECONDS, self._force_cancel, args=(self.process,))
+        self.cancel_timer.daemon = True
+        self.cancel_timer.start()
+        return True
+    
+    def _force_cancel(self, process):
+        """İptale uymayan işçiyi sonlandır"""
+        if self.cancelling and process is self.process:
+            self.terminate()
+    
+    def _finish_cancel(self):
+        """İşçi iptali tamamladı"""
+        self.cancelling = False
+        if self.cancel_timer is not None:
+            self.cancel_timer.cancel()
+            self.cancel_timer = None
+    
+    def terminate(self):
+        """İşçi sürecini beklemeden sonlandır - sonraki analizde yenisi açılır"""
+        self._finish_cancel()
+        with self._lock:
+            process = self.process
+            self.process = None
+            self.busy = False
+        
+        if process is not None and process.is_alive():
+            try:
+                process.terminate()
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.kill()
+            except Exception as e:
+                print(f"İşçi sonlandırma hatası: {e}")
+    
+    def shutdown(self, timeout=1.0):
+        """Uygulama kapanırken işçiyi kapat - meşgulse beklemeden sonlandır"""
+        if self.busy or self.cancelling:
+            self.terminate()
+            return
+        
+        process = self.process
+        if process is None:
+            return
+        
+        try:
+            self.command_queue.put(None)
+            process.join(timeout=timeout)
+        except Exception:
+            pass
+        self.terminate()
+    
+    def _attach_shared_result(self, data):
+        """Paylaşımlı bellekteki sonucu eşle ve işçiye tutamaçlarını kapatmasını bildir
+        
+        Dönen sözlükteki 'shared' (SharedFrame), DataFrame kullanımdan
+        kalkınca release() ile serbest bırakılmalıdır.
+        """
+        try:
+            # numpy/pandas arayüz açılışında yüklenmez - bu noktada ön yükleme bitmiş olur
+            from paylasimli_bellek import import_frame
+            df, shared = import_frame(data['shared_df'])
+            return {'df': df, 'view_model': data.get('view_model'), 'shared': shared,
+                    'from_cache': data.get('from_cache', False)}
+        except Exception as e:
+            print(f"Paylaşımlı bellek eşleme hatası: {e}")
+            return None
+        finally:
+            try:
+                self.command_queue.put(('release', {'transfer_id': data.get('transfer_id')}))
+            except (OSError, ValueError):
+                pass
+    
+    def _drain_cancelled(self, message_type, data):
+        """İptal sürerken gelen olayları işle - sonuçlar kullanılmadan bırakılır"""
+        if message_type == 'worker_ask':
+            # Diyalog açılmaz, işçi cevapsız devam edip iptali görür
+            self.answer(data.get('request_id'), None)
+        elif message_type in ('log', 'trace_events'):
+            self.event_callback(message_type, data)
+        elif message_type in ('analysis_complete', 'analysis_error', 'analysis_cancelled'):
+            if message_type == 'analysis_complete' and data.get('shared') is not None:
+                data['shared'].release()
+            self._finish_cancel()
+            self.event_callback('log', {'message': "✓ İptal tamamlandı, işçi belleği serbest bırakıldı", 'type': 'info'})
+    
+    def _relay_events(self, process, event_queue):
+        """İşçi olaylarını ana sürece aktar - süreç bitince thread de biter"""
+        while True:
+            try:
+                message_type, data = event_queue.get(timeout=EVENT_POLL_INTERVAL)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                
+                # Süreç iptal dışında bir nedenle öldüyse bekleyen analizi hata say
+                if process is self.process and self.busy:
+                    self.busy = False
+                    self.event_callback('analysis_error', f"Analiz süreci beklenmedik şekilde sonlandı (kod: {process.exitcode})")
+                break
+            except (EOFError, OSError, ValueError):
+                break
+            
+            # İptal edilmiş eski sürecin olaylarını yoksay
+            if process is not self.process:
+                continue
+            
+            if message_type == 'analysis_complete' and 'shared_df' in data:
+                data = self._attach_shared_result(data)
+                if data is None:
+                    message_type, data = 'analysis_error', "Analiz sonucu paylaşımlı bellekten okunamadı"
+            
+            # İptal edilen analizin kalan olayları - arayüz zaten boşta
+            if self.cancelling:
+                self._drain_cancelled(message_type, data)
+                continue
+            
+            if message_type in ('analysis_complete', 'analysis_error', 'analysis_cancelled'):
+                self.busy = False
+            
+            self.event_callback(message_type, data)
\ No newline at end of file
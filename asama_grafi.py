@@ -0,0 +1,302 @@
+# asama_grafi.py - Analiz aşamalarının bağımlılık grafiği, ara sonuç belleği ve disk kayıtları
+#
+# Her aşamanın anahtarı, kaynak dosyasının parmak izinden (yol, boyut,
+# değişiklik zamanı) veya bağımlı olduğu aşamaların anahtarlarından ve kod
+# sürümünden türetilir. Küçük ama sonucu belirleyen aşamaların (ör. sütun
+# eşleşmesi) anahtar yerine çıktısının özeti tüketicilerin anahtarına girer;
+# farklı cevaplanan eşleşme eski ara sonuçlarla eşleşmez. Anahtarı değişmeyen
+# aşama yeniden çalışmaz: yalnızca
+# iskonto dosyası değişirse karlılık okuması tekrar kullanılır. Disk kayıtları
+# açılırsa (KARLILIK_CHECKPOINTS=1, varsayılan kapalı) tamamlanan aşamalar
+# pickle olarak yazılır; çöken veya sonlandırılan analiz tekrar başlatılınca
+# kaldığı aşamadan devam eder. Büyük ara çerçevelerin her analizde diske
+# yazılması okumadan pahalı olabildiği için kayıtlar isteğe bağlıdır.
+
+import hashlib
+import json
+import os
+import pickle
+
+from girdi_onbellegi import file_fingerprint
+
+
+checkpoints_enabled = os.environ.get('KARLILIK_CHECKPOINTS', '0') not in ('', '0')
+
+
+class StageDeferred(Exception):
+    """Aşama kullanıcıya soru sormadan tamamlanamıyor (soru sorulmayan çalıştırmada)"""
+
+
+class Stage:
+    """Grafikteki tek aşama
+    
+    Çıktı, kaynak dosyadan (source) veya bağımlılıkların (deps) çıktılarından
+    üretilir ve bunları değiştirmemelidir - aynı nesne bellekte tutulup sonraki
+    çalıştırmalarda da kullanılır.
+    """
+    
+    def __init__(self, name, label, deps=(), source=None, memory=True, checkpoint=True, key_output=False):
+        """
+        Args:
+            name: Aşama adı (çalıştırıcıdaki stage_<name> metodu)
+            label: Log metinlerindeki adı
+            deps: Çıktıları girdi olarak verilen aşamalar (bu sırayla çalışır)
+            source: Girdi dosyası türü ('karlilik'/'iskonto') - verilirse girdiye 'path' eklenir
+            memory: Son çıktı bellekte tutulsun mu (büyük ara çerçeveler için False)
+            checkpoint: Disk kayıtları açıksa çıktı diske yazılsın mı (yan etkili aşamalar için False)
+            key_output: Çıktının özeti tüketicilerin anahtarına girsin mi - çıktı
+                        girdilerden tek başına belirlenmiyorsa (kullanıcı cevabı,
+                        kayıtlı profil) True; çıktı JSON'a çevrilebilir olmalıdır
+        """
+        self.name = name
+        self.label = label
+        self.deps = tuple(deps)
+        self.source = source
+        self.memory = memory
+        self.checkpoint = checkpoint
+        self.key_output = key_output
+
+
+def output_digest(value):
+    """key_output aşamasının çıktısının özeti"""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+
+class StageMemo:
+    """Aşama çıktılarının belleği
+    
+    Bellekte memory=True aşamaların yalnızca son anahtarlı çıktısı tutulur.
+    checkpoint_dir verilirse checkpoint=True aşamalar da diske yazılır; aşama
+    başına tek kayıt kalır. Okunamayan kayıt silinir ve aşama yeniden çalışır.
+    """
+    
+    def __init__(self, checkpoint_dir=None):
+        self.checkpoint_dir = checkpoint_dir
+        self._memory = {}
+    
+    def _checkpoint_path(self, stage_name, key):
+        return os.path.join(self.checkpoint_dir, f"{stage_name}_{key}.pickle")
+    
+    def get(self, stage, key):
+        """(bulundu mu, çıktı, 'bellek'/'disk')"""
+        if stage.memory:
+            entry = self._memory.get(stage.name)
+            if entry is not None and entry[0] == key:
+                return True, entry[1], 'bellek'
+        
+        if stage.checkpoint and self.checkpoint_dir:
+            path = self._checkpoint_path(stage.name, key)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'rb') as f:
+                        value = pickle.load(f)
+                except Exception as e:
+                    print(f"Ara kayıt okunamadı, aşama yeniden çalışacak: {e}")
+                    self._remove(path)
+                    return False, None, None
+                if stage.memory:
+                    self._memory[stage.name] = (key, value)
+                return True, value, 'disk'
+        return False, None, None
+    
+    def put(self, stage, key, value):
+        """Aşama çıktısını sakla - aynı aşamanın eski kayıtları bırakılır"""
+        if stage.memory:
+            self._memory[stage.name] = (key, value)
+        
+        if not (stage.checkpoint and self.checkpoint_dir):
+            return
+        path = self._checkpoint_path(stage.name, key)
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Ara kayıt yazılamadı ({stage.name}): {e}")
+            self._remove(temp_path)
+            return
+        
+        prefix = f"{stage.name}_"
+        for name in os.listdir(self.checkpoint_dir):
+            if name.startswith(prefix) and name.endswith('.pickle') and name != os.path.basename(path):
+                self._remove(os.path.join(self.checkpoint_dir, name))
+    
+    def discard(self, stage_name=None):
+        """Bir aşamanın (verilmezse tümünün) bellekteki çıktısını bırak"""
+        if stage_name is None:
+            self._memory.clear()
+        else:
+            self._memory.pop(stage_name, None)
+    
+    def _remove(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class StageGraph:
+    """Bildirilmiş aşamaları bağımlılık sırasıyla çalıştıran grafik
+    
+    run() hedef aşamayı yalnızca gereken bağımlılıklarıyla çalıştırır; anahtarı
+    bellekte veya diskte bulunan aşamanın bağımlılıklarına hiç inilmez. memo
+    verilmezse her çalıştırma baştan hesaplar (aynı çalıştırma içinde her aşama
+    bir kez çalışır).
+    """
+    
+    def __init__(self, stages, memo=None, version=''):
+        self.stages = {stage.name: stage for stage in stages}
+        self.memo = memo
+        self.version = version
+    
+    def keys(self, sources, outputs=None):
+        """Tüm aşamaların anahtarları
+        
+        Kaynak dosyası okunamayan aşama ve alt aşamaları None'dır. key_output
+        aşamalarının tüketicileri, o aşamanın çıktısı outputs'ta yoksa None'dır.
+        """
+        fingerprints = {kind: file_fingerprint(path) for kind, path in sources.items() if path}
+        outputs = outputs or {}
+        keys = {}
+        
+        def key(name):
+            if name in keys:
+                return keys[name]
+            stage = self.stages[name]
+            parts = [stage.name, self.version]
+            if stage.source is not None:
+                fingerprint = fingerprints.get(stage.source)
+                parts.append(None if fingerprint is None else list(fingerprint))
+                if fingerprint is None:
+                    keys[name] = None
+                    return None
+            for dep in stage.deps:
+                if self.stages[dep].key_output:
+                    dep_key = output_digest(outputs[dep]) if outputs.get(dep) is not None else None
+                else:
+                    dep_key = key(dep)
+                if dep_key is None:
+                    keys[name] = None
+                    return None
+                parts.append(dep_key)
+            payload = json.dumps(parts, ensure_ascii=False)
+            keys[name] = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+            return keys[name]
+        
+        for name in self.stages:
+            key(name)
+        return keys
+    
+    def peek(self, name, sources):
+        """Aşamanın hazır çıktısı (bellek veya disk) - hiçbir aşama çalıştırılmaz"""
+        if self.memo is None:
+            return None
+        outputs = {}
+        for other in self.key_output_ancestors(name):
+            outputs[other] = self.peek(other, sources)
+            if outputs[other] is None:
+                return None
+        key = self.keys(sources, outputs).get(name)
+        if key is None:
+            return None
+        found, value, _ = self.memo.get(self.stages[name], key)
+        return value if found else None
+    
+    def required(self, target):
+        """Hedef ve tüm üst aşamaları"""
+        needed = set()
+        stack = [target]
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.stages[name].deps)
+        return needed
+    
+    def key_output_ancestors(self, name):
+        """Anahtarı çıktılarına bağlı olan üst aşamalar (bağımlılık sırasıyla)"""
+        ancestors = self.required(name) - {name}
+        return [other for other in self.stages if other in ancestors and self.stages[other].key_output]
+    
+    def run(self, target, sources, execute, on_reuse=None, keep=()):
+        """Hedef aşamayı gerekli bağımlılıklarıyla çalıştır
+        
+        Args:
+            target: Hedef aşama adı
+            sources: {dosya türü: yol}
+            execute: (stage, inputs) -> çıktı; None dönerse çalıştırma orada durur
+            on_reuse: (stage, 'bellek'/'disk') - aşama yeniden kullanıldığında çağrılır
+            keep: Sonuçta tutulacak ara aşamalar; diğerlerinin çıktısı tüm
+                  tüketicileri bitince bırakılır (bellek tepesini düşürür)
+        
+        Anahtarı key_output aşamalarına bağlı aşama aranmadan önce o aşamalar
+        elde edilir (küçük çıktılar; genellikle bellekte veya diskte hazırdır).
+        
+        Returns:
+            dict: {aşama: çıktı} - hedef ve keep'teki aşamalar (elde edildiyse)
+        """
+        keys = self.keys(sources)
+        needed = self.required(target)
+        consumers = {
+            name: [other for other in needed if name in self.stages[other].deps]
+            for name in needed
+        }
+        keep = set(keep) | {target}
+        results = {}
+        resolved = set()
+        
+        def release(name):
+            if name not in keep and all(consumer in resolved for consumer in consumers[name]):
+                results.pop(name, None)
+        
+        def obtain(name):
+            if name in results:
+                return results[name]
+            stage = self.stages[name]
+            key = keys.get(name)
+            
+            pending = [other for other in self.key_output_ancestors(name) if other not in results]
+            if key is None and pending:
+                for other in pending:
+                    if obtain(other) is None:
+                        return None
+                for other, other_key in self.keys(sources, results).items():
+                    if keys.get(other) is None:
+                        keys[other] = other_key
+                key = keys.get(name)
+            
+            if key is not None and self.memo is not None:
+                found, value, where = self.memo.get(stage, key)
+                if found:
+                    if on_reuse is not None:
+                        on_reuse(stage, where)
+                    results[name] = value
+                    resolved.add(name)
+                    return value
+            
+            inputs = {}
+            if stage.source is not None:
+                inputs['path'] = sources[stage.source]
+            for dep in stage.deps:
+                value = obtain(dep)
+                if value is None:
+                    return None
+                inputs[dep] = value
+            
+            value = execute(stage, inputs)
+            del inputs
+            if value is None:
+                return None
+            
+            if key is not None and self.memo is not None:
+                self.memo.put(stage, key, value)
+            results[name] = value
+            resolved.add(name)
+            for dep in stage.deps:
+                release(dep)
+            return value
+        
+        obtain(target)
+        return {name: value for name, value in results.items() if name in keep}
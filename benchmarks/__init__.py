@@ -0,0 +1 @@
+# benchmarks - Performans ölçüm betikleri (python -m benchmarks.<modül>)
\ No newline at end of file
@@ -0,0 +1,74 @@
+# common.py - Ölçüm betiklerinin ortak yardımcıları
+
+import json
+import os
+import platform
+import statistics
+import sys
+from datetime import datetime
+
+
+def environment_info():
+    """Sonuç dosyasına yazılan ortam bilgisi - karşılaştırmalar aynı ortamda anlamlıdır"""
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'created_at': datetime.now().isoformat(timespec='seconds')
+    }
+    for module in ('pandas', 'numpy', 'openpyxl'):
+        try:
+            info[module] = __import__(module).__version__
+        except ImportError:
+            info[module] = None
+    return info
+
+
+def peak_rss_mb():
+    """Sürecin şimdiye kadarki tepe RSS değeri (MB) - ölçülemiyorsa None
+    
+    Linux'ta /proc'taki VmHWM kullanılır: ru_maxrss fork/exec boyunca ebeveynin
+    tepe değerini taşır, spawn ile açılan ölçüm süreçlerinde yanıltıcı olur.
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError):
+        pass
+    
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    if sys.platform == 'darwin':
+        return round(peak / 1024 ** 2, 1)
+    return round(peak / 1024, 1)
+
+
+def summarize_timings(timings):
+    """Saniye listesinden medyan/min/max (saniye)"""
+    return {
+        'median': round(statistics.median(timings), 4),
+        'min': round(min(timings), 4),
+        'max': round(max(timings), 4)
+    }
+
+
+def rate(rows, seconds):
+    """Satır/sn - süre ölçülemeyecek kadar kısaysa None"""
+    if not rows or seconds <= 0:
+        return None
+    return round(rows / seconds, 1)
+
+
+def write_json(results, path):
+    """Sonuçları JSON olarak yaz"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
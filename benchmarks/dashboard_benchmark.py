@@ -0,0 +1,237 @@
+# dashboard_benchmark.py - Dashboard kurulum ve etkileşim maliyeti (arayüz tarafı)
+#
+# Kullanım: python -m benchmarks.dashboard_benchmark --sizes 1000 10000 100000 --repeat 3 --json sonuc.json
+#
+# Ekran gerektirir (Tk). Ekran yoksa --xvfb ile sanal X ekranı (Xvfb) açılır;
+# o da yoksa ölçüm atlanır. Kök pencere varsayılan olarak gizlidir - gizli
+# pencerede eşlenmemiş widget'lar çizilmez, tam çizim maliyeti için --mapped.
+#
+# Ölçülenler (her biri sonrasındaki update() ile, yani çizim dahil):
+#   görünüm modeli   - DashboardViewModel (normalde arka planda hazırlanır)
+#   setup_dashboard  - ve içindeki her bölüm ayrı ayrı
+#   ilk çizim        - kurulum sonrası ilk update()
+#   arama / hızlı filtre / temizle
+# Her adımdan sonra dashboard altındaki widget ve canvas öğesi sayıları kaydedilir.
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tkinter as tk
+from tkinter import ttk
+
+from benchmarks.common import environment_info, write_json
+from benchmarks.handoff_benchmark import make_result_frame
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+SEARCH_TERM = "ÜRÜN 00001"
+QUICK_FILTER = "profitable"
+
+# setup_dashboard içindeki bölümler - analiz sekmeleri kendi alt sekmelerini içerir
+SECTIONS = [
+    'create_enhanced_scrollable_frame',
+    'create_modern_header',
+    'create_enhanced_kpi_section',
+    'create_analysis_tabs',
+    'create_performance_tab',
+    'create_profit_tab',
+    'create_distribution_tab',
+    'create_enhanced_search_section'
+]
+
+
+def start_xvfb(display=':97'):
+    """Sanal X ekranı başlat - süreç nesnesi döndürür, Xvfb yoksa None"""
+    binary = shutil.which('Xvfb')
+    if binary is None:
+        return None
+    process = subprocess.Popen(
+        [binary, display, '-screen', '0', '1600x1000x24', '-nolisten', 'tcp'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    os.environ['DISPLAY'] = display
+    # Sunucu soketini açana kadar bekle
+    for _ in range(50):
+        if os.path.exists(f"/tmp/.X11-unix/X{display.lstrip(':')}"):
+            break
+        time.sleep(0.1)
+    return process
+
+
+def timed_dashboard_class(timings):
+    """Bölüm metotlarının sürelerini timings sözlüğüne yazan AnalyzDashboard alt sınıfı"""
+    from analiz_dashboard import AnalyzDashboard
+    
+    def wrap(name):
+        method = getattr(AnalyzDashboard, name)
+        
+        def timed(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                timings[name] = time.perf_counter() - start
+        return timed
+    
+    attributes = {name: wrap(name) for name in ['setup_dashboard', *SECTIONS]}
+    return type('TimedDashboard', (AnalyzDashboard,), attributes)
+
+
+def count_widgets(widget):
+    """Alt ağaçtaki widget'lar (sınıfa göre) ve canvas öğeleri"""
+    classes = Counter()
+    canvas_items = 0
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        widget_class = current.winfo_class()
+        classes[widget_class] += 1
+        if widget_class == 'Canvas':
+            canvas_items += len(current.find_all())
+        stack.extend(current.winfo_children())
+    return {
+        'widgets': sum(classes.values()),
+        'canvas_items': canvas_items,
+        'classes': dict(classes.most_common())
+    }
+
+
+def measure_once(root, notebook, df):
+    """Tek dashboard ömrü: kur, çiz, ara, filtrele, temizle, yok et"""
+    from dashboard_model import DashboardViewModel
+    
+    timings = {}
+    widgets = {}
+    dashboard_class = timed_dashboard_class(timings)
+    
+    def step(name, action):
+        start = time.perf_counter()
+        result = action()
+        root.update()
+        timings[name] = time.perf_counter() - start
+        return result
+    
+    start = time.perf_counter()
+    view_model = DashboardViewModel(df)
+    timings['görünüm modeli'] = time.perf_counter() - start
+    
+    # setup_dashboard kurucuda çağrılır - süresi alt sınıfta ölçülür
+    dashboard = dashboard_class(notebook, df, view_model)
+    notebook.add(dashboard.get_frame(), text="Dashboard")
+    notebook.select(dashboard.get_frame())
+    step('ilk çizim', lambda: None)
+    widgets['kurulum'] = count_widgets(dashboard.get_frame())
+    
+    dashboard.search_var.set(SEARCH_TERM)
+    step('arama', dashboard.search_product)
+    widgets['arama'] = count_widgets(dashboard.get_frame())
+    
+    step('hızlı filtre', lambda: dashboard.apply_quick_filter(QUICK_FILTER))
+    widgets['hızlı filtre'] = count_widgets(dashboard.get_frame())
+    
+    step('temizle', dashboard.clear_search)
+    widgets['temizle'] = count_widgets(dashboard.get_frame())
+    
+    notebook.forget(dashboard.get_frame())
+    step('yok etme', dashboard.destroy)
+    return timings, widgets
+
+
+def run_benchmark(sizes, repeat=3, seed=42, mapped=False):
+    """Tüm boyutları ölç - ekran yoksa None döndürür"""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Ekran bulunamadı, ölçüm atlandı: {e}")
+        return None
+    
+    if mapped:
+        root.geometry("1400x900+0+0")
+    else:
+        root.withdraw()
+    notebook = ttk.Notebook(root)
+    notebook.pack(fill='both', expand=True)
+    root.update()
+    
+    results = {
+        'benchmark': 'dashboard',
+        'environment': environment_info(),
+        'seed': seed,
+        'repeat': repeat,
+        'mapped': mapped,
+        'sizes': {}
+    }
+    
+    try:
+        for rows in sizes:
+            df = make_result_frame(rows, seed)
+            runs = [measure_once(root, notebook, df) for _ in range(repeat)]
+            
+            names = list(runs[0][0])
+            summary = {
+                'rows': rows,
+                'seconds': {
+                    name: round(statistics.median(run[0][name] for run in runs), 4)
+                    for name in names
+                },
+                # Widget sayıları tekrarlar arasında aynıdır
+                'widgets': runs[0][1]
+            }
+            results['sizes'][str(rows)] = summary
+            print_size(summary)
+    finally:
+        root.destroy()
+    
+    return results
+
+
+def print_size(summary):
+    seconds = summary['seconds']
+    print(f"{summary['rows']:>9,} satır: setup_dashboard {seconds['setup_dashboard'] * 1000:.0f} ms, "
+          f"ilk çizim {seconds['ilk çizim'] * 1000:.0f} ms")
+    for name, value in seconds.items():
+        if name not in ('setup_dashboard', 'ilk çizim'):
+            print(f"    {name:<34} {value * 1000:9.1f} ms")
+    for step, counts in summary['widgets'].items():
+        print(f"    widget ({step}): {counts['widgets']}, canvas öğesi {counts['canvas_items']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dashboard kurulum/etkileşim ölçümü")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--mapped', action='store_true', help="Pencereyi göster (tam çizim maliyeti)")
+    parser.add_argument('--xvfb', action='store_true', help="Ekran yoksa Xvfb sanal ekranı başlat")
+    parser.add_argument('--json', help="Sonuçları bu dosyaya JSON olarak yaz")
+    args = parser.parse_args(argv)
+    
+    xvfb = None
+    if args.xvfb and not os.environ.get('DISPLAY'):
+        xvfb = start_xvfb()
+        if xvfb is None:
+            print("Xvfb bulunamadı")
+    
+    try:
+        results = run_benchmark(args.sizes, args.repeat, args.seed, args.mapped)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    
+    if results is not None and args.json:
+        write_json(results, args.json)
+        print(f"Sonuçlar yazıldı: {args.json}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# handoff_benchmark.py - İşçi süreçten GUI'ye sonuç aktarım gecikmesi
+#
+# Kullanım: python -m benchmarks.handoff_benchmark --rows 1000000 --repeat 5
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analiz_worker import MP_CONTEXT
+from paylasimli_bellek import export_frame, import_frame, close_blocks
+
+
+def make_result_frame(rows, seed=42):
+    """Analiz sonucuna benzeyen sentetik DataFrame"""
+    rng = np.random.default_rng(seed)
+    miktar = rng.integers(1, 5000, rows).astype(float)
+    satis_fiyat = rng.uniform(10, 500, rows).round(2)
+    maliyet = (satis_fiyat * rng.uniform(0.6, 1.1, rows)).round(2)
+    df = pd.DataFrame({
+        'Stok İsmi': [f"ÜRÜN {i:07d}" for i in range(rows)],
+        'Satış Miktar': miktar,
+        'Ort.Satış Fiyat': satis_fiyat,
+        'Satış Tutar': (miktar * satis_fiyat).round(2),
+        'Birim Maliyet': maliyet,
+        'Birim Kar': satis_fiyat - maliyet,
+        'Net Kar': (satis_fiyat - maliyet) * miktar
+    })
+    # Sonuç Net Kar'a göre sıralı gelir - index de aktarılmalı
+    return df.sort_values('Net Kar', ascending=False)
+
+
+def sender(rows, repeat, mode, data_queue, ack_queue, result_queue):
+    """Alt süreç: çerçeveyi gönder, alıcı kullanıma hazır olduğunu bildirince süreyi ölç"""
+    df = make_result_frame(rows)
+    timings = []
+    
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if mode == 'pickle':
+            data_queue.put(df)
+            ack_queue.get()
+        else:
+            descriptor, blocks = export_frame(df)
+            data_queue.put(descriptor)
+            ack_queue.get()
+            close_blocks(blocks)
+        timings.append(time.perf_counter() - start)
+    
+    result_queue.put(timings)
+
+
+def run_mode(rows, repeat, mode):
+    """Bir aktarım yöntemini ölç - saniye cinsinden süre listesi döndürür"""
+    data_queue = MP_CONTEXT.Queue()
+    ack_queue = MP_CONTEXT.Queue()
+    result_queue = MP_CONTEXT.Queue()
+    process = MP_CONTEXT.Process(
+        target=sender, args=(rows, repeat, mode, data_queue, ack_queue, result_queue)
+    )
+    process.start()
+    
+    for _ in range(repeat):
+        payload = data_queue.get()
+        if mode == 'pickle':
+            df = payload
+            ack_queue.put(True)
+        else:
+            df, shared = import_frame(payload)
+            ack_queue.put(True)
+        
+        # Alıcı taraf veriye gerçekten dokunabiliyor olmalı
+        assert len(df) == rows
+        del df
+        if mode == 'shared':
+            shared.release()
+    
+    timings = result_queue.get()
+    process.join()
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sonuç aktarımı: pickle vs paylaşımlı bellek")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help="Sonuçları bu dosyaya JSON olarak yaz")
+    args = parser.parse_args(argv)
+    
+    results = {'rows': args.rows, 'repeat': args.repeat}
+    for mode in ('pickle', 'shared'):
+        timings = run_mode(args.rows, args.repeat, mode)
+        results[mode] = {
+            'median_ms': round(statistics.median(timings) * 1000, 2),
+            'min_ms': round(min(timings) * 1000, 2),
+            'max_ms': round(max(timings) * 1000, 2)
+        }
+        print(f"{mode:>7}: medyan {results[mode]['median_ms']:.1f} ms "
+              f"(min {results[mode]['min_ms']:.1f}, max {results[mode]['max_ms']:.1f})")
+    
+    speedup = results['pickle']['median_ms'] / max(results['shared']['median_ms'], 1e-9)
+    results['speedup'] = round(speedup, 2)
+    print(f"Hızlanma: {speedup:.1f}x ({args.rows:,} satır)")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    
+    return results
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
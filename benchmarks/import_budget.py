@@ -0,0 +1,141 @@
+# import_budget.py - Arayüz açılışının içe aktarma süresi bütçesi
+#
+# Kullanım: python -m benchmarks.import_budget --budget-ms 200 --json sonuc.json
+#
+# 'import gui' ayrı bir yorumlayıcıda python -X importtime ile çalıştırılır ve
+# çıktısı ayrıştırılır. Pencereden önce yüklenmemesi gereken ağır modüllerden
+# biri (pandas, numpy, openpyxl, analiz modülleri) yüklenirse veya toplam süre
+# bütçeyi aşarsa çıkış kodu 1 olur. Ön yüklemeye (on_yukleme.HEAVY_MODULES)
+# bırakılan süre de bilgi olarak raporlanır.
+
+import argparse
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import environment_info, write_json
+
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 'import gui' için varsayılan bütçe (ms) - tkinter dahil
+DEFAULT_BUDGET_MS = 200
+
+# Pencere açılmadan önce yüklenmemesi gereken modüller
+FORBIDDEN_MODULES = ('pandas', 'numpy', 'openpyxl', 'karlilik', 'veri_analizi', 'paylasimli_bellek')
+
+TOP_N = 10
+
+
+def parse_importtime(output):
+    """-X importtime çıktısı -> [(modül, kendi µs, toplam µs, derinlik)]"""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            own, cumulative, raw_name = line.split(':', 1)[1].split('|')
+            own = int(own)
+            cumulative = int(cumulative)
+        except ValueError:
+            continue
+        # İç içe içe aktarmalar iki boşlukla girintilenir
+        depth = (len(raw_name) - len(raw_name.lstrip(' ')) - 1) // 2
+        entries.append((raw_name.strip(), own, cumulative, depth))
+    return entries
+
+
+def measure_import(code):
+    """Kodu -X importtime ile yeni yorumlayıcıda çalıştır, ayrıştırılmış girdileri döndür"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=APP_DIR, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"İçe aktarma başarısız: {completed.stderr.strip().splitlines()[-1:]}")
+    return parse_importtime(completed.stderr)
+
+
+def summarize(entries, root):
+    """Kök modülün toplam süresi, yüklenen yasak modüller ve en pahalı doğrudan bağımlılıklar"""
+    modules = {name for name, _, _, _ in entries}
+    total_us = next((cumulative for name, _, cumulative, _ in entries if name == root), None)
+    root_depth = next((depth for name, _, _, depth in entries if name == root), 0)
+    children = sorted(
+        ((name, cumulative) for name, _, cumulative, depth in entries if depth == root_depth + 1),
+        key=lambda item: item[1], reverse=True
+    )
+    return {
+        'total_ms': None if total_us is None else round(total_us / 1000, 1),
+        'module_count': len(modules),
+        'forbidden': sorted(name for name in FORBIDDEN_MODULES if name in modules),
+        'slowest': [{'module': name, 'ms': round(us / 1000, 1)} for name, us in children[:TOP_N]]
+    }
+
+
+def run_benchmark(repeat=3):
+    """'import gui' ve ön yükleme maliyetini ölç - en hızlı tekrar esas alınır"""
+    gui_runs = [summarize(measure_import('import gui'), 'gui') for _ in range(repeat)]
+    gui = min(gui_runs, key=lambda run: run['total_ms'] or float('inf'))
+    
+    # Ön yükleme, gui zaten yüklüyken yapılır - yalnızca ek maliyet sayılır
+    preload_code = (
+        "import gui, importlib, time\n"
+        "from on_yukleme import HEAVY_MODULES\n"
+        "start = time.perf_counter()\n"
+        "[importlib.import_module(name) for name in HEAVY_MODULES]\n"
+        "print(round((time.perf_counter() - start) * 1000, 1))"
+    )
+    completed = subprocess.run(
+        [sys.executable, '-c', preload_code], cwd=APP_DIR, capture_output=True, text=True
+    )
+    preload_ms = float(completed.stdout.strip()) if completed.returncode == 0 else None
+    
+    return {
+        'benchmark': 'import_time',
+        'environment': environment_info(),
+        'repeat': repeat,
+        'gui_import': gui,
+        'preload_ms': preload_ms
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arayüz içe aktarma süresi bütçesi")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help="Sonuçları bu dosyaya JSON olarak yaz")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmark(args.repeat)
+    results['budget_ms'] = args.budget_ms
+    gui = results['gui_import']
+    
+    print(f"import gui: {gui['total_ms']} ms ({gui['module_count']} modül), bütçe {args.budget_ms:.0f} ms")
+    for item in gui['slowest']:
+        print(f"    {item['ms']:8.1f} ms  {item['module']}")
+    if results['preload_ms'] is not None:
+        print(f"Arka plan ön yüklemesi (pencere açıldıktan sonra): {results['preload_ms']} ms")
+    
+    if args.json:
+        write_json(results, args.json)
+        print(f"Sonuçlar yazıldı: {args.json}")
+    
+    failures = []
+    if gui['forbidden']:
+        failures.append(f"pencereden önce yüklenen ağır modüller: {', '.join(gui['forbidden'])}")
+    if gui['total_ms'] is None or gui['total_ms'] > args.budget_ms:
+        failures.append(f"import gui {gui['total_ms']} ms > bütçe {args.budget_ms:.0f} ms")
+    
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print("✓ İçe aktarma bütçesi içinde")
+    return results
+
+
+if __name__ == "__main__":
+    main()
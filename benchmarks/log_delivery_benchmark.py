@@ -0,0 +1,181 @@
+# log_delivery_benchmark.py - Log/ilerleme aktarımının UI thread'ine maliyeti
+#
+# Kullanım: python -m benchmarks.log_delivery_benchmark --lines 5000 --idle 3
+#
+# Ekran gerektirir (Tk). Üç ölçüm yapar:
+#   insert   - satır başına insert/tag_add/see ile toplu insert karşılaştırması
+#   idle     - boştaki uygulamanın saniyedeki uyanma sayısı
+#   delivery - arka plan thread'inden gelen log+ilerleme akışının UI maliyeti
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tkinter as tk
+
+
+def legacy_log_message(text, message, msg_type='info'):
+    """Eski log_message - her satır için ayrı Tk çağrıları"""
+    text.config(state='normal')
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    text.insert('end', f"\n[{timestamp}] ℹ️ {message}")
+    text.tag_add(msg_type, "end-2l", "end-1l")
+    text.see('end')
+    text.config(state='disabled')
+
+
+def batched_log_messages(text, entries):
+    """Yeni log_messages ile aynı yol - tek insert, tek see"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    insert_args = []
+    for message, msg_type in entries:
+        insert_args.append(f"\n[{timestamp}] ℹ️ {message}")
+        insert_args.append(msg_type)
+    text.config(state='normal')
+    text.insert('end', *insert_args)
+    text.see('end')
+    text.config(state='disabled')
+
+
+def bench_insert(root, lines, batch):
+    """Satır başına ve toplu yazmanın sürelerini ölç (ms)"""
+    results = {}
+    messages = [(f"Satır {i} işlendi", 'info') for i in range(lines)]
+    
+    for mode in ('legacy', 'batched'):
+        text = tk.Text(root)
+        text.pack()
+        text.tag_configure('info', foreground='#17a2b8')
+        root.update()
+        
+        start = time.perf_counter()
+        if mode == 'legacy':
+            for message, msg_type in messages:
+                legacy_log_message(text, message, msg_type)
+        else:
+            for i in range(0, lines, batch):
+                batched_log_messages(text, messages[i:i + batch])
+        root.update()
+        results[mode] = round((time.perf_counter() - start) * 1000, 2)
+        text.destroy()
+    
+    return results
+
+
+def make_app():
+    """Gizli pencereli uygulama örneği - Tk çağrıları sayılır"""
+    from gui import BupilicKarlilikGUI
+    
+    app = BupilicKarlilikGUI()
+    app.root.withdraw()
+    
+    counters = {'drains': 0, 'inserts': 0, 'progress': 0, 'drain_seconds': 0.0}
+    
+    original_check = app.check_queue
+    def counted_check():
+        counters['drains'] += 1
+        start = time.perf_counter()
+        original_check()
+        counters['drain_seconds'] += time.perf_counter() - start
+    # Olay bağlantısı check_queue'yu çağrı anında çözer, sayaçlı sürüm kullanılır
+    app.check_queue = counted_check
+    
+    original_insert = app.result_text.insert
+    def counted_insert(*args):
+        counters['inserts'] += 1
+        return original_insert(*args)
+    app.result_text.insert = counted_insert
+    
+    original_progress = app.update_progress
+    def counted_progress(value, status):
+        counters['progress'] += 1
+        original_progress(value, status)
+    app.update_progress = counted_progress
+    
+    return app, counters
+
+
+def bench_idle(seconds):
+    """Boştaki uygulama saniyede kaç kez uyanıyor"""
+    app, counters = make_app()
+    app.root.after(int(seconds * 1000), app.root.quit)
+    app.root.mainloop()
+    app.root.destroy()
+    return {'seconds': seconds, 'wakeups': counters['drains'],
+            'per_second': round(counters['drains'] / seconds, 2)}
+
+
+def bench_delivery(lines):
+    """Arka plan thread'inden log ve ilerleme akışı - UI thread maliyeti"""
+    app, counters = make_app()
+    app.is_processing = True
+    
+    def producer():
+        for i in range(lines):
+            app.thread_safe_worker_event('log', {'message': f"Satır {i} işlendi", 'type': 'info'})
+            app.thread_safe_worker_event('progress', {'value': i * 100 / lines, 'status': "İşleniyor"})
+        app.root.after(200, app.root.quit)
+    
+    start = time.perf_counter()
+    app.root.after(0, threading.Thread(target=producer, daemon=True).start)
+    app.root.mainloop()
+    elapsed = time.perf_counter() - start
+    app.root.destroy()
+    
+    return {
+        'lines': lines,
+        'wall_ms': round(elapsed * 1000, 2),
+        'ui_drain_ms': round(counters['drain_seconds'] * 1000, 2),
+        'drains': counters['drains'],
+        'text_inserts': counters['inserts'],
+        'progress_updates': counters['progress'],
+        # Eski yol: 100 ms'lik polling, satır başına bir insert, her ilerleme ayrı
+        'legacy_text_inserts': lines,
+        'legacy_progress_updates': lines
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Log/ilerleme aktarım maliyeti")
+    parser.add_argument('--lines', type=int, default=5000)
+    parser.add_argument('--batch', type=int, default=50, help="insert ölçümünde toplu yazma boyutu")
+    parser.add_argument('--idle', type=float, default=3.0, help="boşta bekleme süresi (saniye)")
+    parser.add_argument('--json', help="Sonuçları bu dosyaya JSON olarak yaz")
+    args = parser.parse_args(argv)
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Ekran bulunamadı, ölçüm atlandı: {e}")
+        return None
+    root.withdraw()
+    results = {'insert': bench_insert(root, args.lines, args.batch)}
+    root.destroy()
+    
+    print(f" insert: satır başına {results['insert']['legacy']:.1f} ms, "
+          f"toplu {results['insert']['batched']:.1f} ms ({args.lines:,} satır)")
+    
+    results['idle'] = bench_idle(args.idle)
+    print(f"   boşta: {results['idle']['per_second']:.1f} uyanma/sn (eski polling: 10/sn)")
+    
+    results['delivery'] = bench_delivery(args.lines)
+    delivery = results['delivery']
+    print(f"aktarım: UI {delivery['ui_drain_ms']:.1f} ms, {delivery['drains']} boşaltma, "
+          f"{delivery['text_inserts']} insert (eski {delivery['legacy_text_inserts']}), "
+          f"{delivery['progress_updates']} ilerleme (eski {delivery['legacy_progress_updates']})")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# pipeline_benchmark.py - KarlilikAnalizi.analyze uçtan uca ölçümü
+#
+# Kullanım: python -m benchmarks.pipeline_benchmark --sizes 1000 10000 100000 --repeat 3 --json sonuc.json
+#
+# Sentetik raporlar (benchmarks.synthetic_reports) bir kez üretilip --data-dir
+# altında saklanır. Her çalıştırma ayrı süreçte yapılır: diyalog açılmaz
+# (kayıt yolu ve sütun soruları callback ile yanıtlanır), tepe RSS önceki
+# çalıştırmalardan etkilenmez. Aşama süreleri analizin kendi performans
+# raporundan (last_report) alınır.
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analiz_worker import MP_CONTEXT
+from benchmarks.common import environment_info, peak_rss_mb, rate, summarize_timings, write_json
+from benchmarks.synthetic_reports import DEFAULT_SEED, STANDARD_SIZES, ensure_reports
+
+
+DEFAULT_SIZES = STANDARD_SIZES[:3]
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'karlilik_benchmark')
+
+
+def run_analysis(karlilik_path, iskonto_path, output_path, trace_memory, result_queue):
+    """Alt süreç: analizi diyalogsuz çalıştır, raporu ve tepe RSS'i gönder"""
+    import karlilik
+    karlilik.TRACE_MEMORY = trace_memory
+    
+    logs = []
+    analiz = karlilik.KarlilikAnalizi(
+        log_callback=logs.append,
+        column_callback=lambda title, prompt: None,
+        save_path_callback=lambda: output_path
+    )
+    result = analiz.analyze(karlilik_path, iskonto_path)
+    
+    result_queue.put({
+        'report': analiz.last_report,
+        'result_rows': None if result is None else len(result),
+        'peak_rss_mb': peak_rss_mb(),
+        # Başarısız çalıştırmada sebebi görmek için son log satırları
+        'log_tail': logs[-5:]
+    })
+
+
+def run_once(karlilik_path, iskonto_path, work_dir, trace_memory):
+    """Tek ölçüm - ayrı süreçte"""
+    output_path = os.path.join(work_dir, 'sonuc.xlsx')
+    result_queue = MP_CONTEXT.Queue()
+    process = MP_CONTEXT.Process(
+        target=run_analysis,
+        args=(karlilik_path, iskonto_path, output_path, trace_memory, result_queue)
+    )
+    process.start()
+    run = result_queue.get()
+    process.join()
+    return run
+
+
+def summarize_size(rows, runs):
+    """Tekrarların medyanı: toplam süre, throughput, tepe bellek, aşama süreleri"""
+    totals = [run['report']['total_wall_seconds'] for run in runs]
+    total_median = statistics.median(totals)
+    
+    stages = {}
+    for stage in runs[0]['report']['stages']:
+        name = stage['name']
+        timings = [
+            next(item['wall_seconds'] for item in run['report']['stages'] if item['name'] == name)
+            for run in runs
+        ]
+        median = statistics.median(timings)
+        stage_rows = stage['rows_in'] if stage['rows_in'] is not None else stage['rows_out']
+        stages[name] = {
+            'seconds': round(median, 4),
+            'rows': stage_rows,
+            'rows_per_second': rate(stage_rows, median),
+            'peak_mb': stage['peak_mb']
+        }
+    
+    peaks_rss = [run['peak_rss_mb'] for run in runs if run['peak_rss_mb'] is not None]
+    peaks_traced = [run['report']['peak_mb'] for run in runs if run['report'].get('peak_mb') is not None]
+    return {
+        'rows': rows,
+        'result_rows': runs[0]['result_rows'],
+        'total_seconds': summarize_timings(totals),
+        'rows_per_second': rate(rows, total_median),
+        'peak_rss_mb': max(peaks_rss) if peaks_rss else None,
+        'peak_traced_mb': max(peaks_traced) if peaks_traced else None,
+        'stages': stages
+    }
+
+
+def print_size(summary):
+    total = summary['total_seconds']
+    line = (f"{summary['rows']:>9,} satır: {total['median']:.2f} sn "
+            f"(min {total['min']:.2f}, max {total['max']:.2f}), "
+            f"{summary['rows_per_second'] or 0:,.0f} satır/sn")
+    if summary['peak_rss_mb'] is not None:
+        line += f", tepe RSS {summary['peak_rss_mb']:.0f} MB"
+    if summary['peak_traced_mb'] is not None:
+        line += f", tepe tracemalloc {summary['peak_traced_mb']:.0f} MB"
+    print(line)
+    for name, stage in summary['stages'].items():
+        stage_rate = f"{stage['rows_per_second']:,.0f} satır/sn" if stage['rows_per_second'] else "-"
+        print(f"    {name:<20} {stage['seconds']:8.3f} sn  {stage_rate}")
+
+
+def run_benchmark(sizes, repeat=3, data_dir=DEFAULT_DATA_DIR, seed=DEFAULT_SEED, trace_memory=False):
+    """Tüm boyutları ölç - JSON'a yazılabilir sonuç sözlüğü döndürür"""
+    results = {
+        'benchmark': 'pipeline',
+        'environment': environment_info(),
+        'seed': seed,
+        'repeat': repeat,
+        'trace_memory': trace_memory,
+        'sizes': {}
+    }
+    
+    for rows in sizes:
+        karlilik_path, iskonto_path = ensure_reports(rows, data_dir, seed)
+        runs = []
+        with tempfile.TemporaryDirectory() as work_dir:
+            for _ in range(repeat):
+                run = run_once(karlilik_path, iskonto_path, work_dir, trace_memory)
+                if run['report']['outcome'] != 'tamamlandi':
+                    raise RuntimeError(f"{rows} satırlık analiz tamamlanamadı "
+                                       f"({run['report']['outcome']}): {run['log_tail']}")
+                runs.append(run)
+        
+        summary = summarize_size(rows, runs)
+        results['sizes'][str(rows)] = summary
+        print_size(summary)
+    
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uçtan uca analiz ölçümü (sentetik raporlarla)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"Ürün sayıları (standart: {' '.join(map(str, STANDARD_SIZES))})")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="Sentetik raporların saklandığı dizin")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Aşama içi tepe belleği tracemalloc ile ölç (süreleri belirgin uzatır)")
+    parser.add_argument('--json', help="Sonuçları bu dosyaya JSON olarak yaz")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmark(args.sizes, args.repeat, args.data_dir, args.seed, args.trace_memory)
+    
+    if args.json:
+        write_json(results, args.json)
+        print(f"Sonuçlar yazıldı: {args.json}")
+    
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+# regression_gate.py - Ölçüm sonuçlarını kayıtlı taban çizgisiyle karşılaştırır
+#
+# Kullanım:
+#   python -m benchmarks.regression_gate                       # ölç ve karşılaştır
+#   python -m benchmarks.regression_gate --suite pipeline      # tek takım
+#   python -m benchmarks.regression_gate --current sonuc.json  # hazır sonucu karşılaştır
+#   python -m benchmarks.regression_gate --update              # taban çizgisini yenile
+#   python -m benchmarks.regression_gate --tolerance time=0.4 memory=0.2
+#
+# Taban çizgileri benchmarks/baselines/<takım>.json dosyalarındadır: sabit seed
+# ile, sıradan bir Linux makinesinde yapılan birkaç ölçümün metrik medyanları.
+# Her metrik türüne göre (süre, throughput, bellek) tolerans uygulanır; gerileme
+# görülen takım yeniden ölçülür ve her metriğin en iyi değeri alınır. Tolerans
+# dışı kötüleşme kalırsa fark raporu yazılır ve çıkış kodu 1 olur.
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import write_json
+
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+SEED = 42
+
+# Gerileme görülen takımın en fazla kaç kez yeniden ölçüleceği
+CONFIRM_RUNS = 2
+
+# Taban çizgisi bu kadar ölçümün medyanından oluşur - tek bir şanslı ölçüm taban olmasın
+UPDATE_RUNS = 3
+
+# Metrik türleri: yön (düşük mü yüksek mi iyi), göreli tolerans ve gürültü tabanı.
+# Mutlak fark tabanın altındaysa göreli değişim ne olursa olsun gerileme sayılmaz -
+# milisaniyelik aşamalarda zamanlayıcı gürültüsü yüzdeleri anlamsızlaştırır.
+METRIC_KINDS = {
+    'time': {'lower_is_better': True, 'tolerance': 0.25, 'noise_floor': 0.01, 'unit': 'sn'},
+    'throughput': {'lower_is_better': False, 'tolerance': 0.20, 'noise_floor': 0.0, 'unit': 'satır/sn'},
+    'memory': {'lower_is_better': True, 'tolerance': 0.15, 'noise_floor': 10.0, 'unit': 'MB'}
+}
+
+
+def _run_pipeline():
+    from benchmarks.pipeline_benchmark import run_benchmark
+    data_dir = os.path.join(tempfile.gettempdir(), 'karlilik_benchmark')
+    return run_benchmark([1_000, 10_000], repeat=3, data_dir=data_dir, seed=SEED)
+
+
+def _run_veri_analizi():
+    from benchmarks.veri_analizi_benchmark import run_benchmark
+    return run_benchmark([10_000, 100_000], repeat=5, seed=SEED)
+
+
+def _run_dashboard():
+    from benchmarks.dashboard_benchmark import run_benchmark
+    return run_benchmark([1_000, 10_000], repeat=3, seed=SEED)
+
+
+# Takım adı -> sabit boyut ve seed ile ölçümü çalıştıran fonksiyon (ölçülemezse None)
+SUITES = {
+    'pipeline': _run_pipeline,
+    'veri_analizi': _run_veri_analizi,
+    'dashboard': _run_dashboard
+}
+
+
+def _pipeline_metrics(results):
+    metrics = {}
+    for size, summary in results['sizes'].items():
+        prefix = f"{size} satır"
+        metrics[f"{prefix} / toplam süre"] = (summary['total_seconds']['median'], 'time')
+        metrics[f"{prefix} / throughput"] = (summary['rows_per_second'], 'throughput')
+        metrics[f"{prefix} / tepe RSS"] = (summary['peak_rss_mb'], 'memory')
+        metrics[f"{prefix} / tepe tracemalloc"] = (summary.get('peak_traced_mb'), 'memory')
+        for name, stage in summary['stages'].items():
+            metrics[f"{prefix} / {name}"] = (stage['seconds'], 'time')
+    return metrics
+
+
+def _veri_analizi_metrics(results):
+    metrics = {}
+    for name, data in results['methods'].items():
+        for size, seconds in data['seconds'].items():
+            metrics[f"{name} / {size} satır"] = (seconds, 'time')
+    return metrics
+
+
+def _dashboard_metrics(results):
+    metrics = {}
+    for size, summary in results['sizes'].items():
+        for name, seconds in summary['seconds'].items():
+            metrics[f"{size} satır / {name}"] = (seconds, 'time')
+    return metrics
+
+
+# Sonuç dosyasındaki 'benchmark' alanına göre metrik çıkarıcı
+EXTRACTORS = {
+    'pipeline': _pipeline_metrics,
+    'veri_analizi': _veri_analizi_metrics,
+    'dashboard': _dashboard_metrics
+}
+
+
+def extract_metrics(results):
+    """Sonuç sözlüğünü {metrik: (değer, tür)} haline getir - ölçülmeyen değerler atlanır"""
+    extractor = EXTRACTORS.get(results.get('benchmark'))
+    if extractor is None:
+        raise ValueError(f"Bilinmeyen ölçüm türü: {results.get('benchmark')}")
+    return {name: value for name, value in extractor(results).items() if value[0] is not None}
+
+
+def compare_metric(baseline, current, kind, tolerances):
+    """Tek metriği karşılaştır
+    
+    Returns:
+        (durum, göreli değişim): durum 'gerileme', 'iyileşme' veya 'ok';
+        değişim iyi yönde negatif, kötü yönde pozitif
+    """
+    settings = METRIC_KINDS[kind]
+    tolerance = tolerances.get(kind, settings['tolerance'])
+    if baseline == 0:
+        return 'ok', 0.0
+    
+    change = (current - baseline) / abs(baseline)
+    if not settings['lower_is_better']:
+        change = -change
+    
+    if abs(current - baseline) <= settings['noise_floor']:
+        return 'ok', change
+    if change > tolerance:
+        return 'gerileme', change
+    if change < -tolerance:
+        return 'iyileşme', change
+    return 'ok', change
+
+
+def median_metrics(runs):
+    """Birden çok ölçümün her metrik için medyanı - taban çizgisi için"""
+    values = {}
+    for results in runs:
+        for name, (value, kind) in extract_metrics(results).items():
+            values.setdefault(name, (kind, []))[1].append(value)
+    return {name: (statistics.median(items), kind) for name, (kind, items) in values.items()}
+
+
+def make_baseline(suite, runs):
+    """Taban çizgisi dosyasının içeriği - metrikler düz liste halinde, git farkında okunur"""
+    return {
+        'benchmark': suite,
+        'environment': runs[0].get('environment', {}),
+        'seed': runs[0].get('seed'),
+        'runs': len(runs),
+        'metrics': {
+            name: {'value': round(value, 4), 'kind': kind}
+            for name, (value, kind) in sorted(median_metrics(runs).items())
+        }
+    }
+
+
+def best_metrics(runs):
+    """Birden çok ölçümün her metrik için en iyi değeri - gürültü yalnızca kötü yönde etkiler"""
+    best = {}
+    for results in runs:
+        for name, (value, kind) in extract_metrics(results).items():
+            if name not in best:
+                best[name] = (value, kind)
+                continue
+            choose = min if METRIC_KINDS[kind]['lower_is_better'] else max
+            best[name] = (choose(best[name][0], value), kind)
+    return best
+
+
+def compare(baseline_results, current_runs, tolerances=None):
+    """Taban çizgisi ile güncel ölçüm(ler)i karşılaştır - satır listesi döndürür"""
+    tolerances = tolerances or {}
+    baseline = {name: (item['value'], item['kind']) for name, item in baseline_results['metrics'].items()}
+    current = best_metrics(current_runs)
+    
+    rows = []
+    for name, (base_value, kind) in baseline.items():
+        if name not in current:
+            rows.append({'metric': name, 'kind': kind, 'baseline': base_value,
+                         'current': None, 'change': None, 'status': 'eksik'})
+            continue
+        value = current[name][0]
+        status, change = compare_metric(base_value, value, kind, tolerances)
+        rows.append({'metric': name, 'kind': kind, 'baseline': base_value,
+                     'current': value, 'change': change, 'status': status})
+    
+    for name, (value, kind) in current.items():
+        if name not in baseline:
+            rows.append({'metric': name, 'kind': kind, 'baseline': None,
+                         'current': value, 'change': None, 'status': 'yeni'})
+    return rows
+
+
+def environment_differences(baseline_results, current_results):
+    """Karşılaştırmayı anlamsızlaştırabilecek ortam farkları"""
+    base_env = baseline_results.get('environment', {})
+    current_env = current_results.get('environment', {})
+    keys = ('python', 'pandas', 'numpy', 'openpyxl', 'machine', 'cpu_count')
+    return [
+        f"{key}: {base_env.get(key)} → {current_env.get(key)}"
+        for key in keys if base_env.get(key) != current_env.get(key)
+    ]
+
+
+def _format_value(value, kind):
+    if value is None:
+        return "-"
+    unit = METRIC_KINDS[kind]['unit']
+    if kind == 'throughput':
+        return f"{value:,.0f} {unit}"
+    if kind == 'time' and value < 1:
+        return f"{value * 1000:.1f} ms"
+    return f"{value:.2f} {unit}"
+
+
+STATUS_MARKS = {'gerileme': '✗', 'iyileşme': '↑', 'ok': ' ', 'yeni': '+', 'eksik': '?'}
+
+
+def format_report(suite, rows, env_diffs=()):
+    """Okunur fark raporu - gerilemeler başta"""
+    order = {'gerileme': 0, 'eksik': 1, 'iyileşme': 2, 'yeni': 3, 'ok': 4}
+    rows = sorted(rows, key=lambda row: (order[row['status']], row['metric']))
+    regressions = sum(1 for row in rows if row['status'] == 'gerileme')
+    
+    lines = [f"== {suite}: {len(rows)} metrik, {regressions} gerileme =="]
+    for diff in env_diffs:
+        lines.append(f"   ⚠ ortam farkı - {diff}")
+    
+    width = max((len(row['metric']) for row in rows), default=10)
+    for row in rows:
+        change = "" if row['change'] is None else f"{row['change'] * 100:+6.1f}%"
+        lines.append(
+            f" {STATUS_MARKS[row['status']]} {row['metric']:<{width}}  "
+            f"{_format_value(row['baseline'], row['kind']):>16}  →  "
+            f"{_format_value(row['current'], row['kind']):>16}  {change:>8}  {row['status']}"
+        )
+    return "\n".join(lines)
+
+
+def baseline_path(suite):
+    return os.path.join(BASELINE_DIR, f"{suite}.json")
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_tolerances(values):
+    """['time=0.3', 'memory=0.2'] -> {'time': 0.3, 'memory': 0.2}"""
+    tolerances = {}
+    for value in values or []:
+        kind, _, number = value.partition('=')
+        if kind not in METRIC_KINDS:
+            raise argparse.ArgumentTypeError(f"Bilinmeyen metrik türü: {kind} ({', '.join(METRIC_KINDS)})")
+        tolerances[kind] = float(number)
+    return tolerances
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performans gerileme kontrolü (kayıtlı taban çizgisine göre)")
+    parser.add_argument('--suite', nargs='+', choices=list(SUITES),
+                        help="Çalıştırılacak takımlar (varsayılan: taban çizgisi olanlar, --update ile hepsi)")
+    parser.add_argument('--current', nargs='+', help="Ölçmek yerine bu sonuç dosyalarını karşılaştır")
+    parser.add_argument('--update', action='store_true', help="Güncel sonuçları yeni taban çizgisi olarak yaz")
+    parser.add_argument('--tolerance', nargs='+', metavar='TÜR=ORAN',
+                        help="Göreli tolerans (varsayılan: " + ", ".join(
+                            f"{kind}={settings['tolerance']}" for kind, settings in METRIC_KINDS.items()) + ")")
+    parser.add_argument('--confirm', type=int, default=CONFIRM_RUNS,
+                        help="Gerileme görülen takım en fazla bu kadar yeniden ölçülür")
+    parser.add_argument('--report', help="Fark raporunu bu dosyaya da yaz")
+    args = parser.parse_args(argv)
+    
+    try:
+        tolerances = parse_tolerances(args.tolerance)
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        parser.error(str(e))
+    
+    # Takım adı -> ölçüm listesi (yeniden ölçümler sona eklenir)
+    current_runs = {}
+    if args.current:
+        for path in args.current:
+            results = load_json(path)
+            current_runs.setdefault(results.get('benchmark'), []).append(results)
+    else:
+        suites = args.suite or [
+            suite for suite in SUITES if args.update or os.path.exists(baseline_path(suite))
+        ]
+        for suite in suites:
+            print(f"▶ {suite} ölçülüyor...")
+            results = SUITES[suite]()
+            if results is None:
+                print(f"   {suite} bu ortamda ölçülemedi, atlandı")
+                continue
+            current_runs[suite] = [results]
+    
+    reports = []
+    failed = False
+    for suite, runs in current_runs.items():
+        path = baseline_path(suite)
+        if args.update:
+            while not args.current and len(runs) < UPDATE_RUNS:
+                print(f"▶ {suite} taban çizgisi için yeniden ölçülüyor ({len(runs) + 1}/{UPDATE_RUNS})...")
+                runs.append(SUITES[suite]())
+            write_json(make_baseline(suite, runs), path)
+            reports.append(f"== {suite}: taban çizgisi yazıldı ({len(runs)} ölçümün medyanı, {path}) ==")
+            continue
+        if not os.path.exists(path):
+            reports.append(f"== {suite}: taban çizgisi yok ({path}) - --update ile oluşturun ==")
+            failed = True
+            continue
+        
+        baseline = load_json(path)
+        rows = compare(baseline, runs, tolerances)
+        
+        # Gerileme tek ölçümün gürültüsü olabilir - hazır dosya verilmediyse yeniden ölçülür
+        while (not args.current and len(runs) <= args.confirm
+               and any(row['status'] == 'gerileme' for row in rows)):
+            print(f"▶ {suite}: gerileme görüldü, doğrulamak için yeniden ölçülüyor ({len(runs)}/{args.confirm})...")
+            runs.append(SUITES[suite]())
+            rows = compare(baseline, runs, tolerances)
+        
+        reports.append(format_report(suite, rows, environment_differences(baseline, runs[0])))
+        failed = failed or any(row['status'] == 'gerileme' for row in rows)
+    
+    report = "\n\n".join(reports)
+    print()
+    print(report)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+    
+    if failed:
+        print("\n✗ Performans gerilemesi (veya eksik taban çizgisi) var")
+        sys.exit(1)
+    print("\n✓ Tolerans dışı gerileme yok")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
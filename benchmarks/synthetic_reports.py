@@ -0,0 +1,182 @@
+# synthetic_reports.py - Gerçekçi karlılık ve iskonto Excel raporları üretir
+#
+# Kullanım: python -m benchmarks.synthetic_reports --rows 10000 --out /tmp/raporlar
+#
+# Karlılık raporu: başlıktan önce rapor bilgisi satırları, 'Satış\nMiktar' gibi
+# çok satırlı başlıklar, ARA TOPLAM / GENEL TOPLAM satırları, bir kısmı Türkçe
+# biçimli metin sayılar ("1.234,56") ve ara sıra boş stok isimleri.
+#
+# İskonto raporu: her ürün için Depo sütununda ürün adının yazdığı bir fiyat
+# başlık satırı (Stok İsmi ve Tarih boş), altında depo/şube detay satırları;
+# fiyatların bir kısmı "₺12,50" / "12,50 TL" metni. Ürünlerin bir bölümü
+# iskonto raporunda bulunmaz (eşleşmeyen ürünler).
+
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Ölçeklenebilirlik ölçümlerinde kullanılan standart boyutlar
+STANDARD_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+DEFAULT_SEED = 42
+
+# İskonto raporunda fiyatı bulunan ürün oranı
+MATCH_RATIO = 0.85
+
+KARLILIK_HEADER = ['Stok Kodu', 'Stok İsmi', 'Birim', 'Satış\nMiktar', 'Ort.Satış Fiyat', 'Satış Tutar']
+ISKONTO_HEADER = ['Depo', 'Stok İsmi', 'Tarih', 'Fiyat', 'Liste Fiyat']
+
+_CATEGORIES = ['BÜTÜN PİLİÇ', 'PİLİÇ BUT', 'PİLİÇ KANAT', 'GÖĞÜS FİLETO', 'BAGET', 'PİRZOLA',
+               'DÖNER', 'İNCİK', 'CİĞER', 'TAVUK SUCUK', 'ŞİNİTZEL', 'KÖFTE']
+_PACKAGES = ['TAZE', 'DONUK', 'MARİNE', 'VAKUM', 'KASAP']
+_DEPOTS = ['MERKEZ DEPO', 'BÖLGE DEPO İZMİR', 'ŞUBE ANKARA', 'BÖLGE DEPO BURSA']
+
+
+def product_names(rows, seed=DEFAULT_SEED):
+    """Benzersiz, büyük harfli Türkçe ürün isimleri"""
+    rng = np.random.default_rng(seed)
+    categories = rng.integers(0, len(_CATEGORIES), rows)
+    packages = rng.integers(0, len(_PACKAGES), rows)
+    grams = rng.choice([250, 500, 900, 1000, 1500, 2000], rows)
+    return [
+        f"{_CATEGORIES[c]} {_PACKAGES[p]} {g}G {i:07d}"
+        for i, (c, p, g) in enumerate(zip(categories, packages, grams))
+    ]
+
+
+def turkish_number(value):
+    """1234.5 -> '1.234,50'"""
+    return f"{value:,.2f}".replace(',', '_').replace('.', ',').replace('_', '.')
+
+
+def _workbook():
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    return workbook, workbook.create_sheet("Rapor")
+
+
+def write_karlilik(path, rows, seed=DEFAULT_SEED):
+    """Karlılık analizi raporu yaz"""
+    rng = np.random.default_rng(seed + 1)
+    names = product_names(rows, seed)
+    quantities = rng.integers(1, 5000, rows)
+    prices = rng.uniform(20, 400, rows).round(2)
+    text_price = rng.random(rows) < 0.3
+    blank_name = rng.random(rows) < 0.005
+    
+    workbook, sheet = _workbook()
+    sheet.append(["BUPİLİÇ KARLILIK ANALİZİ RAPORU"])
+    sheet.append(["Tarih Aralığı: 01.01.2024 - 31.01.2024"])
+    sheet.append([])
+    sheet.append(KARLILIK_HEADER)
+    
+    subtotal_quantity = 0
+    subtotal_amount = 0.0
+    for i in range(rows):
+        amount = round(float(quantities[i] * prices[i]), 2)
+        price = turkish_number(prices[i]) if text_price[i] else float(prices[i])
+        sheet.append([
+            f"STK{i:07d}",
+            None if blank_name[i] else names[i],
+            'KG',
+            int(quantities[i]),
+            price,
+            amount
+        ])
+        subtotal_quantity += int(quantities[i])
+        subtotal_amount += amount
+        
+        # Her 100 üründe bir grup ara toplamı
+        if (i + 1) % 100 == 0:
+            sheet.append([None, 'ARA TOPLAM', None, subtotal_quantity, None, round(subtotal_amount, 2)])
+            subtotal_quantity = 0
+            subtotal_amount = 0.0
+    
+    sheet.append([None, 'GENEL TOPLAM', None, int(quantities.sum()), None, round(float((quantities * prices).sum()), 2)])
+    workbook.save(path)
+    return path
+
+
+def write_iskonto(path, rows, seed=DEFAULT_SEED, match_ratio=MATCH_RATIO):
+    """Depo başlık hiyerarşili iskonto raporu yaz"""
+    rng = np.random.default_rng(seed + 2)
+    names = product_names(rows, seed)
+    matched = rng.random(rows) < match_ratio
+    costs = rng.uniform(15, 380, rows).round(2)
+    price_format = rng.integers(0, 3, rows)
+    detail_counts = rng.integers(1, 3, rows)
+    start_date = date(2024, 1, 1)
+    
+    workbook, sheet = _workbook()
+    sheet.append(ISKONTO_HEADER)
+    
+    for i in range(rows):
+        if not matched[i]:
+            continue
+        
+        cost = float(costs[i])
+        if price_format[i] == 1:
+            price = f"₺{turkish_number(cost)}"
+        elif price_format[i] == 2:
+            price = f"{turkish_number(cost)} TL"
+        else:
+            price = cost
+        
+        # Fiyat başlık satırı: ürün adı Depo sütununda, Stok İsmi ve Tarih boş
+        sheet.append([names[i], None, None, price, round(cost * 1.2, 2)])
+        
+        for j in range(int(detail_counts[i])):
+            sheet.append([
+                _DEPOTS[(i + j) % len(_DEPOTS)],
+                names[i].title(),
+                start_date + timedelta(days=int((i + j) % 28)),
+                round(cost * (1 - 0.02 * j), 2),
+                round(cost * 1.2, 2)
+            ])
+    
+    sheet.append([None, 'TOPLAM', None, 0, 0])
+    workbook.save(path)
+    return path
+
+
+def ensure_reports(rows, out_dir, seed=DEFAULT_SEED):
+    """Boyut/seed için rapor çiftini üret - varsa yeniden üretmez
+    
+    Returns:
+        (karlilik_path, iskonto_path)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    karlilik_path = os.path.join(out_dir, f"karlilik_{rows}_{seed}.xlsx")
+    iskonto_path = os.path.join(out_dir, f"iskonto_{rows}_{seed}.xlsx")
+    
+    for path, writer in ((karlilik_path, write_karlilik), (iskonto_path, write_iskonto)):
+        if not os.path.exists(path):
+            # Yarım kalan üretim sonraki çalıştırmada kullanılmasın
+            temp_path = f"{path}.tmp.xlsx"
+            writer(temp_path, rows, seed)
+            os.replace(temp_path, path)
+    
+    return karlilik_path, iskonto_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik karlılık/iskonto raporu üretici")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000],
+                        help=f"Ürün sayıları (standart: {' '.join(map(str, STANDARD_SIZES))})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--out', default='.', help="Çıktı dizini")
+    args = parser.parse_args(argv)
+    
+    for rows in args.rows:
+        karlilik_path, iskonto_path = ensure_reports(rows, args.out, args.seed)
+        print(f"{rows:>9,} ürün: {karlilik_path}, {iskonto_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# veri_analizi_benchmark.py - VeriAnalizi sorgularının mikro ölçümü ve ölçeklenme eğrileri
+#
+# Kullanım: python -m benchmarks.veri_analizi_benchmark --sizes 1000 10000 100000 1000000 --json sonuc.json
+#
+# Her boyutta sentetik sonuç çerçevesi üzerinde VeriAnalizi kurulur ve dashboard'un
+# her açılışta çalıştırdığı sorgular ölçülür. Süreler log-log eksende doğruya
+# oturtulur; son iki boyut arasındaki eğim O(n log n) eğiminden belirgin büyükse
+# sorgu işaretlenir (--strict ile çıkış kodu 1 olur).
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import environment_info, rate, write_json
+from benchmarks.handoff_benchmark import make_result_frame
+from veri_analizi import VeriAnalizi
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Bir ölçümün en kısa süresi (saniye) - kısa sorgular bu süreyi dolduracak kadar tekrarlanır
+MIN_BATCH_SECONDS = 0.05
+
+# Eğim O(n log n) eğimini bu kadar aşarsa sorgu işaretlenir - ölçüm gürültüsü payı
+SLOPE_TOLERANCE = 0.15
+
+# Aranan terimler: biri az sayıda satırda geçer, diğeri hiç geçmez
+SEARCH_HIT = "ÜRÜN 00001"
+SEARCH_MISS = "BULUNMAYAN ÜRÜN"
+
+
+def _display_frame(analiz):
+    # Dashboard'un "Tüm Ürünler" filtresi gibi: maske tüm satırlar, ilk 50 satır biçimlendirilir
+    return analiz.get_display_rows(analiz.filter_mask('all'), 50)
+
+
+QUERIES = {
+    'get_kpi_summary': lambda analiz: analiz.get_kpi_summary(),
+    'get_top_profitable_products': lambda analiz: analiz.get_top_profitable_products(10),
+    'get_top_selling_products': lambda analiz: analiz.get_top_selling_products(10),
+    'get_low_profit_products': lambda analiz: analiz.get_low_profit_products(10),
+    'get_profit_distribution': lambda analiz: analiz.get_profit_distribution(),
+    'search_product (bulunan)': lambda analiz: analiz.search_product(SEARCH_HIT),
+    'search_product (bulunmayan)': lambda analiz: analiz.search_product(SEARCH_MISS),
+    'get_summary_stats': lambda analiz: analiz.get_summary_stats(),
+    'get_display_frame': _display_frame
+}
+
+
+def measure(func, repeat):
+    """Çağrı başına en iyi süre (saniye) - kısa çağrılar gruplanarak ölçülür"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_BATCH_SECONDS or loops >= 10_000:
+            break
+        loops *= 10
+    
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def loglog_slope(sizes, timings):
+    """log(süre) ~ log(n) en küçük kareler eğimi"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def nlogn_slope(small, large):
+    """n log n'nin iki boyut arasındaki log-log eğimi (1'den biraz büyük)"""
+    return math.log(large * math.log(large) / (small * math.log(small))) / math.log(large / small)
+
+
+def scaling(sizes, timings):
+    """Eğri özeti: tüm noktaların eğimi, son aralığın eğimi ve işaret"""
+    result = {'slope': None, 'tail_slope': None, 'limit': None, 'flagged': False}
+    if len(sizes) < 2:
+        return result
+    
+    result['slope'] = round(loglog_slope(sizes, timings), 3)
+    # Küçük boyutlarda sabit maliyet baskındır - karar büyük boyutlardaki eğime göre verilir
+    tail_slope = loglog_slope(sizes[-2:], timings[-2:])
+    limit = nlogn_slope(sizes[-2], sizes[-1]) + SLOPE_TOLERANCE
+    result['tail_slope'] = round(tail_slope, 3)
+    result['limit'] = round(limit, 3)
+    result['flagged'] = tail_slope > limit
+    return result
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} sn"
+
+
+def print_table(sizes, methods):
+    name_width = max(len(name) for name in methods)
+    header = f"{'Sorgu':<{name_width}}" + "".join(f"{n:>12,}" for n in sizes) + "     eğim  son eğim"
+    print(header)
+    print("-" * len(header))
+    for name, data in methods.items():
+        cells = "".join(f"{format_seconds(data['seconds'][str(n)]):>12}" for n in sizes)
+        curve = data['scaling']
+        slopes = ""
+        if curve['slope'] is not None:
+            mark = "⚠ O(n log n) üstü" if curve['flagged'] else "✓"
+            slopes = f"  {curve['slope']:7.2f}  {curve['tail_slope']:7.2f}  {mark}"
+        print(f"{name:<{name_width}}{cells}{slopes}")
+
+
+def run_benchmark(sizes, repeat=5, seed=42):
+    """Tüm boyutlarda tüm sorguları ölç - JSON'a yazılabilir sonuç sözlüğü döndürür"""
+    sizes = sorted(sizes)
+    methods = {name: {'seconds': {}, 'rows_per_second': {}} for name in ['__init__', *QUERIES]}
+    
+    for rows in sizes:
+        df = make_result_frame(rows, seed)
+        
+        # Kurulum (kopyalama + temizleme) de her açılışta ödenir
+        timings = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            analiz = VeriAnalizi(df)
+            timings.append(time.perf_counter() - start)
+        methods['__init__']['seconds'][str(rows)] = min(timings)
+        
+        for name, query in QUERIES.items():
+            methods[name]['seconds'][str(rows)] = measure(lambda query=query, analiz=analiz: query(analiz), repeat)
+        
+        for data in methods.values():
+            seconds = data['seconds'][str(rows)]
+            data['rows_per_second'][str(rows)] = rate(rows, seconds)
+        del analiz, df
+    
+    for data in methods.values():
+        data['scaling'] = scaling(sizes, [data['seconds'][str(n)] for n in sizes])
+    
+    return {
+        'benchmark': 'veri_analizi',
+        'environment': environment_info(),
+        'seed': seed,
+        'repeat': repeat,
+        'sizes': sizes,
+        'methods': methods
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="VeriAnalizi sorgu ölçümü ve ölçeklenme eğrileri")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="Sonuçları bu dosyaya JSON olarak yaz")
+    parser.add_argument('--strict', action='store_true',
+                        help="O(n log n)'den kötü ölçeklenen sorgu varsa 1 ile çık")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmark(args.sizes, args.repeat, args.seed)
+    print_table(results['sizes'], results['methods'])
+    
+    flagged = [name for name, data in results['methods'].items() if data['scaling']['flagged']]
+    if flagged:
+        print(f"\n⚠ O(n log n)'den kötü ölçeklenen sorgular: {', '.join(flagged)}")
+    
+    if args.json:
+        write_json(results, args.json)
+        print(f"Sonuçlar yazıldı: {args.json}")
+    
+    if args.strict and flagged:
+        sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@
 
 import tkinter as tk
 from tkinter import ttk
-import pandas as pd
 
 class DashboardComponents:
     """Dashboard UI bileşenlerini içeren static metodlar sınıfı"""
@@ -25,6 +24,38 @@ class DashboardComponents:
         'shadow': '#f3f4f6'           # Shadow rengi
     }
     
+    # Yerleşim güncellemeleri için çerçeve aralığı (~60 fps)
+    FRAME_INTERVAL_MS = 16
+    
+    @staticmethod
+    def coalesce(widget, callback, delay=None):
+        """Sık tetiklenen olayları birleştir
+        
+        Dönen fonksiyon istenildiği kadar çağrılabilir; callback en fazla
+        bir çerçeve aralığında bir kez, son çağrıdan sonra çalışır.
+        """
+        if delay is None:
+            delay = DashboardComponents.FRAME_INTERVAL_MS
+        pending = [None]
+        
+        def run():
+            pending[0] = None
+            try:
+                if widget.winfo_exists():
+                    callback()
+            except tk.TclError:
+                pass
+        
+        def trigger(event=None):
+            if pending[0] is not None:
+                return
+            try:
+                pending[0] = widget.after(delay, run)
+            except tk.TclError:
+                pending[0] = None
+        
+        return trigger
+    
     @staticmethod
     def create_shadow_effect(parent, widget, offset=2):
         """Soft shadow efekti oluştur"""
@@ -37,95 +68,27 @@ class DashboardComponents:
             return None
     
     @staticmethod
-    def create_modern_kpi_card(parent, icon, title, value, color, column):
-        """Modern KPI kartı - Soft tasarım"""
-        colors = DashboardComponents.COLORS
+    def create_kpi_cards(parent, cards, columns=4):
+        """KPI kartlarını tek bir Canvas üzerinde çiz
         
+        Args:
+            cards: (icon, title, value, color) demetlerinin listesi
+            columns: Bir satırdaki kart sayısı
+        """
         try:
-            # Ana card container
-            card_container = tk.Frame(parent, bg=colors['bg_primary'])
-            card_container.grid(row=0, column=column, padx=12, pady=8, sticky='ew')
-            
-            # Card frame
-            card_frame = tk.Frame(card_container, bg=colors['bg_secondary'], relief='flat')
-            card_frame.pack(fill='both', expand=True)
-            
-            # İç padding frame
-            inner_frame = tk.Frame(card_frame, bg=colors['bg_secondary'])
-            inner_frame.pack(fill='both', expand=True, padx=24, pady=20)
-            
-            # Icon container
-            icon_container = tk.Frame(inner_frame, bg=color, width=50, height=50)
-            icon_container.pack(anchor='w')
-            icon_container.pack_propagate(False)
-            
-            # Icon
-            icon_label = tk.Label(
-                icon_container,
-                text=str(icon),
-                font=('Segoe UI', 18),
-                fg='white',
-                bg=color
+            renderer = CanvasCardRenderer(
+                parent, 'kpi', columns=columns, item_height=150, gap=24,
+                bg=DashboardComponents.COLORS['bg_primary']
             )
-            icon_label.place(relx=0.5, rely=0.5, anchor='center')
-            
-            # Title
-            title_label = tk.Label(
-                inner_frame,
-                text=str(title),
-                font=('Segoe UI', 11, 'bold'),
-                fg=colors['text_secondary'],
-                bg=colors['bg_secondary']
-            )
-            title_label.pack(anchor='w', pady=(15, 5))
-            
-            # Value
-            value_label = tk.Label(
-                inner_frame,
-                text=str(value),
-                font=('Segoe UI', 16, 'bold'),
-                fg=colors['text_primary'],
-                bg=colors['bg_secondary']
-            )
-            value_label.pack(anchor='w')
-            
-            # Soft shadow efekti
-            DashboardComponents.create_shadow_effect(card_container, card_frame, 3)
-            
-            # Hover efekti - Güvenli
-            def create_hover_effect():
-                def on_enter(e):
-                    try:
-                        if card_frame.winfo_exists():
-                            card_frame.config(bg='#f1f5f9')
-                            inner_frame.config(bg='#f1f5f9')
-                            title_label.config(bg='#f1f5f9')
-                            value_label.config(bg='#f1f5f9')
-                    except tk.TclError:
-                        pass
-                
-                def on_leave(e):
-                    try:
-                        if card_frame.winfo_exists():
-                            card_frame.config(bg=colors['bg_secondary'])
-                            inner_frame.config(bg=colors['bg_secondary'])
-                            title_label.config(bg=colors['bg_secondary'])
-                            value_label.config(bg=colors['bg_secondary'])
-                    except tk.TclError:
-                        pass
-                
-                widgets = [card_frame, inner_frame, title_label, value_label]
-                for widget in widgets:
-                    try:
-                        widget.bind("<Enter>", on_enter)
-                        widget.bind("<Leave>", on_leave)
-                    except tk.TclError:
-                        pass
-            
-            create_hover_effect()
-            
+            renderer.canvas.pack(fill='x')
+            renderer.set_items([
+                {'icon': icon, 'title': title, 'value': value, 'color': color}
+                for icon, title, value, color in cards
+            ])
+            return renderer
         except Exception as e:
-            print(f"KPI card oluşturma hatası: {e}")
+            print(f"KPI kartları oluşturma hatası: {e}")
+            return None
     
     @staticmethod
     def create_section_title(parent, title, subtitle=None):
@@ -165,265 +128,102 @@ class DashboardComponents:
             print(f"Section title oluşturma hatası: {e}")
     
     @staticmethod
-    def create_profit_card(parent, icon, title, value, color, column):
-        """Modern kar kartı"""
-        colors = DashboardComponents.COLORS
+    def create_profit_cards(parent, cards, columns=4):
+        """Kar dağılım kartlarını tek bir Canvas üzerinde çiz
         
+        Args:
+            cards: (icon, title, value, color) demetlerinin listesi
+            columns: Bir satırdaki kart sayısı
+        """
         try:
-            # Card container
-            card_container = tk.Frame(parent, bg=colors['bg_secondary'])
-            card_container.grid(row=0, column=column, padx=12, pady=8, sticky='ew')
-            
-            # Card frame
-            card_frame = tk.Frame(card_container, bg=color, relief='flat')
-            card_frame.pack(fill='both', expand=True)
-            
-            # İç container
-            inner_frame = tk.Frame(card_frame, bg=color)
-            inner_frame.pack(fill='both', expand=True, padx=20, pady=20)
-            
-            # Icon
-            icon_label = tk.Label(
-                inner_frame,
-                text=str(icon),
-                font=('Segoe UI', 24),
-                fg='white',
-                bg=color
-            )
-            icon_label.pack()
-            
-            # Title
-            title_label = tk.Label(
-                inner_frame,
-                text=str(title),
-                font=('Segoe UI', 11, 'bold'),
-                fg='white',
-                bg=color
-            )
-            title_label.pack(pady=(8, 5))
-            
-            # Value
-            try:
-                value_text = f"{int(value)} ürün"
-            except (ValueError, TypeError):
-                value_text = f"{value} ürün"
-                
-            value_label = tk.Label(
-                inner_frame,
-                text=value_text,
-                font=('Segoe UI', 16, 'bold'),
-                fg='white',
-                bg=color
+            renderer = CanvasCardRenderer(
+                parent, 'profit', columns=columns, item_height=135, gap=24,
+                bg=DashboardComponents.COLORS['bg_secondary']
             )
-            value_label.pack()
-            
-            # Shadow efekti
-            DashboardComponents.create_shadow_effect(card_container, card_frame, 3)
-            
+            renderer.canvas.pack(fill='x')
+            renderer.set_items([
+                {'icon': icon, 'title': title, 'value': value, 'color': color}
+                for icon, title, value, color in cards
+            ])
+            return renderer
         except Exception as e:
-            print(f"Profit card oluşturma hatası: {e}")
+            print(f"Profit kartları oluşturma hatası: {e}")
+            return None
     
     @staticmethod
-    def create_modern_product_list(parent, df, value_column, color, analiz=None):
-        """Modern ürün listesi - Güvenli"""
+    def build_product_list_items(display_rows, value_column, color):
+        """Ürün listesi için çizilecek öğeleri hazırla
+        
+        Args:
+            display_rows: VeriAnalizi.get_display_frame satırları (sıralı)
+            value_column: 'net_kar_liste' veya 'miktar_liste'
+            color: Sıra rozeti rengi
+        """
+        colors = DashboardComponents.COLORS
+        
+        if display_rows is None or display_rows.empty or value_column not in display_rows.columns:
+            return []
+        
+        # Kar değerleri işaretine göre, miktarlar liste rengiyle boyanır
+        show_sign = value_column == 'net_kar_liste'
+        
+        items = []
+        for i, row in enumerate(display_rows.head(8).itertuples(index=False), 1):
+            value_text = getattr(row, value_column)
+            if value_text == "N/A":
+                value_color = colors['text_light']
+            elif show_sign:
+                value_color = colors[row.net_kar_renk]
+            else:
+                value_color = color
+            
+            items.append({
+                'rank': i,
+                'name': row.ad_liste,
+                'value': value_text,
+                'value_color': value_color,
+                'badge_color': color
+            })
+        
+        return items
+    
+    @staticmethod
+    def create_modern_product_list(parent, items):
+        """Modern ürün listesi - Canvas üzerinde çizilir
+        
+        Args:
+            items: build_product_list_items ile hazırlanmış liste öğeleri
+        """
         colors = DashboardComponents.COLORS
         
         try:
-            if df is None or df.empty:
-                no_data_frame = tk.Frame(parent, bg=colors['bg_secondary'])
-                no_data_frame.pack(fill='both', expand=True, padx=30, pady=30)
-                
-                tk.Label(
-                    no_data_frame,
-                    text="📋 Gösterilecek veri bulunamadı",
-                    font=('Segoe UI', 12),
-                    fg=colors['text_secondary'],
-                    bg=colors['bg_secondary']
-                ).pack(expand=True)
-                return
-            
-            # Liste container
-            list_container = tk.Frame(parent, bg=colors['bg_secondary'])
-            list_container.pack(fill='both', expand=True, padx=15, pady=(0, 15))
-            
-            # Scrollable list
-            canvas = tk.Canvas(list_container, bg=colors['bg_secondary'], highlightthickness=0)
-            scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg=colors['bg_secondary'])
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            renderer = CanvasCardRenderer(
+                parent, 'list', columns=1, item_height=46, gap=4,
+                bg=colors['bg_secondary'],
+                empty_text="📋 Gösterilecek veri bulunamadı"
             )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            # Stok sütunu bul - Güvenli
-            stok_col = None
-            try:
-                if analiz:
-                    stok_col = analiz.find_stok_column()
-                else:
-                    stok_col = None
-                    
-                if not stok_col or stok_col not in df.columns:
-                    for col in df.columns:
-                        col_str = str(col).lower()
-                        if any(term in col_str for term in ['stok', 'ürün', 'urun', 'isim', 'ismi']):
-                            stok_col = col
-                            break
-                    
-                    if not stok_col:
-                        stok_col = df.columns[0] if len(df.columns) > 0 else None
-                        
-            except Exception as e:
-                print(f"Stok sütunu bulma hatası: {e}")
-                stok_col = df.columns[0] if len(df.columns) > 0 else None
-            
-            if not stok_col or not value_column or value_column not in df.columns:
-                tk.Label(scrollable_frame, text="Sütun bilgisi bulunamadı", bg=colors['bg_secondary']).pack()
-                return
-            
-            # Liste öğeleri - Güvenli
-            try:
-                df_limited = df.head(8)
-                for i, (idx, row) in enumerate(df_limited.iterrows(), 1):
-                    # Item container
-                    item_container = tk.Frame(scrollable_frame, bg=colors['bg_secondary'])
-                    item_container.pack(fill='x', pady=2, padx=3)
-                    
-                    # Item frame
-                    item_frame = tk.Frame(item_container, bg=colors['bg_secondary'], relief='flat')
-                    item_frame.pack(fill='x')
-                    
-                    # İç container
-                    inner_item = tk.Frame(item_frame, bg=colors['bg_secondary'])
-                    inner_item.pack(fill='x', padx=15, pady=8)
-                    
-                    # Rank container
-                    rank_container = tk.Frame(inner_item, bg=color, width=30, height=30)
-                    rank_container.pack(side='left')
-                    rank_container.pack_propagate(False)
-                    
-                    # Rank number
-                    rank_label = tk.Label(
-                        rank_container,
-                        text=str(i),
-                        font=('Segoe UI', 10, 'bold'),
-                        fg='white',
-                        bg=color
-                    )
-                    rank_label.place(relx=0.5, rely=0.5, anchor='center')
-                    
-                    # Ürün bilgileri
-                    info_frame = tk.Frame(inner_item, bg=colors['bg_secondary'])
-                    info_frame.pack(side='left', fill='x', expand=True, padx=(12, 0))
-                    
-                    # Ürün adı - Güvenli
-                    try:
-                        product_name = str(row[stok_col]) if pd.notna(row[stok_col]) else "Bilinmiyor"
-                        if len(product_name) > 30:
-                            product_name = product_name[:30] + "..."
-                    except (KeyError, TypeError):
-                        product_name = "Veri Hatası"
-                    
-                    name_label = tk.Label(
-                        info_frame,
-                        text=product_name,
-                        font=('Segoe UI', 10, 'bold'),
-                        fg=colors['text_primary'],
-                        bg=colors['bg_secondary'],
-                        anchor='w'
-                    )
-                    name_label.pack(fill='x')
-                    
-                    # Değer bilgisi - Güvenli
-                    try:
-                        value = row[value_column]
-                        if pd.notna(value):
-                            if 'Kar' in value_column:
-                                value_num = float(value)
-                                value_text = f"₺{value_num:,.2f}"
-                                value_color = colors['success'] if value_num >= 0 else colors['danger']
-                            else:
-                                value_num = float(value)
-                                value_text = f"{value_num:,.0f} adet"
-                                value_color = color
-                        else:
-                            value_text = "N/A"
-                            value_color = colors['text_light']
-                    except (ValueError, TypeError, KeyError):
-                        value_text = "N/A"
-                        value_color = colors['text_light']
-                    
-                    value_label = tk.Label(
-                        info_frame,
-                        text=value_text,
-                        font=('Segoe UI', 9),
-                        fg=value_color,
-                        bg=colors['bg_secondary'],
-                        anchor='w'
-                    )
-                    value_label.pack(fill='x', pady=(2, 0))
-                    
-                    # Shadow efekti
-                    DashboardComponents.create_shadow_effect(item_container, item_frame, 1)
-                    
-                    # Hover efekti - Güvenli
-                    def create_hover_handlers(item_frame, inner_item, info_frame, name_label, value_label):
-                        def on_enter(e):
-                            try:
-                                if item_frame.winfo_exists():
-                                    widgets = [item_frame, inner_item, info_frame, name_label, value_label]
-                                    for widget in widgets:
-                                        try:
-                                            widget.config(bg='#f1f5f9')
-                                        except tk.TclError:
-                                            pass
-                            except tk.TclError:
-                                pass
-                        
-                        def on_leave(e):
-                            try:
-                                if item_frame.winfo_exists():
-                                    widgets = [item_frame, inner_item, info_frame, name_label, value_label]
-                                    for widget in widgets:
-                                        try:
-                                            widget.config(bg=colors['bg_secondary'])
-                                        except tk.TclError:
-                                            pass
-                            except tk.TclError:
-                                pass
-                        
-                        return on_enter, on_leave
-                    
-                    on_enter_func, on_leave_func = create_hover_handlers(
-                        item_frame, inner_item, info_frame, name_label, value_label
-                    )
-                    
-                    try:
-                        item_frame.bind("<Enter>", on_enter_func)
-                        item_frame.bind("<Leave>", on_leave_func)
-                    except tk.TclError:
-                        pass
-                        
-            except Exception as e:
-                print(f"Liste oluşturma hatası: {e}")
-                tk.Label(scrollable_frame, text=f"Liste oluşturma hatası: {str(e)}", bg=colors['bg_secondary']).pack()
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-            
+            renderer.canvas.pack(fill='both', expand=True, padx=15, pady=(8, 15))
+            renderer.set_items(items)
+            return renderer
         except Exception as e:
             print(f"Product list oluşturma hatası: {e}")
+            return None
     
     @staticmethod
-    def display_search_results(parent, results, analiz=None):
-        """Modern sonuç tablosu - Tamamen güvenli"""
+    def display_search_results(parent, results, total=None, limit=20):
+        """Modern sonuç tablosu - Tamamen güvenli
+        
+        Args:
+            results: VeriAnalizi.get_display_frame satırları (hazır metin/renk sütunları)
+            total: Toplam sonuç sayısı (varsayılan: len(results))
+            limit: Gösterilecek en fazla satır - çağıran aynı sınırla biçimlendirir
+        """
         colors = DashboardComponents.COLORS
         
         try:
+            if total is None:
+                total = len(results) if results is not None else 0
+                
             if results is None or results.empty:
                 tk.Label(
                     parent,
@@ -466,23 +266,28 @@ class DashboardComponents:
             table_scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=table_canvas.yview)
             table_scrollable_frame = tk.Frame(table_canvas, bg=colors['bg_secondary'])
             
-            # Scroll region konfigürasyonu
-            def configure_scroll_region(event=None):
-                try:
-                    table_canvas.configure(scrollregion=table_canvas.bbox("all"))
-                except tk.TclError:
-                    pass
+            # Scroll region konfigürasyonu - olaylar çerçeve başına bire indirilir
+            layout_state = {'width': 0}
+            
+            def configure_scroll_region():
+                table_canvas.configure(scrollregion=(
+                    0, 0,
+                    table_scrollable_frame.winfo_reqwidth(),
+                    table_scrollable_frame.winfo_reqheight()
+                ))
                     
-            def configure_canvas_width(event=None):
-                try:
-                    canvas_width = table_canvas.winfo_width()
-                    if canvas_width > 1:
-                        table_canvas.itemconfig(table_canvas_window, width=canvas_width)
-                except (tk.TclError, AttributeError):
-                    pass
+            def configure_canvas_width():
+                canvas_width = table_canvas.winfo_width()
+                if canvas_width > 1 and canvas_width != layout_state['width']:
+                    layout_state['width'] = canvas_width
+                    table_canvas.itemconfig(table_canvas_window, width=canvas_width)
             
-            table_scrollable_frame.bind("<Configure>", configure_scroll_region)
-            table_canvas.bind('<Configure>', configure_canvas_width)
+            table_scrollable_frame.bind(
+                "<Configure>", DashboardComponents.coalesce(table_canvas, configure_scroll_region)
+            )
+            table_canvas.bind(
+                '<Configure>', DashboardComponents.coalesce(table_canvas, configure_canvas_width)
+            )
             
             # Canvas window oluştur
             table_canvas_window = table_canvas.create_window((0, 0), window=table_scrollable_frame, anchor="nw")
@@ -512,39 +317,20 @@ class DashboardComponents:
                 )
                 header_label.grid(row=0, column=i, sticky='ew', padx=1, pady=6, ipadx=5)
             
-            # Sütun bilgilerini bul - Güvenli
-            stok_col = None
-            miktar_col = None
-            
+            # Hücreler: (metin sütunu, renk sütunu veya sabit renk anahtarı, kalın, hizalama)
+            cell_specs = [
+                ('ad', 'text_primary', False, 'w'),
+                ('net_kar', 'net_kar_renk', True, 'center'),
+                ('birim_kar', 'birim_kar_renk', False, 'center'),
+                ('miktar', 'info', False, 'center'),
+                ('ort_satis', 'ort_satis_renk', True, 'center'),
+                ('maliyet', 'maliyet_renk', True, 'center')
+            ]
+            
+            # Veri satırları - metinler VeriAnalizi.get_display_frame ile hazır gelir
             try:
-                if analiz:
-                    stok_col = analiz.find_stok_column()
-                    miktar_col = analiz.find_miktar_column()
-                
-                if not stok_col:
-                    for col in results.columns:
-                        col_str = str(col).lower()
-                        if any(term in col_str for term in ['stok', 'ürün', 'urun', 'isim', 'ismi']):
-                            stok_col = col
-                            break
-                    if not stok_col and len(results.columns) > 0:
-                        stok_col = results.columns[0]
-                        
-                if not miktar_col:
-                    for col in results.columns:
-                        if 'miktar' in str(col).lower():
-                            miktar_col = col
-                            break
-                            
-            except Exception as e:
-                print(f"Sütun bulma hatası: {e}")
-                stok_col = results.columns[0] if len(results.columns) > 0 else None
-                miktar_col = None
-            
-            # Veri satırları - Güvenli
-            try:
-                limited_results = results.head(20)
-                for idx, (_, row) in enumerate(limited_results.iterrows()):
+                limited_results = results.head(limit)
+                for idx, row in enumerate(limited_results.itertuples(index=False)):
                     row_bg = colors['bg_secondary'] if idx % 2 == 0 else '#f8fafc'
                     
                     data_row = tk.Frame(table_scrollable_frame, bg=row_bg)
@@ -566,180 +352,24 @@ class DashboardComponents:
                     )
                     sira_label.grid(row=0, column=0, sticky='ew', padx=1, pady=3, ipadx=5)
                     
-                    # Ürün adı - Güvenli
-                    try:
-                        if stok_col and stok_col in row.index:
-                            product_name = str(row[stok_col]) if pd.notna(row[stok_col]) else "Bilinmiyor"
+                    row_widgets = [sira_label]
+                    for column, (text_col, color_key, bold, anchor) in enumerate(cell_specs, 1):
+                        if color_key in colors:
+                            fg_color = colors[color_key]
                         else:
-                            product_name = "Veri Yok"
-                        
-                        max_chars = 28
-                        if len(product_name) > max_chars:
-                            product_name = product_name[:max_chars-3] + "..."
-                            
-                    except (KeyError, TypeError):
-                        product_name = "Hata"
+                            fg_color = colors.get(getattr(row, color_key), colors['text_light'])
                         
-                    urun_label = tk.Label(
-                        data_row,
-                        text=product_name,
-                        font=('Segoe UI', 10),
-                        fg=colors['text_primary'],
-                        bg=row_bg,
-                        anchor='w',
-                        width=header_widths[1]//8
-                    )
-                    urun_label.grid(row=0, column=1, sticky='ew', padx=1, pady=3, ipadx=5)
-                    
-                    # Net kar - Güvenli
-                    try:
-                        net_kar = row.get('Net Kar', 0)
-                        if pd.notna(net_kar) and str(net_kar) != '':
-                            net_kar_value = float(net_kar)
-                            if abs(net_kar_value) >= 1000:
-                                net_kar_text = f"₺{net_kar_value/1000:.1f}K"
-                            else:
-                                net_kar_text = f"₺{net_kar_value:.0f}"
-                            net_kar_color = colors['success'] if net_kar_value >= 0 else colors['danger']
-                        else:
-                            net_kar_text = "N/A"
-                            net_kar_color = colors['text_light']
-                    except (ValueError, TypeError, KeyError):
-                        net_kar_text = "N/A"
-                        net_kar_color = colors['text_light']
-                    
-                    netkar_label = tk.Label(
-                        data_row,
-                        text=net_kar_text,
-                        font=('Segoe UI', 10, 'bold'),
-                        fg=net_kar_color,
-                        bg=row_bg,
-                        anchor='center',
-                        width=header_widths[2]//8
-                    )
-                    netkar_label.grid(row=0, column=2, sticky='ew', padx=1, pady=3, ipadx=5)
-                    
-                    # Birim kar - Güvenli
-                    try:
-                        birim_kar = row.get('Birim Kar', 0)
-                        if pd.notna(birim_kar) and str(birim_kar) != '':
-                            birim_kar_value = float(birim_kar)
-                            if abs(birim_kar_value) >= 100:
-                                birim_kar_text = f"₺{birim_kar_value:.0f}"
-                            else:
-                                birim_kar_text = f"₺{birim_kar_value:.1f}"
-                            birim_kar_color = colors['success'] if birim_kar_value >= 0 else colors['danger']
-                        else:
-                            birim_kar_text = "N/A"
-                            birim_kar_color = colors['text_light']
-                    except (ValueError, TypeError, KeyError):
-                        birim_kar_text = "N/A"
-                        birim_kar_color = colors['text_light']
-                    
-                    birimkar_label = tk.Label(
-                        data_row,
-                        text=birim_kar_text,
-                        font=('Segoe UI', 10),
-                        fg=birim_kar_color,
-                        bg=row_bg,
-                        anchor='center',
-                        width=header_widths[3]//8
-                    )
-                    birimkar_label.grid(row=0, column=3, sticky='ew', padx=1, pady=3, ipadx=5)
-                    
-                    # Miktar - Güvenli
-                    try:
-                        if miktar_col and miktar_col in row.index:
-                            miktar = row[miktar_col]
-                            if pd.notna(miktar) and str(miktar) != '':
-                                miktar_value = float(miktar)
-                                if miktar_value >= 1000:
-                                    miktar_text = f"{miktar_value/1000:.1f}K"
-                                else:
-                                    miktar_text = f"{miktar_value:.0f}"
-                            else:
-                                miktar_text = "N/A"
-                        else:
-                            miktar_text = "N/A"
-                    except (ValueError, TypeError, KeyError):
-                        miktar_text = "N/A"
-                        
-                    miktar_label = tk.Label(
-                        data_row,
-                        text=miktar_text,
-                        font=('Segoe UI', 10),
-                        fg=colors['info'],
-                        bg=row_bg,
-                        anchor='center',
-                        width=header_widths[4]//8
-                    )
-                    miktar_label.grid(row=0, column=4, sticky='ew', padx=1, pady=3, ipadx=5)
-                    
-                    # Ort. Satış Fiyatı - Güvenli
-                    try:
-                        ort_satis_fiyat = None
-                        possible_columns = ['Ort.Satış Fiyat', 'Ort.Satış\nFiyat', 'Ort Satış Fiyat', 'Ortalama Satış Fiyat']
-                        
-                        for col in possible_columns:
-                            if col in row.index:
-                                ort_satis_fiyat = row[col]
-                                break
-                        
-                        if ort_satis_fiyat is not None and pd.notna(ort_satis_fiyat) and str(ort_satis_fiyat) != '':
-                            fiyat_value = float(ort_satis_fiyat)
-                            if fiyat_value >= 1000:
-                                ort_satis_text = f"₺{fiyat_value:,.0f}"
-                            else:
-                                ort_satis_text = f"₺{fiyat_value:.2f}"
-                            ort_satis_color = colors['success']
-                        else:
-                            ort_satis_text = "Bilgi yok"
-                            ort_satis_color = colors['text_light']
-                            
-                    except (ValueError, TypeError, KeyError):
-                        ort_satis_text = "Bilgi yok"
-                        ort_satis_color = colors['text_light']
-                    
-                    ort_satis_label = tk.Label(
-                        data_row,
-                        text=ort_satis_text,
-                        font=('Segoe UI', 10, 'bold'),
-                        fg=ort_satis_color,
-                        bg=row_bg,
-                        anchor='center',
-                        width=header_widths[5]//8
-                    )
-                    ort_satis_label.grid(row=0, column=5, sticky='ew', padx=1, pady=3, ipadx=5)
-                    
-                    # Fiyat (Birim Maliyet) - Güvenli
-                    try:
-                        birim_maliyet = row.get('Birim Maliyet', None)
-                        
-                        if pd.notna(birim_maliyet) and str(birim_maliyet) != '' and float(birim_maliyet) > 0:
-                            fiyat_value = float(birim_maliyet)
-                            if fiyat_value >= 1000:
-                                fiyat_text = f"₺{fiyat_value:,.0f}"
-                            else:
-                                fiyat_text = f"₺{fiyat_value:.2f}"
-                            fiyat_color = colors['primary']
-                        else:
-                            fiyat_text = "N/A"
-                            fiyat_color = colors['text_light']
-                                
-                    except (ValueError, TypeError, KeyError):
-                        fiyat_text = "N/A"
-                        fiyat_color = colors['text_light']
-                    
-                    fiyat_label = tk.Label(
-                        data_row,
-                        text=fiyat_text,
-                        font=('Segoe UI', 10, 'bold'),
-                        fg=fiyat_color,
-                        bg=row_bg,
-                        anchor='center',
-                        width=header_widths[6]//8
-                    )
-                    fiyat_label.grid(row=0, column=6, sticky='ew', padx=1, pady=3, ipadx=5)
+                        cell_label = tk.Label(
+                            data_row,
+                            text=getattr(row, text_col),
+                            font=('Segoe UI', 10, 'bold') if bold else ('Segoe UI', 10),
+                            fg=fg_color,
+                            bg=row_bg,
+                            anchor=anchor,
+                            width=header_widths[column]//8
+                        )
+                        cell_label.grid(row=0, column=column, sticky='ew', padx=1, pady=3, ipadx=5)
+                        row_widgets.append(cell_label)
                     
                     # Hover efekti - Güvenli
                     def create_row_hover(data_row, widgets, row_bg):
@@ -770,8 +400,6 @@ class DashboardComponents:
                         
                         return on_enter, on_leave
                     
-                    row_widgets = [sira_label, urun_label, netkar_label, birimkar_label, 
-                                  miktar_label, ort_satis_label, fiyat_label]
                     on_enter_row, on_leave_row = create_row_hover(data_row, row_widgets, row_bg)
                     
                     try:
@@ -795,7 +423,7 @@ class DashboardComponents:
             table_scrollbar.pack(side="right", fill="y")
             
             # Sonuç sayısı bilgisi
-            if len(results) > 20:
+            if total > limit:
                 info_container = tk.Frame(parent, bg=colors['bg_secondary'])
                 info_container.pack(fill='x', pady=15)
                 
@@ -804,7 +432,7 @@ class DashboardComponents:
                 
                 tk.Label(
                     info_frame,
-                    text=f"📄 İlk 20 sonuç gösteriliyor. Toplam {len(results)} sonuç bulundu.",
+                    text=f"📄 İlk {limit} sonuç gösteriliyor. Toplam {total} sonuç bulundu.",
                     font=('Segoe UI', 11),
                     fg=colors['info'],
                     bg='#f0f9ff'
@@ -862,4 +490,246 @@ class DashboardComponents:
             button.bind("<Enter>", on_enter)
             button.bind("<Leave>", on_leave)
         except tk.TclError:
-            pass
\ No newline at end of file
+            pass
+
+class CanvasCardRenderer:
+    """Kartları, gölgeleri, sıra rozetlerini ve liste öğelerini tek bir Canvas üzerinde çizer
+    
+    Her kart bir Frame/Label ağacı yerine birkaç canvas öğesinden oluşur;
+    hover efekti tüm kartlar için tek bir <Motion> handler'ı ile yönetilir.
+    """
+    
+    HOVER_BG = '#f1f5f9'
+    MARGIN = 4
+    
+    def __init__(self, parent, kind, columns=1, item_height=100, gap=16, bg=None, empty_text=None):
+        """
+        Args:
+            parent: Canvas'ın yerleştirileceği widget
+            kind: Kart tipi - 'kpi', 'profit', 'stat' veya 'list'
+            columns: Bir satırdaki kart sayısı
+            item_height: Tek kartın yüksekliği (piksel)
+            gap: Kartlar arası boşluk (piksel)
+            bg: Canvas arka plan rengi
+            empty_text: Öğe yoksa gösterilecek mesaj
+        """
+        colors = DashboardComponents.COLORS
+        
+        self.kind = kind
+        self.columns = max(1, int(columns))
+        self.item_height = item_height
+        self.gap = gap
+        self.bg = bg or colors['bg_secondary']
+        self.empty_text = empty_text
+        self.items = []
+        
+        self._width = 0
+        self._hover_index = None
+        self._card_bg = {}
+        
+        self.canvas = tk.Canvas(parent, bg=self.bg, highlightthickness=0, bd=0, height=item_height)
+        self._schedule_redraw = DashboardComponents.coalesce(self.canvas, self._redraw_if_resized)
+        self.canvas.bind('<Configure>', self._schedule_redraw, add='+')
+        
+        # Tek, paylaşılan hover handler'ı
+        if kind in ('kpi', 'list'):
+            self.canvas.bind('<Motion>', self._on_motion, add='+')
+            self.canvas.bind('<Leave>', self._on_leave, add='+')
+    
+    def set_items(self, items):
+        """Öğeleri değiştir ve yalnızca içerik değiştiyse yeniden çiz"""
+        items = list(items or [])
+        if items == self.items and self.canvas.find_all():
+            return
+        self.items = items
+        self.redraw()
+    
+    def required_height(self):
+        """Tüm öğelerin sığması için gereken yükseklik"""
+        if not self.items:
+            return 80 if self.empty_text else 1
+        rows = (len(self.items) + self.columns - 1) // self.columns
+        return rows * self.item_height + (rows - 1) * self.gap + 2 * self.MARGIN
+    
+    def redraw(self):
+        """Tüm kartları mevcut genişliğe göre yeniden çiz"""
+        try:
+            canvas = self.canvas
+            if not canvas.winfo_exists():
+                return
+            
+            canvas.delete('all')
+            self._card_bg = {}
+            self._hover_index = None
+            
+            height = self.required_height()
+            if int(canvas.cget('height')) != height:
+                canvas.configure(height=height)
+            
+            width = self._width or canvas.winfo_width()
+            if width <= 1:
+                # Henüz yerleşim yapılmadı, <Configure> ile çizilecek
+                return
+            
+            if not self.items:
+                if self.empty_text:
+                    canvas.create_text(
+                        width // 2, height // 2,
+                        text=self.empty_text,
+                        font=('Segoe UI', 12),
+                        fill=DashboardComponents.COLORS['text_secondary']
+                    )
+                return
+            
+            usable = width - 2 * self.MARGIN - (self.columns - 1) * self.gap
+            card_width = max(usable // self.columns, 40)
+            
+            draw = getattr(self, f'_draw_{self.kind}')
+            for i, item in enumerate(self.items):
+                row, col = divmod(i, self.columns)
+                x0 = self.MARGIN + col * (card_width + self.gap)
+                y0 = self.MARGIN + row * (self.item_height + self.gap)
+                draw(i, item, x0, y0, card_width, self.item_height)
+                
+        except tk.TclError as e:
+            print(f"Kart çizim hatası: {e}")
+    
+    def _draw_shadow(self, x0, y0, w, h, offset, tag):
+        """Soft gölge - kartın altına kaydırılmış dikdörtgen"""
+        self.canvas.create_rectangle(
+            x0 + offset, y0 + offset, x0 + w + offset, y0 + h + offset,
+            fill=DashboardComponents.COLORS['shadow'], outline='', tags=(tag,)
+        )
+    
+    def _draw_card_bg(self, i, x0, y0, w, h, fill):
+        tag = f'card{i}'
+        bg_id = self.canvas.create_rectangle(
+            x0, y0, x0 + w, y0 + h, fill=fill, outline='', tags=(tag, 'card')
+        )
+        self._card_bg[i] = (bg_id, fill)
+        return tag
+    
+    def _draw_kpi(self, i, item, x0, y0, w, h):
+        colors = DashboardComponents.COLORS
+        canvas = self.canvas
+        
+        self._draw_shadow(x0, y0, w, h - 6, 3, 'shadow')
+        tag = self._draw_card_bg(i, x0, y0, w, h - 6, colors['bg_secondary'])
+        
+        # Icon kutusu
+        canvas.create_rectangle(
+            x0 + 24, y0 + 20, x0 + 74, y0 + 70,
+            fill=item.get('color', colors['primary']), outline='', tags=(tag,)
+        )
+        canvas.create_text(
+            x0 + 49, y0 + 45, text=str(item.get('icon', '')),
+            font=('Segoe UI', 18), fill='white', tags=(tag,)
+        )
+        canvas.create_text(
+            x0 + 24, y0 + 85, text=str(item.get('title', '')), anchor='nw',
+            font=('Segoe UI', 11, 'bold'), fill=colors['text_secondary'], tags=(tag,)
+        )
+        canvas.create_text(
+            x0 + 24, y0 + 108, text=str(item.get('value', '')), anchor='nw',
+            font=('Segoe UI', 16, 'bold'), fill=colors['text_primary'], tags=(tag,)
+        )
+    
+    def _draw_profit(self, i, item, x0, y0, w, h):
+        canvas = self.canvas
+        color = item.get('color', DashboardComponents.COLORS['primary'])
+        center = x0 + w // 2
+        
+        self._draw_shadow(x0, y0, w, h - 6, 3, 'shadow')
+        tag = self._draw_card_bg(i, x0, y0, w, h - 6, color)
+        
+        canvas.create_text(
+            center, y0 + 38, text=str(item.get('icon', '')),
+            font=('Segoe UI', 24), fill='white', tags=(tag,)
+        )
+        canvas.create_text(
+            center, y0 + 76, text=str(item.get('title', '')),
+            font=('Segoe UI', 11, 'bold'), fill='white', tags=(tag,)
+        )
+        canvas.create_text(
+            center, y0 + 104, text=str(item.get('value', '')),
+            font=('Segoe UI', 16, 'bold'), fill='white', tags=(tag,)
+        )
+    
+    def _draw_stat(self, i, item, x0, y0, w, h):
+        colors = DashboardComponents.COLORS
+        canvas = self.canvas
+        center = x0 + w // 2
+        
+        self._draw_shadow(x0, y0, w, h - 4, 2, 'shadow')
+        tag = self._draw_card_bg(i, x0, y0, w, h - 4, '#f8fafc')
+        
+        canvas.create_text(
+            center, y0 + 24, text=str(item.get('title', '')),
+            font=('Segoe UI', 10, 'bold'), fill=colors['text_secondary'], tags=(tag,)
+        )
+        canvas.create_text(
+            center, y0 + 52, text=str(item.get('value', '')),
+            font=('Segoe UI', 14, 'bold'), fill=colors['text_primary'], tags=(tag,)
+        )
+    
+    def _draw_list(self, i, item, x0, y0, w, h):
+        colors = DashboardComponents.COLORS
+        canvas = self.canvas
+        badge_color = item.get('badge_color', colors['primary'])
+        
+        self._draw_shadow(x0, y0, w, h, 1, 'shadow')
+        tag = self._draw_card_bg(i, x0, y0, w, h, colors['bg_secondary'])
+        
+        # Sıra rozeti
+        badge_y = y0 + (h - 30) // 2
+        canvas.create_rectangle(
+            x0 + 15, badge_y, x0 + 45, badge_y + 30,
+            fill=badge_color, outline='', tags=(tag,)
+        )
+        canvas.create_text(
+            x0 + 30, badge_y + 15, text=str(item.get('rank', '')),
+            font=('Segoe UI', 10, 'bold'), fill='white', tags=(tag,)
+        )
+        
+        # Ürün adı ve değer
+        canvas.create_text(
+            x0 + 57, y0 + 8, text=str(item.get('name', '')), anchor='nw',
+            font=('Segoe UI', 10, 'bold'), fill=colors['text_primary'], tags=(tag,)
+        )
+        canvas.create_text(
+            x0 + 57, y0 + 27, text=str(item.get('value', '')), anchor='nw',
+            font=('Segoe UI', 9), fill=item.get('value_color', colors['text_primary']), tags=(tag,)
+        )
+    
+    def _redraw_if_resized(self):
+        """Genişlik değiştiyse yeniden çiz - <Configure> olayları birleştirilmiş olarak gelir"""
+        width = self.canvas.winfo_width()
+        if width != self._width:
+            self._width = width
+            self.redraw()
+    
+    def _card_index_at_cursor(self):
+        for tag in self.canvas.gettags('current'):
+            if tag.startswith('card') and tag[4:].isdigit():
+                return int(tag[4:])
+        return None
+    
+    def _set_hover(self, index):
+        if index == self._hover_index:
+            return
+        try:
+            if self._hover_index in self._card_bg:
+                bg_id, fill = self._card_bg[self._hover_index]
+                self.canvas.itemconfigure(bg_id, fill=fill)
+            if index in self._card_bg:
+                bg_id, _ = self._card_bg[index]
+                self.canvas.itemconfigure(bg_id, fill=self.HOVER_BG)
+            self._hover_index = index
+        except tk.TclError:
+            pass
+    
+    def _on_motion(self, event):
+        self._set_hover(self._card_index_at_cursor())
+    
+    def _on_leave(self, event):
+        self._set_hover(None)
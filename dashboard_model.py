@@ -0,0 +1,151 @@
+# dashboard_model.py - Dashboard Görünüm Modeli
+
+import pandas as pd
+from veri_analizi import VeriAnalizi
+from dashboard_components import DashboardComponents
+from izleme import traced
+from profil import profile_call
+
+
+class DashboardViewModel:
+    """Dashboard'un çizeceği tüm veriyi önceden hesaplayan sınıf
+    
+    Tk çağrısı yapmaz; analiz thread'inde oluşturulup UI thread'ine
+    gönderilir. UI tarafı yalnızca hazır metinleri ve listeleri çizer.
+    """
+    
+    @traced('dashboard')
+    @profile_call('dashboard_model')
+    def __init__(self, df, content_key=None):
+        """
+        Args:
+            df: Pandas DataFrame - Karlılık analizi sonuç verisi
+            content_key: Sonucun anahtarı (KarlilikAnalizi.last_result_key) - aynı
+                         anahtarlı iki model aynı veriden oluşmuştur; bilinmiyorsa None
+        """
+        # DataFrame saklanmaz - model süreçler arası küçük bir paket olarak gider
+        df = df if df is not None and not df.empty else pd.DataFrame()
+        self.colors = DashboardComponents.COLORS
+        self.content_key = content_key
+        
+        # VeriAnalizi nesnesini güvenli şekilde oluştur
+        try:
+            analiz = VeriAnalizi(df)
+        except Exception as e:
+            print(f"VeriAnalizi oluşturma hatası: {e}")
+            analiz = None
+        
+        self.subtitle_text = f"Toplam {len(df)} ürün detaylı analizi"
+        self.kpi_cards = self.build_kpi_cards(analiz)
+        self.profit_cards = self.build_profit_cards(analiz)
+        self.stat_items = self.build_stat_items(analiz)
+        self.build_product_lists(analiz)
+    
+    @traced('dashboard')
+    def build_kpi_cards(self, analiz):
+        """KPI kartlarının (icon, title, value, color) listesi"""
+        # KPI verilerini al - eksik anahtarlar aşağıda varsayılanlara düşer
+        try:
+            kpi_data = analiz.get_kpi_summary() if analiz else {}
+        except Exception as e:
+            print(f"KPI verisi alma hatası: {e}")
+            kpi_data = {}
+        
+        # En karlı ürün adını güvenli şekilde kısalt
+        en_karli_urun_text = str(kpi_data.get('en_karli_urun', 'Veri Yok'))
+        if len(en_karli_urun_text) > 20:
+            en_karli_urun_text = en_karli_urun_text[:20] + "..."
+        
+        return [
+            ("💰", "Toplam Net Kar", f"₺{kpi_data.get('toplam_kar', 0):,.0f}", self.colors['success']),
+            ("🏆", "En Karlı Ürün", en_karli_urun_text, self.colors['primary']),
+            ("📈", "Ortalama Kar", f"₺{kpi_data.get('ortalama_kar', 0):,.0f}", self.colors['warning']),
+            ("📦", "Toplam Ürün", f"{kpi_data.get('toplam_urun', 0)} adet", self.colors['info']),
+            ("✅", "Karlı Ürün", f"{kpi_data.get('pozitif_kar_urun', 0)} adet", self.colors['success']),
+            ("❌", "Zararlı Ürün", f"{kpi_data.get('negatif_kar_urun', 0)} adet", self.colors['danger']),
+            ("🎯", "En Yüksek Kar", f"₺{kpi_data.get('en_karli_urun_kar', 0):,.0f}", '#8b5cf6'),
+            ("📊", "Toplam Satış", f"{kpi_data.get('toplam_satis_miktar', 0):,.0f} adet", self.colors['info'])
+        ]
+    
+    @traced('dashboard')
+    def build_profit_cards(self, analiz):
+        """Kar dağılım kartlarının (icon, title, value, color) listesi"""
+        empty = {'cok_karli': 0, 'orta_karli': 0, 'dusuk_karli': 0, 'zararda': 0}
+        try:
+            dist_data = analiz.get_profit_distribution() if analiz else empty
+        except Exception as e:
+            print(f"Kar dağılımı hatası: {e}")
+            dist_data = empty
+        
+        def urun_text(value):
+            try:
+                return f"{int(value)} ürün"
+            except (ValueError, TypeError):
+                return f"{value} ürün"
+        
+        return [
+            ("📈", "Çok Karlı", urun_text(dist_data.get('cok_karli', 0)), self.colors['success']),
+            ("⚖️", "Orta Karlı", urun_text(dist_data.get('orta_karli', 0)), self.colors['warning']),
+            ("📉", "Düşük Karlı", urun_text(dist_data.get('dusuk_karli', 0)), '#f97316'),
+            ("❌", "Zararda", urun_text(dist_data.get('zararda', 0)), self.colors['danger'])
+        ]
+    
+    @traced('dashboard')
+    def build_stat_items(self, analiz):
+        """İstatistik kartlarının (title, value) öğeleri"""
+        try:
+            stats = analiz.get_summary_stats() if analiz else {}
+        except Exception as e:
+            print(f"İstatistik hatası: {e}")
+            stats = {}
+        
+        stat_items = []
+        for key, value in stats.items():
+            title_text = str(key).replace('_', ' ').title()
+            
+            # Değer - Güvenli formatlama
+            try:
+                if isinstance(value, float):
+                    if 'kar' in str(key).lower():
+                        value_text = f"₺{value:,.2f}"
+                    else:
+                        value_text = f"{value:,.2f}"
+                else:
+                    value_text = f"{value:,}"
+            except (ValueError, TypeError):
+                value_text = str(value)
+            
+            stat_items.append({'title': title_text, 'value': value_text})
+        
+        return stat_items
+    
+    @traced('dashboard')
+    def build_product_lists(self, analiz):
+        """Top-N listelerini yalnızca listelenen satırların görüntüleme metinlerinden oluştur"""
+        try:
+            if analiz:
+                self.miktar_col = analiz.find_miktar_column()
+                top_profitable = analiz.get_display_frame(analiz.get_ranked_index('Net Kar', 10))
+                top_selling = analiz.get_display_frame(analiz.get_ranked_index(self.miktar_col, 10))
+                low_profit = analiz.get_display_frame(analiz.get_ranked_index('Net Kar', 10, ascending=True))
+            else:
+                top_profitable = pd.DataFrame()
+                top_selling = pd.DataFrame()
+                low_profit = pd.DataFrame()
+                self.miktar_col = None
+        except Exception as e:
+            print(f"Top ürünler hatası: {e}")
+            top_profitable = pd.DataFrame()
+            top_selling = pd.DataFrame()
+            low_profit = pd.DataFrame()
+            self.miktar_col = None
+        
+        self.top_profitable_items = DashboardComponents.build_product_list_items(
+            top_profitable, 'net_kar_liste', self.colors['success']
+        )
+        self.top_selling_items = DashboardComponents.build_product_list_items(
+            top_selling, 'miktar_liste', self.colors['info']
+        )
+        self.low_profit_items = DashboardComponents.build_product_list_items(
+            low_profit, 'net_kar_liste', self.colors['danger']
+        )
\ No newline at end of file
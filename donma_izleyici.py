@@ -0,0 +1,205 @@
+# donma_izleyici.py - Tk ana thread'i için donma (stall) izleyicisi
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from datetime import datetime
+
+
+WATCHDOG_ENV = 'KARLILIK_WATCHDOG'
+
+# Kalp atışı aralığı (ms) - olay döngüsü gecikmesi bu zamanlayıcının kayması ile ölçülür
+HEARTBEAT_MS = 200
+
+# Ana thread bu süreden uzun yanıt vermezse yığını yakalanır (saniye)
+STALL_THRESHOLD = 0.25
+
+# İzleyici thread'in kontrol aralığı (saniye)
+CHECK_INTERVAL = 0.05
+
+# Gecikme histogramı kovaları (ms) - son kova üst sınırsız
+HISTOGRAM_BUCKETS_MS = [16, 50, 100, 250, 500, 1000, 2000]
+
+# Native dosya/mesaj diyalogları Tk zamanlayıcılarını durdurur - bunlar donma sayılmaz
+DIALOG_MODULES = ('filedialog.py', 'commondialog.py', 'messagebox.py', 'simpledialog.py')
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+enabled = os.environ.get(WATCHDOG_ENV, '1').strip() not in ('0', 'false', 'hayir', 'hayır')
+
+
+def bucket_labels():
+    """Histogram kovalarının etiketleri: '<16 ms', '16-50 ms', ..., '≥2000 ms'"""
+    labels = [f"<{HISTOGRAM_BUCKETS_MS[0]} ms"]
+    for low, high in zip(HISTOGRAM_BUCKETS_MS, HISTOGRAM_BUCKETS_MS[1:]):
+        labels.append(f"{low}-{high} ms")
+    labels.append(f"≥{HISTOGRAM_BUCKETS_MS[-1]} ms")
+    return labels
+
+
+class StallWatchdog:
+    """Tk olay döngüsü gecikmesini ölçen ve donmalarda yığın yakalayan izleyici
+    
+    Ana thread after() ile düzenli kalp atışı planlar; her atışın gecikmesi
+    histograma yazılır. Ayrı bir thread son atıştan bu yana geçen süreyi
+    izler ve eşik aşılınca ana thread'in yığınını sys._current_frames() ile
+    yakalar. İzleyici thread Tk'ye hiç dokunmaz: rapor sink'e (dosya) hemen
+    yazılır, arayüz bildirimi ise döngü toparlanınca kalp atışında yapılır.
+    """
+    
+    def __init__(self, root, report_callback=None, sink=None,
+                 interval_ms=HEARTBEAT_MS, threshold=STALL_THRESHOLD):
+        """
+        Args:
+            root: Tk kök penceresi
+            report_callback: Ana thread'de donma raporu alan fonksiyon
+            sink: İzleyici thread'den çağrılan thread-safe (message, msg_type) yazıcı
+            interval_ms: Kalp atışı aralığı
+            threshold: Donma eşiği (saniye)
+        """
+        self.root = root
+        self.report_callback = report_callback
+        self.sink = sink
+        self.interval = interval_ms / 1000
+        self.threshold = threshold
+        
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.stall_locations = Counter()
+        self.max_latency = 0.0
+        self.beats = 0
+        
+        self._lock = threading.Lock()
+        self._pending_reports = []
+        self._last_beat = None
+        self._stall_reported = False
+        self._main_thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._job = None
+    
+    def start(self):
+        """Ana thread'den çağrılmalı"""
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._job = self.root.after(int(self.interval * 1000), self._beat)
+        self._thread = threading.Thread(target=self._watch, name="DonmaIzleyici", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """İzlemeyi durdur"""
+        self._stop.set()
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+    
+    def _beat(self):
+        """Ana thread kalp atışı - gecikmeyi kaydet, bekleyen raporları ilet"""
+        now = time.perf_counter()
+        latency = max(now - self._last_beat - self.interval, 0.0)
+        
+        with self._lock:
+            self._last_beat = now
+            self._stall_reported = False
+            self.beats += 1
+            self.max_latency = max(self.max_latency, latency)
+            self.histogram[self._bucket(latency * 1000)] += 1
+            reports, self._pending_reports = self._pending_reports, []
+        
+        for report in reports:
+            # Yakalanan andan sonraki toplam donma süresi de rapora eklenir
+            report['total_seconds'] = latency
+            if self.report_callback:
+                try:
+                    self.report_callback(report)
+                except Exception as e:
+                    print(f"Donma raporu hatası: {e}")
+        
+        if not self._stop.is_set():
+            self._job = self.root.after(int(self.interval * 1000), self._beat)
+    
+    @staticmethod
+    def _bucket(latency_ms):
+        for index, limit in enumerate(HISTOGRAM_BUCKETS_MS):
+            if latency_ms < limit:
+                return index
+        return len(HISTOGRAM_BUCKETS_MS)
+    
+    def _watch(self):
+        """İzleyici thread - eşik aşılınca ana thread yığınını yakala"""
+        while not self._stop.wait(CHECK_INTERVAL):
+            with self._lock:
+                lag = time.perf_counter() - self._last_beat - self.interval
+                if lag < self.threshold or self._stall_reported:
+                    continue
+                self._stall_reported = True
+            
+            report = self.capture(lag)
+            if report is None:
+                continue
+            
+            with self._lock:
+                self.stall_locations[report['location']] += 1
+                self._pending_reports.append(report)
+            
+            # Arayüz hiç toparlanmazsa bile iz kalsın diye hemen dosyaya yazılır
+            if self.sink is not None:
+                try:
+                    self.sink([(self.format_report(report, full_stack=True), 'warning')])
+                except Exception as e:
+                    print(f"Donma kaydı yazılamadı: {e}")
+    
+    def capture(self, lag):
+        """Ana thread'in yığınını yakala - diyalog beklemesiyse None"""
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return None
+        
+        stack = traceback.extract_stack(frame)
+        del frame
+        
+        if any(os.path.basename(entry.filename) in DIALOG_MODULES for entry in stack):
+            return None
+        
+        # Donmaya yol açan en içteki uygulama satırı (gui.py, analiz_dashboard.py ...)
+        location = "bilinmiyor"
+        for entry in reversed(stack):
+            if os.path.dirname(os.path.abspath(entry.filename)) == APP_DIR:
+                location = f"{os.path.basename(entry.filename)}:{entry.lineno} {entry.name}"
+                break
+        
+        return {
+            'time': datetime.now(),
+            'lag_seconds': lag,
+            'location': location,
+            'stack': traceback.format_list(stack)
+        }
+    
+    @staticmethod
+    def format_report(report, full_stack=False, app_frames=6):
+        """Donma raporunu log metnine çevir"""
+        duration = report.get('total_seconds') or report['lag_seconds']
+        lines = [f"⚠ Arayüz {duration * 1000:.0f} ms dondu "
+                 f"({report['time'].strftime('%H:%M:%S.%f')[:-3]}) - {report['location']}"]
+        
+        frames = report['stack']
+        if not full_stack:
+            frames = [entry for entry in frames if APP_DIR in entry][-app_frames:]
+        lines.extend(entry.rstrip() for entry in frames)
+        return "\n".join(lines)
+    
+    def snapshot(self):
+        """Histogram ve donma konumlarının kopyası"""
+        with self._lock:
+            return {
+                'labels': bucket_labels(),
+                'counts': list(self.histogram),
+                'beats': self.beats,
+                'max_latency_ms': self.max_latency * 1000,
+                'locations': self.stall_locations.most_common()
+            }
@@ -0,0 +1,24 @@
+# girdi_onbellegi.py - Girdi dosyası türleri ve önbellek anahtarları için dosya parmak izleri
+
+import os
+
+
+# Girdi türleri ve log metinlerindeki adları
+INPUT_KINDS = ('karlilik', 'iskonto')
+INPUT_LABELS = {
+    'karlilik': "Karlılık dosyası",
+    'iskonto': "İskonto raporu"
+}
+
+
+def file_fingerprint(path):
+    """Dosyanın değişip değişmediğini anlamak için (tam yol, boyut, değişiklik zamanı)
+    
+    Dosya yoksa veya okunamıyorsa None döner.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
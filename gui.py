@@ -1,9 +1,36 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox, simpledialog
+import multiprocessing
 import threading
 import queue
+import time
 from datetime import datetime
-from karlilik import KarlilikAnalizi
+from analiz_worker import AnalizWorker
+from log_gecmisi import LogHistory, MAX_VIEW_LINES, TRIM_SLACK_LINES
+from ilerleme import RateEstimator, format_progress_detail
+import izleme
+import profil
+import donma_izleyici
+from donma_izleyici import StallWatchdog
+from on_yukleme import ModulePreloader
+from girdi_onbellegi import INPUT_KINDS, INPUT_LABELS
+from son_dosyalar import RecentPairs
+
+# Kuyrukta olay biriktiğinde UI thread'ini uyandıran sanal olay
+QUEUE_EVENT = '<<KuyrukHazir>>'
+
+# İlerleme çubuğu en fazla ekran yenileme hızında güncellenir (ms)
+PROGRESS_INTERVAL_MS = 16
+
+# Uyandırma kaybolursa diye yalnızca analiz sürerken yapılan seyrek kontrol (ms)
+SAFETY_POLL_MS = 500
+
+LOG_ICONS = {
+    'success': '✅',
+    'error': '❌', 
+    'warning': '⚠️',
+    'info': 'ℹ️'
+}
 
 class BupilicKarlilikGUI:
     def __init__(self):
@@ -13,9 +40,30 @@ class BupilicKarlilikGUI:
         self.root.configure(bg='#f8f9fa')
         self.root.resizable(True, True)
         
-        # Thread-safe iletişim için queue
+        # Thread-safe iletişim için queue - boşaltma olayla tetiklenir, polling yapılmaz
         self.result_queue = queue.Queue()
         self.is_processing = False
+        self._drain_lock = threading.Lock()
+        self._drain_pending = False
+        self._safety_job = None
+        
+        # Log penceresi son MAX_VIEW_LINES satırı tutar, tüm geçmiş dosyaya yazılır
+        self.log_history = LogHistory()
+        self.history_search_var = tk.StringVar()
+        
+        # Hız sınırlı ilerleme güncellemesi
+        self._pending_progress = None
+        self._progress_job = None
+        self._last_progress_time = 0.0
+        
+        # Satır hızı ve kalan süre tahmini
+        self.rate_estimator = RateEstimator()
+        
+        # KARLILIK_TRACE açıksa arayüz aralıkları işçininkilerle aynı dosyaya yazılır
+        izleme.set_process_name("Arayüz")
+        
+        # KARLILIK_PROFILE açıksa analiz ve dashboard kurulumu profillenir
+        profil.set_log_callback(self.thread_safe_log_message)
         
         # Modern stil
         self.setup_style()
@@ -25,76 +73,211 @@ class BupilicKarlilikGUI:
         self.iskonto_path = tk.StringVar()
         self.progress_var = tk.DoubleVar()
         
-        # Karlılık analizi objesi
-        self.analiz = KarlilikAnalizi(
-            progress_callback=self.thread_safe_update_progress,
-            log_callback=self.thread_safe_log_message
-        )
+        # Karlılık analizi ayrı süreçte çalışır - pandas işleri Tk döngüsünü durdurmaz
+        self.worker = AnalizWorker(event_callback=self.thread_safe_worker_event)
         
-        # Dashboard için analiz sonucu
+        # Dashboard için analiz sonucu ve arka planda hazırlanan görünüm modeli
         self.analiz_sonucu = None
+        self.dashboard_view_model = None
+        
+        # Sonucun eşlendiği paylaşımlı bellek - dashboard yenisine geçince bırakılır
+        self.shared_result = None
         
         # Dashboard referansı
         self.dashboard = None
         
+        # Son analiz edilen dosya çiftleri - en yenisi açılışta arka planda hazırlanır
+        self.recent_pairs = RecentPairs()
+        self.analysis_pair = None
+        
         self.setup_ui()
         
-        # Queue kontrol timer'ı başlat
-        self.check_queue()
+        # Kuyruk olayla boşaltılır - boştayken hiç uyanılmaz
+        self.root.bind(QUEUE_EVENT, lambda e: self.check_queue())
+        
+        # Ana thread donmalarını yakala - tek periyodik zamanlayıcı budur
+        # (KARLILIK_WATCHDOG=0 ile kapatılır)
+        self.watchdog = None
+        if donma_izleyici.enabled:
+            self.watchdog = StallWatchdog(
+                self.root,
+                report_callback=self.on_ui_stall,
+                sink=self.log_history.write
+            )
+            self.watchdog.start()
         
-    def thread_safe_update_progress(self, value, status):
+        # numpy/pandas ve dashboard modülleri pencere açıldıktan sonra arka planda
+        # yüklenir; setup_ui'nin çizim işleri boşta çalışır, bu onlardan sonra gelir
+        self.waiting_for_modules = False
+        self.preloader = ModulePreloader(on_done=lambda info: self.post_event('modules_ready', info))
+        self.root.after_idle(self.preloader.start)
+    
+    def thread_safe_update_progress(self, value, status, detail=None):
         """Thread-safe progress güncelleme"""
-        self.result_queue.put(('progress', {'value': value, 'status': status}))
+        self.post_event('progress', {'value': value, 'status': status, 'detail': detail})
     
     def thread_safe_log_message(self, message, msg_type='info'):
         """Thread-safe log mesajı"""
-        self.result_queue.put(('log', {'message': message, 'type': msg_type}))
+        self.post_event('log', {'message': message, 'type': msg_type})
+    
+    def thread_safe_worker_event(self, message_type, data):
+        """İşçi sürecinden gelen olayı queue'ya aktar"""
+        self.post_event(message_type, data)
+    
+    def post_event(self, message_type, data):
+        """Olayı queue'ya koy ve gerekirse UI thread'ini uyandır
+        
+        Bekleyen bir uyandırma varsa yenisi gönderilmez; UI o uyandırmada
+        kuyruktaki her şeyi birlikte işler.
+        """
+        self.result_queue.put((message_type, data))
         
+        with self._drain_lock:
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        
+        try:
+            self.root.event_generate(QUEUE_EVENT, when='tail')
+        except (RuntimeError, tk.TclError):
+            # Tcl thread desteği yoksa veya pencere kapanıyorsa yedek kontrol boşaltır
+            with self._drain_lock:
+                self._drain_pending = False
+    
     def check_queue(self):
-        """Thread'den gelen mesajları kontrol et"""
+        """Kuyruktaki tüm olayları bir seferde işle - ardışık loglar tek insert ile yazılır"""
+        with self._drain_lock:
+            self._drain_pending = False
+        
+        log_batch = []
         try:
             while True:
                 message_type, data = self.result_queue.get_nowait()
                 
+                if message_type == 'log':
+                    log_batch.append((data['message'], data.get('type', 'info')))
+                    continue
+                if message_type == 'progress':
+                    # İptalden önce kuyruğa girmiş ilerlemeler boştaki arayüzü bozmasın
+                    if self.is_processing:
+                        self.schedule_progress(data['value'], data['status'], data.get('detail'))
+                    continue
+                
+                # Sıra korunur - durum değişikliğinden önce biriken loglar yazılır
+                if log_batch:
+                    self.log_messages(log_batch)
+                    log_batch = []
+                
                 if message_type == 'analysis_complete':
                     self.on_analysis_complete(data)
                 elif message_type == 'analysis_error':
                     self.on_analysis_error(data)
                 elif message_type == 'analysis_cancelled':
                     self.on_analysis_cancelled()
-                elif message_type == 'progress':
-                    self.update_progress(data['value'], data['status'])
-                elif message_type == 'log':
-                    self.log_message(data['message'], data.get('type', 'info'))
-                    
+                elif message_type == 'worker_ask':
+                    self.on_worker_ask(data)
+                elif message_type == 'history_search':
+                    self.show_history_results(data)
+                elif message_type == 'performance_report':
+                    self.show_performance_report(data)
+                elif message_type == 'trace_events':
+                    izleme.add_events(data)
+                elif message_type == 'modules_ready':
+                    self.on_modules_ready(data)
+                elif message_type == 'input_prepared':
+                    self.on_input_prepared(data)
+                elif message_type == 'input_prepare_failed':
+                    self.on_input_prepare_failed(data)
+        
         except queue.Empty:
             pass
         except Exception as e:
             print(f"Queue kontrol hatası: {e}")
         
-        # 100ms sonra tekrar kontrol et
-        if not getattr(self, '_closing', False):
-            self.root.after(100, self.check_queue)
+        if log_batch:
+            self.log_messages(log_batch)
+    
+    def safety_poll(self):
+        """Analiz sürerken seyrek yedek kontrol - boştayken kendini durdurur"""
+        self._safety_job = None
+        if getattr(self, '_closing', False):
+            return
+        
+        self.check_queue()
+        if self.is_processing or self.worker.cancelling:
+            self._safety_job = self.root.after(SAFETY_POLL_MS, self.safety_poll)
+    
+    def schedule_progress(self, value, status, detail=None):
+        """İlerlemeyi en fazla PROGRESS_INTERVAL_MS'de bir uygula - aradakiler birleştirilir"""
+        self._pending_progress = (value, status, detail)
+        if self._progress_job is not None:
+            return
+        
+        elapsed_ms = (time.perf_counter() - self._last_progress_time) * 1000
+        delay = int(PROGRESS_INTERVAL_MS - elapsed_ms)
+        if delay <= 0:
+            self.flush_progress()
+        else:
+            self._progress_job = self.root.after(delay, self.flush_progress)
+    
+    def flush_progress(self):
+        """Bekleyen son ilerleme değerini uygula"""
+        self._progress_job = None
+        pending, self._pending_progress = self._pending_progress, None
+        
+        if pending is not None and self.is_processing:
+            self.update_progress(*pending)
+            self._last_progress_time = time.perf_counter()
     
     def on_analysis_complete(self, result_data):
         """Analiz tamamlandığında çağrılır"""
         self.is_processing = False
-        self.analiz_sonucu = result_data
+        self.analiz_sonucu = result_data['df']
+        self.dashboard_view_model = result_data.get('view_model')
+        previous_shared = self.shared_result
+        self.shared_result = result_data.get('shared')
         
         self.log_message("✓ Karlılık analizi başarıyla tamamlandı!", 'success')
         
+        if self.analysis_pair is not None:
+            self.recent_pairs.remember(*self.analysis_pair)
+        
         # Dashboard sekmesini oluştur
         self.create_dashboard_tab()
+        self.save_trace()
+        
+        # Dashboard yeni sonuca geçti - önceki sonucun belleğini bırak
+        self.release_shared_result(previous_shared)
         
         # Başarı mesajı
-        self.root.after(0, lambda: messagebox.showinfo(
-            "Başarılı! 🎉",
-            "Karlılık analizi tamamlandı!\nSonuç dosyası başarıyla kaydedildi.\n\n📊 Dashboard sekmesinde detaylı analizi görebilirsiniz."
-        ))
+        if result_data.get('from_cache'):
+            message = "Bu dosyalar daha önce analiz edilmiş, kayıtlı sonuç kullanıldı.\n\n📊 Dashboard sekmesinde detaylı analizi görebilirsiniz."
+        else:
+            message = "Karlılık analizi tamamlandı!\nSonuç dosyası başarıyla kaydedildi.\n\n📊 Dashboard sekmesinde detaylı analizi görebilirsiniz."
+        self.root.after(0, lambda: messagebox.showinfo("Başarılı! 🎉", message))
         
         # Buton aktive et
         self.reset_process_button()
     
+    def save_trace(self):
+        """İz açıksa işçi ve arayüz aralıklarını Chrome trace dosyasına yaz"""
+        if not izleme.enabled:
+            return
+        try:
+            path = izleme.write()
+            self.log_message(f"🔬 İz dosyası güncellendi: {path}", 'info')
+        except Exception as e:
+            print(f"İz dosyası yazma hatası: {e}")
+    
+    def release_shared_result(self, shared):
+        """Artık kullanılmayan paylaşımlı bellek bloklarını serbest bırak"""
+        if shared is None:
+            return
+        try:
+            shared.release()
+        except Exception as e:
+            print(f"Paylaşımlı bellek bırakma hatası: {e}")
+    
     def on_analysis_error(self, error_msg):
         """Analiz hatası oluştuğunda çağrılır"""
         self.is_processing = False
@@ -117,6 +300,26 @@ class BupilicKarlilikGUI:
         # Buton aktive et
         self.reset_process_button()
     
+    def on_worker_ask(self, request):
+        """İşçi sürecinin istediği diyaloğu aç ve cevabı geri gönder"""
+        value = None
+        try:
+            if not self.is_processing:
+                # İptal edilmiş analizin bekleyen sorusu - diyalog açılmaz
+                pass
+            elif request.get('kind') == 'column':
+                value = simpledialog.askstring(request.get('title', ''), request.get('prompt', ''), parent=self.root)
+            elif request.get('kind') == 'save_path':
+                value = filedialog.asksaveasfilename(
+                    title="Karlılık Analizi Sonuçlarını Kaydet",
+                    defaultextension=".xlsx",
+                    filetypes=[("Excel dosyaları", "*.xlsx")]
+                )
+        except tk.TclError as e:
+            print(f"Diyalog hatası: {e}")
+        finally:
+            self.worker.answer(request.get('request_id'), value)
+    
     def reset_process_button(self):
         """Process butonunu varsayılan haline getir"""
         try:
@@ -126,10 +329,20 @@ class BupilicKarlilikGUI:
                 bg='#fd7e14',
                 cursor='hand2'
             )
+            self.cancel_btn.config(state='disabled', cursor='arrow')
         except tk.TclError:
             # Widget yoksa veya destroy edilmişse
             pass
+    
+    def cancel_analysis(self):
+        """Çalışan analizi iptal et - arayüz işçiyi beklemeden boşa alınır"""
+        if not self.is_processing:
+            return
         
+        if self.worker.cancel():
+            self.log_message("⏹ Analiz iptal ediliyor...", 'warning')
+        self.on_analysis_cancelled()
+    
     def setup_style(self):
         style = ttk.Style()
         try:
@@ -170,7 +383,7 @@ class BupilicKarlilikGUI:
             relief='flat',
             borderwidth=1
         )
-        
+    
     def setup_ui(self):
         # Ana container
         main_container = tk.Frame(self.root, bg='#f8f9fa')
@@ -189,7 +402,7 @@ class BupilicKarlilikGUI:
         
         # Ana sekme içeriği
         self.setup_main_tab()
-        
+    
     def create_header(self, parent):
         header_frame = tk.Frame(parent, bg='#f8f9fa')
         header_frame.pack(fill='x', pady=(0, 10))
@@ -222,7 +435,7 @@ class BupilicKarlilikGUI:
         
         title_canvas.bind('<Configure>', resize_canvas)
         self.root.after(100, draw_header)
-        
+    
     def setup_main_tab(self):
         # Ana container
         content_frame = tk.Frame(self.main_tab, bg='#f8f9fa')
@@ -243,7 +456,7 @@ class BupilicKarlilikGUI:
         
         # Sağ panel içeriği
         self.create_right_panel(right_frame)
-        
+    
     def create_left_panel(self, parent):
         # Panel başlığı
         panel_header = tk.Frame(parent, bg='#007acc', height=50)
@@ -270,7 +483,7 @@ class BupilicKarlilikGUI:
         
         # Progress bölümü
         self.create_progress_section(content)
-        
+    
     def create_file_section(self, parent):
         # Karlılık dosyası
         karlilik_section = tk.LabelFrame(
@@ -336,7 +549,7 @@ class BupilicKarlilikGUI:
             relief='groove',
             bd=2
         )
-        iskonto_section.pack(fill='x', pady=(0, 30))
+        iskonto_section.pack(fill='x', pady=(0, 10))
         
         # Dosya yolu gösterimi
         path_frame2 = tk.Frame(iskonto_section, bg='#ffffff')
@@ -380,6 +593,23 @@ class BupilicKarlilikGUI:
         iskonto_btn.bind("<Enter>", on_enter2)
         iskonto_btn.bind("<Leave>", on_leave2)
         
+        # Son kullanılan dosya çiftleri - menü açılırken güncellenir
+        self.recent_btn = tk.Menubutton(
+            parent,
+            text="🕘 Son Kullanılan Dosyalar",
+            font=('Segoe UI', 10),
+            bg='#e9ecef',
+            fg='#2c3e50',
+            activebackground='#dee2e6',
+            relief='flat',
+            cursor='hand2',
+            padx=20,
+            pady=8
+        )
+        self.recent_menu = tk.Menu(self.recent_btn, tearoff=0, postcommand=self.refresh_recent_menu)
+        self.recent_btn.config(menu=self.recent_menu)
+        self.recent_btn.pack(fill='x', pady=(0, 30))
+    
     def create_action_button(self, parent):
         button_frame = tk.Frame(parent, bg='#ffffff')
         button_frame.pack(fill='x', pady=(0, 30))
@@ -398,6 +628,22 @@ class BupilicKarlilikGUI:
         )
         self.process_btn.pack(fill='x')
         
+        self.cancel_btn = tk.Button(
+            button_frame,
+            text="⏹ İptal Et",
+            command=self.cancel_analysis,
+            bg='#dc3545',
+            fg='white',
+            disabledforeground='#f1f3f5',
+            font=('Segoe UI', 11, 'bold'),
+            relief='flat',
+            bd=0,
+            cursor='arrow',
+            state='disabled',
+            pady=8
+        )
+        self.cancel_btn.pack(fill='x', pady=(8, 0))
+        
         # Hover efektleri
         def on_enter_process(e):
             if not self.is_processing and self.process_btn['state'] != 'disabled':
@@ -408,7 +654,7 @@ class BupilicKarlilikGUI:
         
         self.process_btn.bind("<Enter>", on_enter_process)
         self.process_btn.bind("<Leave>", on_leave_process)
-        
+    
     def create_progress_section(self, parent):
         progress_frame = tk.LabelFrame(
             parent, 
@@ -441,7 +687,7 @@ class BupilicKarlilikGUI:
             anchor='w'
         )
         self.status_label.pack(anchor='w')
-        
+    
     def create_right_panel(self, parent):
         # Panel başlığı
         panel_header = tk.Frame(parent, bg='#007acc', height=50)
@@ -460,6 +706,44 @@ class BupilicKarlilikGUI:
         log_frame = tk.Frame(parent, bg='#ffffff')
         log_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
+        # Geçmiş arama - pencereden düşen satırlar dahil tüm log dosyasında arar
+        search_frame = tk.Frame(log_frame, bg='#ffffff')
+        search_frame.pack(fill='x', pady=(0, 10))
+        
+        search_entry = tk.Entry(
+            search_frame,
+            textvariable=self.history_search_var,
+            font=('Segoe UI', 10),
+            relief='solid',
+            bd=1
+        )
+        search_entry.pack(side='left', fill='x', expand=True, ipady=4)
+        search_entry.bind('<Return>', lambda e: self.search_history())
+        
+        tk.Button(
+            search_frame,
+            text="🔍 Geçmişte Ara",
+            command=self.search_history,
+            font=('Segoe UI', 9, 'bold'),
+            bg='#007acc',
+            fg='white',
+            relief='flat',
+            padx=12,
+            cursor='hand2'
+        ).pack(side='right', padx=(10, 0))
+        
+        tk.Button(
+            search_frame,
+            text="⏲ Donmalar",
+            command=self.show_stall_histogram,
+            font=('Segoe UI', 9, 'bold'),
+            bg='#6c757d',
+            fg='white',
+            relief='flat',
+            padx=12,
+            cursor='hand2'
+        ).pack(side='right', padx=(10, 0))
+        
         # Scrollable text area
         text_container = tk.Frame(log_frame, bg='#ffffff')
         text_container.pack(fill='both', expand=True)
@@ -482,6 +766,9 @@ class BupilicKarlilikGUI:
         self.result_text.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
+        # Aşama süreleri - varsayılan kapalı, başlığa tıklayınca açılır
+        self.create_performance_panel(log_frame)
+        
         # Başlangıç mesajı
         welcome_msg = """🚀 Bupiliç Karlılık Analizi Sistemine Hoşgeldiniz!
 
@@ -508,89 +795,405 @@ class BupilicKarlilikGUI:
         self.result_text.tag_config('error', foreground='#e74c3c', font=('Consolas', 10, 'bold'))
         self.result_text.tag_config('warning', foreground='#f39c12', font=('Consolas', 10, 'bold'))
         self.result_text.tag_config('info', foreground='#3498db', font=('Consolas', 10))
+    
+    def create_performance_panel(self, parent):
+        """Son analizin aşama ölçümlerini gösteren katlanabilir panel"""
+        panel = tk.Frame(parent, bg='#ffffff')
+        panel.pack(fill='x', pady=(10, 0))
+        
+        self.performance_expanded = False
+        self.performance_toggle = tk.Button(
+            panel,
+            text="▸ ⏱ Aşama Süreleri",
+            command=self.toggle_performance_panel,
+            font=('Segoe UI', 10, 'bold'),
+            fg='#2c3e50',
+            bg='#ffffff',
+            activebackground='#f8f9fa',
+            relief='flat',
+            anchor='w',
+            cursor='hand2'
+        )
+        self.performance_toggle.pack(fill='x')
+        
+        self.performance_body = tk.Frame(panel, bg='#ffffff')
+        
+        columns = ('sure', 'cpu', 'girdi', 'cikti', 'bellek')
+        self.performance_tree = ttk.Treeview(
+            self.performance_body,
+            columns=columns,
+            height=10
+        )
+        self.performance_tree.heading('#0', text="Aşama")
+        self.performance_tree.column('#0', width=170, anchor='w')
+        headings = {
+            'sure': "Süre (sn)",
+            'cpu': "CPU (sn)",
+            'girdi': "Girdi Satır",
+            'cikti': "Çıktı Satır",
+            'bellek': "Tepe Bellek (MB)"
+        }
+        for column in columns:
+            self.performance_tree.heading(column, text=headings[column])
+            self.performance_tree.column(column, width=95, anchor='e')
+        self.performance_tree.pack(fill='x')
+        
+        self.performance_summary = tk.Label(
+            self.performance_body,
+            text="Henüz ölçüm yok - bir analiz çalıştırın",
+            font=('Segoe UI', 9),
+            fg='#666666',
+            bg='#ffffff',
+            anchor='w'
+        )
+        self.performance_summary.pack(fill='x', pady=(5, 0))
+    
+    def toggle_performance_panel(self):
+        """Aşama süreleri panelini aç/kapat"""
+        self.performance_expanded = not self.performance_expanded
+        if self.performance_expanded:
+            self.performance_body.pack(fill='x', pady=(5, 0))
+            self.performance_toggle.config(text="▾ ⏱ Aşama Süreleri")
+        else:
+            self.performance_body.pack_forget()
+            self.performance_toggle.config(text="▸ ⏱ Aşama Süreleri")
+    
+    def show_performance_report(self, report):
+        """Performans raporunu panele yaz"""
+        def fmt_rows(value):
+            return "-" if value is None else f"{value:,}"
         
+        def fmt_mb(value):
+            return "-" if value is None else f"{value:.1f}"
+        
+        try:
+            self.performance_tree.delete(*self.performance_tree.get_children())
+            for stage in report.get('stages', []):
+                name = stage['name'] if stage.get('status') == 'ok' else f"{stage['name']} ({stage['status']})"
+                self.performance_tree.insert('', 'end', text=name, values=(
+                    f"{stage['wall_seconds']:.2f}",
+                    f"{stage['cpu_seconds']:.2f}",
+                    fmt_rows(stage.get('rows_in')),
+                    fmt_rows(stage.get('rows_out')),
+                    fmt_mb(stage.get('peak_mb'))
+                ))
+            
+            outcome_labels = {
+                'tamamlandi': "tamamlandı",
+                'iptal': "iptal edildi",
+                'hata': "hata",
+                'durduruldu': "durduruldu"
+            }
+            summary = (f"Toplam {report['total_wall_seconds']:.2f} sn, "
+                       f"CPU {report['total_cpu_seconds']:.2f} sn - "
+                       f"{outcome_labels.get(report.get('outcome'), report.get('outcome'))}")
+            if report.get('peak_mb') is not None:
+                summary += f", tepe bellek {report['peak_mb']:.1f} MB"
+            self.performance_summary.config(text=summary)
+        except (tk.TclError, KeyError) as e:
+            print(f"Performans paneli hatası: {e}")
+    
     def select_karlilik_file(self):
         filename = filedialog.askopenfilename(
             title="Karlılık Analizi Dosyasını Seçin",
             filetypes=[("Excel dosyaları", "*.xlsx *.xls"), ("Tüm dosyalar", "*.*")]
         )
         if filename:
-            self.karlilik_path.set(filename)
-            import os
-            
-            # Display dosya bilgilerini güncelle
-            try:
-                self.karlilik_display.config(state='normal')
-                self.karlilik_display.delete('1.0', 'end')
-                self.karlilik_display.insert('1.0', f"✅ Seçilen dosya:\n{os.path.basename(filename)}\n\n📍 Tam yol: {filename}")
-                self.karlilik_display.config(state='disabled')
-                
-                self.log_message(f"✓ Karlılık dosyası seçildi: {os.path.basename(filename)}", 'success')
-            except tk.TclError as e:
-                print(f"Dosya görüntüleme hatası: {e}")
-            
+            self.set_selected_file('karlilik', filename)
+            self.prepare_input('karlilik', filename)
+    
     def select_iskonto_file(self):
         filename = filedialog.askopenfilename(
             title="Bupiliç İskonto Raporu Dosyasını Seçin",
             filetypes=[("Excel dosyaları", "*.xlsx *.xls"), ("Tüm dosyalar", "*.*")]
         )
         if filename:
-            self.iskonto_path.set(filename)
-            import os
+            self.set_selected_file('iskonto', filename)
+            self.prepare_input('iskonto', filename)
+    
+    def set_selected_file(self, kind, filename):
+        """Seçilen dosyayı yol değişkenine ve dosya kutusuna yaz"""
+        import os
+        
+        if kind == 'karlilik':
+            path_var, display = self.karlilik_path, self.karlilik_display
+        else:
+            path_var, display = self.iskonto_path, self.iskonto_display
+        path_var.set(filename)
+        
+        # Display dosya bilgilerini güncelle
+        try:
+            display.config(state='normal')
+            display.delete('1.0', 'end')
+            display.insert('1.0', f"✅ Seçilen dosya:\n{os.path.basename(filename)}\n\n📍 Tam yol: {filename}")
+            display.config(state='disabled')
             
-            # Display dosya bilgilerini güncelle
-            try:
-                self.iskonto_display.config(state='normal')
-                self.iskonto_display.delete('1.0', 'end')
-                self.iskonto_display.insert('1.0', f"✅ Seçilen dosya:\n{os.path.basename(filename)}\n\n📍 Tam yol: {filename}")
-                self.iskonto_display.config(state='disabled')
-                
-                self.log_message(f"✓ İskonto dosyası seçildi: {os.path.basename(filename)}", 'success')
-            except tk.TclError as e:
-                print(f"Dosya görüntüleme hatası: {e}")
+            self.log_message(f"✓ {INPUT_LABELS[kind]} seçildi: {os.path.basename(filename)}", 'success')
+        except tk.TclError as e:
+            print(f"Dosya görüntüleme hatası: {e}")
+    
+    def refresh_recent_menu(self):
+        """Son kullanılan çiftler menüsünü yeniden doldur - değişmiş dosyalar işaretlenir"""
+        try:
+            self.recent_menu.delete(0, 'end')
+            if not self.recent_pairs.pairs:
+                self.recent_menu.add_command(label="Henüz analiz edilmiş dosya yok", state='disabled')
+                return
             
+            for pair in self.recent_pairs.pairs:
+                label = self.recent_pairs.label(pair)
+                if not self.recent_pairs.unchanged(pair):
+                    label += "  (değişmiş veya bulunamadı)"
+                self.recent_menu.add_command(label=label, command=lambda p=pair: self.use_recent_pair(p))
+        except tk.TclError as e:
+            print(f"Son dosyalar menüsü hatası: {e}")
+    
+    def use_recent_pair(self, pair, background=False):
+        """Kayıtlı çifti seç ve arka planda hazırlat"""
+        import os
+        
+        missing = [pair[kind] for kind in INPUT_KINDS if not os.path.exists(pair[kind])]
+        if missing:
+            if not background:
+                messagebox.showwarning("Dosya Bulunamadı", "Şu dosyalar artık yok:\n\n" + "\n".join(missing))
+            return
+        
+        # İki dosya da seçildikten sonra hazırlanır - ikinci hazırlık sütunları da çözer
+        for kind in INPUT_KINDS:
+            self.set_selected_file(kind, pair[kind])
+        for kind in INPUT_KINDS:
+            self.prepare_input(kind, pair[kind], background)
+    
+    def prewarm_recent_pair(self):
+        """Açılışta son çift değişmemişse onu seç ve düşük öncelikle hazırla
+        
+        Kullanıcı o arada kendisi dosya seçtiyse hiçbir şey yapılmaz.
+        """
+        if self.karlilik_path.get() or self.iskonto_path.get():
+            return
+        
+        pair = self.recent_pairs.most_recent()
+        if pair is None or not self.recent_pairs.unchanged(pair):
+            return
+        
+        self.log_message("🕘 Son kullanılan dosyalar değişmemiş, tekrar analiz için hazırlanıyor", 'info')
+        self.use_recent_pair(pair, background=True)
+    
+    def selected_path(self, kind):
+        """Girdi türü için seçili dosya yolu"""
+        return self.karlilik_path.get() if kind == 'karlilik' else self.iskonto_path.get()
+    
+    def prepare_input(self, kind, path, background=False):
+        """Seçilen dosyayı analiz beklemeden işçide okut - aynı türün süren okuması iptal edilir"""
+        sources = {other: self.selected_path(other) for other in INPUT_KINDS}
+        sources[kind] = path
+        try:
+            self.worker.prepare_input(kind, sources, background)
+            self.log_message(f"🔄 {INPUT_LABELS[kind]} arka planda hazırlanıyor...", 'info')
+        except Exception as e:
+            print(f"Arka plan hazırlığı başlatılamadı: {e}")
+    
+    def on_input_prepared(self, data):
+        """Arka planda hazırlanan dosya - seçim o arada değiştiyse bildirilmez"""
+        if data.get('path') != self.selected_path(data.get('kind')):
+            return
+        
+        label = INPUT_LABELS.get(data.get('kind'), "Dosya")
+        if data.get('needs_columns'):
+            self.log_message(f"ℹ️ {label} okundu, sütunlar otomatik bulunamadı - analiz başında sorulacak", 'info')
+        else:
+            self.log_message(f"⚡ {label} hazır: {data.get('rows') or 0:,} satır ({data.get('seconds', 0):.1f} sn)", 'success')
+    
+    def on_input_prepare_failed(self, data):
+        """Arka plan hazırlığı başarısız - analiz dosyayı baştan okur"""
+        if data.get('path') != self.selected_path(data.get('kind')):
+            return
+        
+        label = INPUT_LABELS.get(data.get('kind'), "Dosya")
+        self.log_message(f"{label} arka planda hazırlanamadı, analizde yeniden okunacak: {data.get('error')}", 'warning')
+    
     def log_message(self, message, msg_type='info'):
         """Ana thread'de log mesajı"""
+        self.log_messages([(message, msg_type)])
+    
+    def log_messages(self, entries):
+        """Birden çok log satırını tek insert ve tek see ile yaz
+        
+        Args:
+            entries: (message, msg_type) listesi
+        """
+        if not entries:
+            return
+        
+        now = datetime.now()
+        self.log_history.write(entries, now)
+        
         try:
-            self.result_text.config(state='normal')
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            
-            # Icon mapping
-            icons = {
-                'success': '✅',
-                'error': '❌', 
-                'warning': '⚠️',
-                'info': 'ℹ️'
-            }
+            timestamp = now.strftime("%H:%M:%S")
             
-            icon = icons.get(msg_type, 'ℹ️')
-            formatted_message = f"\n[{timestamp}] {icon} {message}"
+            # Text.insert metin/tag çiftlerini tek çağrıda alır
+            insert_args = []
+            for message, msg_type in entries:
+                icon = LOG_ICONS.get(msg_type, 'ℹ️')
+                insert_args.append(f"\n[{timestamp}] {icon} {message}")
+                insert_args.append(msg_type)
             
-            # Insert message
-            start_pos = self.result_text.index('end-1c')
-            self.result_text.insert('end', formatted_message)
-            end_pos = self.result_text.index('end-1c')
+            self.result_text.config(state='normal')
+            self.result_text.insert('end', *insert_args)
             
-            # Apply color tag
-            self.result_text.tag_add(msg_type, start_pos, end_pos)
+            # Pencere sınırı aşınca baştaki satırlar toplu silinir - insert maliyeti sabit kalır
+            line_count = int(self.result_text.index('end-1c').split('.')[0])
+            if line_count > MAX_VIEW_LINES + TRIM_SLACK_LINES:
+                self.result_text.delete('1.0', f'{line_count - MAX_VIEW_LINES + 1}.0')
             
             self.result_text.see('end')
             self.result_text.config(state='disabled')
         except tk.TclError as e:
             print(f"Log mesajı hatası: {e}")
+    
+    def on_ui_stall(self, report):
+        """Toparlanan donmayı log'a yaz - tam yığın zaten geçmiş dosyasında"""
+        message = StallWatchdog.format_report(report)
+        # Geçmiş dosyasına izleyici yazdı; yalnızca pencereye eklenir
+        try:
+            self.result_text.config(state='normal')
+            self.result_text.insert('end', f"\n[{datetime.now().strftime('%H:%M:%S')}] {message}", 'warning')
+            self.result_text.see('end')
+            self.result_text.config(state='disabled')
+        except tk.TclError as e:
+            print(f"Donma log hatası: {e}")
+    
+    def show_stall_histogram(self):
+        """Olay döngüsü gecikme histogramını ve donma konumlarını göster"""
+        if self.watchdog is None:
+            messagebox.showinfo("Bilgi", "Donma izleyici kapalı (KARLILIK_WATCHDOG=0).")
+            return
+        
+        data = self.watchdog.snapshot()
+        total = max(sum(data['counts']), 1)
+        widest = max(data['counts']) or 1
+        
+        lines = [
+            f"Olay döngüsü gecikmesi - {data['beats']} ölçüm, en yüksek {data['max_latency_ms']:.0f} ms",
+            ""
+        ]
+        for label, count in zip(data['labels'], data['counts']):
+            bar = '█' * round(count * 40 / widest)
+            lines.append(f"{label:>12}  {count:>7}  %{count * 100 / total:5.1f}  {bar}")
+        
+        lines.append("")
+        lines.append("Donma konumları (eşik üstü):")
+        if data['locations']:
+            for location, count in data['locations']:
+                lines.append(f"{count:>7}  {location}")
+        else:
+            lines.append("   Donma kaydedilmedi")
+        
+        try:
+            window = tk.Toplevel(self.root)
+            window.title("Arayüz Donma Histogramı")
+            window.geometry("760x420")
+            text = tk.Text(
+                window,
+                font=('Consolas', 10),
+                bg='#2c3e50',
+                fg='#ecf0f1',
+                relief='flat',
+                padx=10,
+                pady=10
+            )
+            text.pack(fill='both', expand=True)
+            text.insert('1.0', "\n".join(lines))
+            text.config(state='disabled')
+        except tk.TclError as e:
+            print(f"Histogram penceresi hatası: {e}")
+    
+    def search_history(self):
+        """Log geçmişinde arka planda ara - sonuç queue üzerinden gelir"""
+        term = self.history_search_var.get().strip()
+        if not term:
+            return
+        
+        if not self.log_history.enabled:
+            messagebox.showwarning("Uyarı", "Log geçmişi dosyası kullanılamıyor!")
+            return
+        
+        def worker():
+            try:
+                matches, total = self.log_history.search(term)
+                self.post_event('history_search', {'term': term, 'matches': matches, 'total': total})
+            except Exception as e:
+                self.post_event('log', {'message': f"Geçmiş araması başarısız: {e}", 'type': 'error'})
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def show_history_results(self, data):
+        """Geçmiş arama sonuçlarını ayrı pencerede göster"""
+        try:
+            window = tk.Toplevel(self.root)
+            window.title(f"Log Geçmişi - '{data['term']}'")
+            window.geometry("900x500")
+            window.configure(bg='#ffffff')
+            
+            shown = len(data['matches'])
+            summary = f"🔍 {data['total']} eşleşme bulundu"
+            if shown < data['total']:
+                summary += f" (en yeni {shown} tanesi gösteriliyor)"
+            tk.Label(
+                window,
+                text=summary,
+                font=('Segoe UI', 10, 'bold'),
+                fg='#2c3e50',
+                bg='#ffffff',
+                anchor='w'
+            ).pack(fill='x', padx=10, pady=(10, 5))
+            
+            container = tk.Frame(window, bg='#ffffff')
+            container.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+            
+            text = tk.Text(
+                container,
+                font=('Consolas', 10),
+                bg='#2c3e50',
+                fg='#ecf0f1',
+                relief='flat',
+                wrap='word',
+                padx=10,
+                pady=10
+            )
+            scrollbar = tk.Scrollbar(container, orient='vertical', command=text.yview)
+            text.configure(yscrollcommand=scrollbar.set)
+            text.pack(side='left', fill='both', expand=True)
+            scrollbar.pack(side='right', fill='y')
+            
+            text.insert('1.0', '\n'.join(data['matches']) if shown else "Eşleşme bulunamadı.")
+            text.see('end')
+            text.config(state='disabled')
+        except tk.TclError as e:
+            print(f"Geçmiş sonuç penceresi hatası: {e}")
+    
+    def update_progress(self, value, status, detail=None):
+        """Ana thread'de progress güncelleme
+        
+        detail (işlenen/toplam satır) gelirse durum satırına satır hızı ve
+        kalan süre tahmini eklenir.
+        """
+        if detail is not None:
+            unit_rate, eta = self.rate_estimator.update(value, detail)
+            extra = format_progress_detail(detail, unit_rate, eta)
+            if extra:
+                status = f"{status}  {extra}"
         
-    def update_progress(self, value, status):
-        """Ana thread'de progress güncelleme"""
         try:
             self.progress_var.set(value)
             self.status_label.config(text=status)
         except tk.TclError as e:
             print(f"Progress güncelleme hatası: {e}")
-        
+    
     def start_analysis(self):
-        if self.is_processing:
+        if self.is_processing or self.waiting_for_modules:
             return  # Zaten işlem devam ediyor
-            
+        
         if not self.karlilik_path.get() or not self.iskonto_path.get():
             messagebox.showwarning(
                 "Eksik Dosya",
@@ -598,7 +1201,14 @@ class BupilicKarlilikGUI:
             )
             return
         
+        # Sonuç aktarımı ve dashboard için gereken modüller yüklenmeden başlanmaz -
+        # yükleme bitince analiz kendiliğinden başlar
+        if not self.preloader.ready:
+            self.wait_for_modules()
+            return
+        
         self.is_processing = True
+        self.rate_estimator.reset()
         
         # Buton deaktive et
         try:
@@ -608,30 +1218,52 @@ class BupilicKarlilikGUI:
                 bg='#6c757d',
                 cursor='arrow'
             )
+            self.cancel_btn.config(state='normal', cursor='hand2')
         except tk.TclError:
             pass
         
-        # Thread'de çalıştır
-        thread = threading.Thread(target=self.run_analysis, daemon=True)
-        thread.start()
+        # Olay bildirimi kaçarsa diye analiz süresince seyrek yedek kontrol
+        if self._safety_job is None:
+            self._safety_job = self.root.after(SAFETY_POLL_MS, self.safety_poll)
         
-    def run_analysis(self):
-        """Thread-safe analiz fonksiyonu"""
+        # İşçi sürecinde çalıştır - sonuç ve ilerleme olayları queue'ya gelir
+        self.analysis_pair = (self.karlilik_path.get(), self.iskonto_path.get())
         try:
-            # Analiz sınıfını çağır - DataFrame döndürür
-            analiz_sonucu = self.analiz.analyze(self.karlilik_path.get(), self.iskonto_path.get())
-            
-            if analiz_sonucu is not None:
-                # Başarılı sonucu queue'ya gönder
-                self.result_queue.put(('analysis_complete', analiz_sonucu))
-            else:
-                # İptal durumu
-                self.result_queue.put(('analysis_cancelled', None))
-                
+            self.worker.start_analysis(*self.analysis_pair)
         except Exception as e:
-            # Hata durumunu queue'ya gönder
-            self.result_queue.put(('analysis_error', str(e)))
+            self.on_analysis_error(f"Analiz süreci başlatılamadı: {e}")
+    
+    def wait_for_modules(self):
+        """Ön yükleme sürerken analiz isteğini beklet"""
+        self.waiting_for_modules = True
+        self.preloader.start()
+        try:
+            self.process_btn.config(
+                state='disabled',
+                text="⏳ Modüller Yükleniyor...",
+                bg='#6c757d',
+                cursor='arrow'
+            )
+        except tk.TclError:
+            pass
+        self.log_message("⏳ Analiz modülleri yükleniyor, bitince analiz başlayacak...", 'info')
+    
+    def on_modules_ready(self, info):
+        """Ön yükleme bitti - bekleyen analiz varsa başlat"""
+        for name, error in info.get('errors', {}).items():
+            self.log_message(f"Modül ön yüklemesi başarısız ({name}): {error}", 'warning')
+        
+        if self.waiting_for_modules:
+            self.waiting_for_modules = False
+            self.reset_process_button()
+            self.start_analysis()
+            return
+        
+        # Pencere ve modüller hazır - sıra son dosyaların ön ısıtmasında
+        self.prewarm_recent_pair()
     
+    @izleme.traced('arayuz')
+    @profil.profile_call('dashboard')
     def create_dashboard_tab(self):
         """Dashboard sekmesini oluştur"""
         try:
@@ -642,23 +1274,33 @@ class BupilicKarlilikGUI:
                 self.log_message("✗ Dashboard için analiz sonucu bulunamadı!", 'error')
                 return
             
-            # Eğer bir önceki dashboard varsa kaldır
+            # Önceki dashboard varsa yerinde güncelle - yeni widget ağacı kurulmaz
             if self.dashboard:
                 try:
-                    # Dashboard sekmesini bul ve kaldır - DÜZELTİLDİ
-                    tab_list = self.notebook.tabs()
-                    for tab_id in tab_list:
-                        try:
-                            if self.notebook.tab(tab_id, "text") == "📊 Analiz Dashboard":
-                                self.notebook.forget(tab_id)
-                                break
-                        except tk.TclError:
-                            continue
+                    dashboard_frame = self.dashboard.get_frame()
+                    if str(dashboard_frame) in self.notebook.tabs():
+                        changed = self.dashboard.update(self.analiz_sonucu, self.dashboard_view_model)
+                        self.notebook.select(dashboard_frame)
+                        
+                        if changed:
+                            self.log_message("✓ Dashboard yeni verilerle güncellendi!", 'success')
+                        else:
+                            self.log_message("ℹ️ Sonuçlar değişmedi, dashboard aynen korundu", 'info')
+                        self.log_message(f"📊 {len(self.analiz_sonucu)} ürün analiz edildi", 'info')
+                        return
                 except tk.TclError:
                     pass
+                
+                # Güncellenemiyorsa eski ağacı tamamen yok et
+                try:
+                    self.notebook.forget(self.dashboard.get_frame())
+                except tk.TclError:
+                    pass
+                self.dashboard.destroy()
+                self.dashboard = None
             
             # Gerçek analiz sonucu ile dashboard oluştur
-            self.dashboard = AnalyzDashboard(self.notebook, self.analiz_sonucu)
+            self.dashboard = AnalyzDashboard(self.notebook, self.analiz_sonucu, self.dashboard_view_model)
             
             # Sekmeyi ekle
             dashboard_frame = self.dashboard.get_frame()
@@ -672,7 +1314,7 @@ class BupilicKarlilikGUI:
             
             self.log_message("✓ Dashboard gerçek verilerle oluşturuldu!", 'success')
             self.log_message(f"📊 {len(self.analiz_sonucu)} ürün analiz edildi", 'info')
-            
+        
         except ImportError as e:
             self.log_message(f"✗ Dashboard modülü bulunamadı: {str(e)}", 'error')
         except Exception as e:
@@ -685,6 +1327,14 @@ class BupilicKarlilikGUI:
             try:
                 self._closing = True
                 self.is_processing = False
+                self.worker.shutdown()
+                self.release_shared_result(self.shared_result)
+                self.shared_result = None
+                if self.watchdog is not None:
+                    self.watchdog.stop()
+                self.log_history.close()
+                if izleme.enabled:
+                    izleme.write()
                 self.root.quit()
                 self.root.destroy()
             except Exception:
@@ -698,5 +1348,7 @@ class BupilicKarlilikGUI:
             on_closing()
 
 if __name__ == "__main__":
+    # PyInstaller exe'sinde işçi süreci başlatılabilmesi için gerekli
+    multiprocessing.freeze_support()
     app = BupilicKarlilikGUI()
     app.run()
\ No newline at end of file
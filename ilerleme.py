@@ -0,0 +1,165 @@
+# ilerleme.py - İş birimlerine (satır) dayalı ilerleme, hız ve kalan süre tahmini
+
+import time
+
+
+# İşçi en fazla bu aralıkla ilerleme gönderir (saniye) - arayüz zaten ekran hızında çizer
+REPORT_INTERVAL = 0.05
+
+# Hız tahmini için örnekler arası en kısa süre (saniye) ve EWMA katsayısı
+RATE_SAMPLE_SECONDS = 0.25
+RATE_SMOOTHING = 0.3
+
+
+class ProgressReporter:
+    """Aşama içindeki iş birimlerinden genel yüzde üreten yardımcı (işçi tarafı)
+    
+    Her aşama ilerleme çubuğunda bir aralığa sahiptir; aşama içinde
+    advance(done) çağrıldıkça yüzde bu aralıkta done/total oranında ilerler.
+    Toplam bilinmiyorsa yüzde aşama başında kalır, satır sayısı yine gönderilir.
+    """
+    
+    def __init__(self, callback, phases, unit="satır"):
+        """
+        Args:
+            callback: (value, status, detail) alan fonksiyon
+            phases: {anahtar: (başlangıç %, bitiş %, durum metni)}
+            unit: İş biriminin adı
+        """
+        self.callback = callback
+        self.phases = phases
+        self.unit = unit
+        self.phase = None
+        self.total = None
+        self.done = 0
+        self._last_report = 0.0
+    
+    def start(self, phase, total=None):
+        """Yeni aşamaya geç - toplam sonradan set_total ile de verilebilir"""
+        self.phase = phase
+        self.total = total
+        self.done = 0
+        self._emit()
+    
+    def set_total(self, total):
+        """Aşamanın toplam iş birimi (tahmini olabilir)"""
+        self.total = total if total and total > 0 else None
+    
+    def advance(self, done, force=False):
+        """Aşamada tamamlanan iş birimi sayısını bildir"""
+        if self.phase is None:
+            return
+        self.done = done
+        if force or time.perf_counter() - self._last_report >= REPORT_INTERVAL:
+            self._emit()
+    
+    def value(self):
+        """Şu anki genel yüzde"""
+        start, end, _ = self.phases[self.phase]
+        if not self.total:
+            return start
+        return start + (end - start) * min(self.done / self.total, 1.0)
+    
+    def _emit(self):
+        if self.phase is None or self.callback is None:
+            return
+        self._last_report = time.perf_counter()
+        _, _, status = self.phases[self.phase]
+        detail = {
+            'phase': self.phase,
+            'done': self.done,
+            'total': self.total,
+            'unit': self.unit
+        }
+        self.callback(self.value(), status, detail)
+
+
+class RateEstimator:
+    """Gelen ilerlemelerden hız ve kalan süre tahmini (arayüz tarafı)
+    
+    Genel yüzdenin ve aşama içi iş biriminin artış hızı üstel ağırlıklı
+    hareketli ortalama (EWMA) ile yumuşatılır; kalan süre kalan yüzdenin
+    yüzde hızına bölünmesiyle bulunur. Aşama değişince birim hızı sıfırlanır.
+    """
+    
+    def __init__(self, smoothing=RATE_SMOOTHING, sample_seconds=RATE_SAMPLE_SECONDS):
+        self.smoothing = smoothing
+        self.sample_seconds = sample_seconds
+        self.reset()
+    
+    def reset(self):
+        """Yeni analiz için sıfırla"""
+        self.percent_rate = None
+        self.unit_rate = None
+        self._percent_sample = None
+        self._unit_sample = None
+        self._phase = None
+    
+    def _smooth(self, previous, sample):
+        if previous is None:
+            return sample
+        return self.smoothing * sample + (1 - self.smoothing) * previous
+    
+    def update(self, value, detail=None, now=None):
+        """Yeni ilerleme değeriyle tahminleri güncelle
+        
+        Returns:
+            (unit_rate, eta_seconds): birim/sn ve kalan saniye (bilinmiyorsa None)
+        """
+        now = time.perf_counter() if now is None else now
+        
+        if self._percent_sample is None:
+            self._percent_sample = (now, value)
+        else:
+            sample_time, sample_value = self._percent_sample
+            elapsed = now - sample_time
+            if elapsed >= self.sample_seconds:
+                self.percent_rate = self._smooth(self.percent_rate, max(value - sample_value, 0) / elapsed)
+                self._percent_sample = (now, value)
+        
+        if detail is not None:
+            phase = detail.get('phase')
+            done = detail.get('done') or 0
+            if phase != self._phase or self._unit_sample is None:
+                self._phase = phase
+                self.unit_rate = None
+                self._unit_sample = (now, done)
+            else:
+                sample_time, sample_done = self._unit_sample
+                elapsed = now - sample_time
+                if elapsed >= self.sample_seconds:
+                    self.unit_rate = self._smooth(self.unit_rate, max(done - sample_done, 0) / elapsed)
+                    self._unit_sample = (now, done)
+        
+        eta = None
+        if self.percent_rate and value < 100:
+            eta = (100 - value) / self.percent_rate
+        return self.unit_rate, eta
+
+
+def format_duration(seconds):
+    """Kalan süreyi okunur yaz: '45 sn', '3 dk 10 sn', '1 sa 5 dk'"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} sn"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes} dk {seconds} sn"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} sa {minutes} dk"
+
+
+def format_progress_detail(detail, unit_rate=None, eta=None):
+    """Durum satırına eklenecek '12.000 / 20.000 satır · 8.400 satır/sn · kalan ~1 dk' metni"""
+    parts = []
+    if detail and detail.get('done'):
+        unit = detail.get('unit', '')
+        if detail.get('total'):
+            parts.append(f"{detail['done']:,} / {detail['total']:,} {unit}".replace(',', '.'))
+        else:
+            parts.append(f"{detail['done']:,} {unit}".replace(',', '.'))
+        if unit_rate:
+            parts.append(f"{unit_rate:,.0f} {unit}/sn".replace(',', '.'))
+    if eta is not None:
+        parts.append(f"kalan ~{format_duration(eta)}")
+    return " · ".join(parts)
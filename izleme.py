@@ -0,0 +1,161 @@
+# izleme.py - İsteğe bağlı Chrome Trace Event kaydı
+#
+# KARLILIK_TRACE=1 ile açılır (dosya uygulama dizinindeki izler/ altına yazılır)
+# veya KARLILIK_TRACE=/yol/iz.json ile doğrudan dosya verilir. Çıktı Chrome
+# chrome://tracing, Perfetto veya speedscope ile açılabilir.
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+TRACE_ENV = 'KARLILIK_TRACE'
+
+# Bellekte tutulan en fazla olay - aşılırsa sonrakiler atılır
+MAX_EVENTS = 500000
+
+_setting = os.environ.get(TRACE_ENV, '').strip()
+enabled = _setting not in ('', '0')
+
+_events = []
+_dropped = 0
+_named_threads = set()
+_lock = threading.Lock()
+_started_at = datetime.now()
+
+# perf_counter hassasiyeti korunarak duvar saatine hizalanır - süreçlerin
+# olayları aynı zaman ekseninde görünür
+_clock_offset = time.time() - time.perf_counter()
+
+
+def now_us():
+    """İz zaman damgası (mikrosaniye)"""
+    return (time.perf_counter() + _clock_offset) * 1e6
+
+
+def set_process_name(name):
+    """Bu sürecin izdeki parça adını ver ('Arayüz', 'Analiz İşçisi' gibi)"""
+    if not enabled:
+        return
+    with _lock:
+        _events.append({
+            'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0,
+            'args': {'name': name}
+        })
+
+
+def record_span(name, category, start, duration, args=None):
+    """Tamamlanmış bir aralığı ('X' olayı) ekle - start ve duration mikrosaniye"""
+    global _dropped
+    thread = threading.current_thread()
+    pid = os.getpid()
+    tid = thread.ident
+    
+    with _lock:
+        if len(_events) >= MAX_EVENTS:
+            _dropped += 1
+            return
+        # Her thread ayrı iz satırında, adıyla görünür
+        if (pid, tid) not in _named_threads:
+            _named_threads.add((pid, tid))
+            _events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                'args': {'name': thread.name}
+            })
+        event = {
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': round(start, 1), 'dur': round(duration, 1),
+            'pid': pid, 'tid': tid
+        }
+        if args:
+            event['args'] = args
+        _events.append(event)
+
+
+@contextmanager
+def span(name, category='genel', **args):
+    """Bağlamın süresini iz aralığı olarak kaydet - kapalıyken maliyetsiz"""
+    if not enabled:
+        yield
+        return
+    
+    start = now_us()
+    try:
+        yield
+    finally:
+        record_span(name, category, start, now_us() - start, args)
+
+
+def traced(category='genel', name=None):
+    """Fonksiyon çağrılarını iz aralığı olarak kaydeden dekoratör"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = now_us()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_span(span_name, category, start, now_us() - start, None)
+        return wrapper
+    return decorator
+
+
+def drain():
+    """Biriken olayları al ve temizle - işçi süreç bunları ana sürece gönderir"""
+    with _lock:
+        events = _events[:]
+        _events.clear()
+    return events
+
+
+def add_events(events):
+    """Başka süreçten gelen olayları ekle"""
+    if not enabled or not events:
+        return
+    global _dropped
+    with _lock:
+        room = max(MAX_EVENTS - len(_events), 0)
+        _events.extend(events[:room])
+        _dropped += max(len(events) - room, 0)
+
+
+def trace_path():
+    """İz dosyasının yolu - süreç başına bir dosya"""
+    if _setting.lower() not in ('1', 'true', 'evet'):
+        return _setting
+    
+    from uygulama_dizini import app_data_dir
+    stamp = _started_at.strftime('%Y%m%d_%H%M%S')
+    return os.path.join(app_data_dir('izler'), f"iz_{stamp}_{os.getpid()}.json")
+
+
+def write(path=None):
+    """Tüm olayları Chrome Trace Event JSON dosyasına yaz
+    
+    Returns:
+        str: Yazılan dosyanın yolu (iz kapalıysa None)
+    """
+    if not enabled:
+        return None
+    
+    path = path or trace_path()
+    with _lock:
+        data = {
+            'traceEvents': list(_events),
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped_events': _dropped}
+        }
+    # Yarım dosya kalmasın - önce geçici dosyaya yazılır
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+    return path
@@ -1,46 +1,200 @@
 import pandas as pd
 import numpy as np
 import os
-import tempfile
 import gc
+import threading
 from tkinter import simpledialog, filedialog, messagebox
+from performans import PerformanceRecorder, report_path_for, save_report
+from ilerleme import ProgressReporter
+from izleme import traced
+from profil import profile_call
+from girdi_onbellegi import INPUT_LABELS, file_fingerprint
+from asama_grafi import Stage, StageGraph, StageDeferred
+from sonuc_onbellegi import code_version, result_key
+from sutun_eslestirme import COLUMN_MATCHER, KARLILIK_ROLES, ISKONTO_ROLES, RESULT_ROLES, normalize_header
+
+# Uzun döngüler bu kadar satırlık parçalarla işlenir, parçalar arasında iptal kontrol edilir
+CHUNK_SIZE = 10000
+
+# Aşama ölçümünde tepe belleği tracemalloc ile izle - openpyxl okumasını ~6 kat
+# yavaşlattığı için varsayılan kapalı, KARLILIK_TRACE_MEMORY=1 ile açılır
+TRACE_MEMORY = os.environ.get('KARLILIK_TRACE_MEMORY', '') not in ('', '0')
+
+# Excel okurken ilerleme bu kadar satırda bir bildirilir
+PROGRESS_ROW_STEP = 1000
+
+# Aşamaların ilerleme çubuğundaki aralıkları - 20 bin satırlık ölçümlerdeki
+# sürelerle orantılı; okuma ve yazma aşamaları içinde satır sayısıyla ilerler
+PROGRESS_PHASES = {
+    'iskonto_okuma': (0, 25, "İskonto raporu okunuyor..."),
+    'karlilik_okuma': (25, 38, "Karlılık analizi dosyası okunuyor..."),
+    'cozumleme': (38, 42, "Karlılık verisi çözümleniyor..."),
+    'sutunlar': (42, 43, "Sütunlar analiz ediliyor..."),
+    'fiyat': (43, 46, "Fiyat sözlüğü oluşturuluyor..."),
+    'temizleme': (46, 48, "Veriler temizleniyor..."),
+    'eslestirme': (48, 52, "Stok eşleştirme yapılıyor..."),
+    'kar': (52, 54, "Kar hesaplamaları yapılıyor..."),
+    'kaydetme': (54, 100, "Sonuçlar kaydediliyor...")
+}
+
+# Analizin aşama grafiği - her aşama KarlilikAnalizi.stage_<ad> ile hesaplanır.
+# Bağımlılıklar yazıldığı sırayla çalışır (iskonto önce okunur). Okuma, sütun ve
+# fiyat aşamaları bellekte de tutulur - dosya seçilince hazırlananlar bunlardır;
+# büyük ara çerçeveler yalnızca ara kayıt açıksa diske yazılır (KARLILIK_CHECKPOINTS=1).
+# Çözülen sütun eşleşmesi sonraki aşamaların anahtarına girer (key_output).
+PIPELINE_STAGES = (
+    Stage('iskonto_oku', "İskonto raporu", source='iskonto'),
+    Stage('karlilik_oku', "Karlılık dosyası", source='karlilik'),
+    Stage('sutunlar', "Sütun eşleşmesi", deps=('iskonto_oku', 'karlilik_oku'), key_output=True),
+    Stage('fiyat', "Fiyat sözlüğü", deps=('iskonto_oku', 'sutunlar')),
+    Stage('eslestirme', "Eşleştirme", deps=('sutunlar', 'fiyat', 'karlilik_oku'), memory=False),
+    Stage('kar', "Kar hesaplama", deps=('eslestirme', 'sutunlar'), memory=False),
+    Stage('sonuc', "Sonuç tablosu", deps=('kar', 'sutunlar'), memory=False),
+    Stage('kaydet', "Kaydetme", deps=('sonuc',), memory=False, checkpoint=False)
+)
+
+# Girdi türünün okuma aşaması
+READ_STAGES = {'karlilik': 'karlilik_oku', 'iskonto': 'iskonto_oku'}
+
+
+class AnalysisCancelled(Exception):
+    """Analiz kullanıcı tarafından iptal edildi"""
+
+
+class CancellationToken:
+    """İşbirlikçi iptal işareti
+    
+    threading.Event veya süreçler arası multiprocessing.Event sarar; analiz
+    aşamalar arasında ve parça döngülerinde check() çağırır.
+    """
+    
+    def __init__(self, event=None):
+        self.event = event if event is not None else threading.Event()
+    
+    def cancel(self):
+        self.event.set()
+    
+    def reset(self):
+        self.event.clear()
+    
+    def is_cancelled(self):
+        return self.event.is_set()
+    
+    def check(self):
+        """İptal istendiyse AnalysisCancelled fırlat"""
+        if self.event.is_set():
+            raise AnalysisCancelled()
+
+
+class GenerationToken(CancellationToken):
+    """Süreçler arası nesil sayacına bağlı iptal işareti
+    
+    Arka plan hazırlığı başlarken sayacın değeri saklanır; ana süreç sayacı
+    artırınca (aynı türde yeni dosya seçildi veya analiz iptal edildi) iş
+    eskimiş sayılır ve sonraki check() AnalysisCancelled fırlatır.
+    """
+    
+    def __init__(self, counter, generation):
+        super().__init__()
+        self.counter = counter
+        self.generation = generation
+    
+    def is_cancelled(self):
+        return self.event.is_set() or self.counter.value != self.generation
+    
+    def check(self):
+        """İptal istendiyse veya iş eskidiyse AnalysisCancelled fırlat"""
+        if self.is_cancelled():
+            raise AnalysisCancelled()
+
 
 class KarlilikAnalizi:
-    def __init__(self, progress_callback=None, log_callback=None):
+    def __init__(self, progress_callback=None, log_callback=None,
+                 column_callback=None, save_path_callback=None, cancel_token=None,
+                 stage_memo=None, result_cache=None, column_profiles=None):
         """
         Karlılık analizi sınıfı
         
         Args:
             progress_callback: İlerleme güncellemesi için callback fonksiyonu
             log_callback: Log mesajları için callback fonksiyonu
+            column_callback: Manuel sütun seçimi için (title, prompt) -> str callback'i
+                             (verilmezse Tk diyaloğu açılır)
+            save_path_callback: Kayıt yolu seçimi için () -> str callback'i
+                                (verilmezse Tk diyaloğu açılır)
+            cancel_token: İptal işareti (CancellationToken)
+            stage_memo: Aşama çıktılarının belleği (asama_grafi.StageMemo); verilirse
+                        girdileri değişmemiş aşamalar yeniden çalışmaz
+            result_cache: Sonuç önbelleği (sonuc_onbellegi.ResultCache); verilirse
+                          aynı girdi ve sütunlarla tekrarlanan analiz aşamaları atlar
+            column_profiles: Sütun profilleri (sutun_profilleri.ColumnProfiles); verilirse
+                             daha önce çözülmüş başlık düzenlerinde sütun sorulmaz
         """
         self.progress_callback = progress_callback
         self.log_callback = log_callback
+        self.column_callback = column_callback
+        self.save_path_callback = save_path_callback
+        self.cancel_token = cancel_token if cancel_token is not None else CancellationToken()
+        self.result_cache = result_cache
+        self.column_profiles = column_profiles
+        self.stage_graph = StageGraph(PIPELINE_STAGES, stage_memo, version=code_version())
         
-    def update_progress(self, value, status):
-        """İlerleme durumunu güncelle"""
+        # Kullanıcıya sorulan sütun sayısı - eşleşmenin otomatik bulunup bulunmadığı buradan anlaşılır
+        self.column_questions = 0
+        
+        # Son analizin aşama ölçümleri (performans.PerformanceRecorder raporu)
+        self.last_report = None
+        
+        # Son sonucun anahtarı (girdiler, sütun eşleşmesi, kod sürümü) - aynı
+        # anahtarlı iki sonuç aynıdır; arayüz çerçeveleri karşılaştırmadan bunu kullanır
+        self.last_result_key = None
+        
+        # Aşama içi satır sayılarından genel ilerleme
+        self.progress = ProgressReporter(self.update_progress, PROGRESS_PHASES)
+    
+    def update_progress(self, value, status, detail=None):
+        """İlerleme durumunu güncelle
+        
+        detail verilirse ({'phase', 'done', 'total', 'unit'}) callback'e üçüncü
+        argüman olarak geçilir; iki argümanlı eski callback'ler etkilenmez.
+        """
         if self.progress_callback:
-            self.progress_callback(value, status)
+            if detail is None:
+                self.progress_callback(value, status)
+            else:
+                self.progress_callback(value, status, detail)
     
     def log_message(self, message):
         """Log mesajı gönder"""
         if self.log_callback:
             self.log_callback(message)
     
+    def check_cancelled(self):
+        """İptal istendiyse AnalysisCancelled fırlat"""
+        self.cancel_token.check()
+    
+    def ask_column(self, title, prompt):
+        """Kullanıcıdan sütun numarası iste - işçi sürecinde ana sürece sorulur"""
+        self.column_questions += 1
+        if self.column_callback:
+            return self.column_callback(title, prompt)
+        return simpledialog.askstring(title, prompt)
+    
+    def ask_save_path(self):
+        """Kullanıcıdan kayıt yolu iste - işçi sürecinde ana sürece sorulur"""
+        if self.save_path_callback:
+            return self.save_path_callback()
+        return filedialog.asksaveasfilename(
+            title="Karlılık Analizi Sonuçlarını Kaydet",
+            defaultextension=".xlsx",
+            filetypes=[("Excel dosyaları", "*.xlsx")]
+        )
+    
     def turkce_normalize(self, text):
         """Türkçe karakterleri normalize et"""
         if pd.isna(text):
             return ""
-        text = str(text).lower().strip()
-        replacements = {
-            'ı': 'i', 'i̇': 'i', 'İ': 'i', 'I': 'i',
-            'ş': 's', 'Ş': 's', 'ç': 'c', 'Ç': 'c',
-            'ğ': 'g', 'Ğ': 'g', 'ü': 'u', 'Ü': 'u',
-            'ö': 'o', 'Ö': 'o'
-        }
-        for tr_char, en_char in replacements.items():
-            text = text.replace(tr_char, en_char)
-        return text
+        return normalize_header(text)
     
     def clean_numeric(self, value):
         """Sayısal değerleri temizle"""
@@ -65,15 +219,104 @@ class KarlilikAnalizi:
             return 0.0
         return 0.0
     
-    def find_header_row(self, file_path):
-        """Excel dosyasında uygun header satırını bul"""
+    def clean_numeric_column(self, series):
+        """Sütunu parça parça clean_numeric'ten geçir - parçalar arasında iptal kontrolü"""
+        if len(series) <= CHUNK_SIZE:
+            return series.apply(self.clean_numeric)
+        
+        parcalar = []
+        for start in range(0, len(series), CHUNK_SIZE):
+            self.check_cancelled()
+            parcalar.append(series.iloc[start:start + CHUNK_SIZE].apply(self.clean_numeric))
+        return pd.concat(parcalar)
+    
+    def read_excel_rows(self, file_path):
+        """Excel'in ilk sayfasını satır satır oku
+        
+        pandas.read_excel'in openpyxl okuyucusuyla aynı hücre dönüşümlerini
+        yapar (boş hücre "", hata hücresi NaN, tam sayı değerli float int),
+        ancak okuma sırasında iptal kontrol edilir ve dosya yalnızca bir kez
+        açılır; header arama ve DataFrame kurulumu bu satırları kullanır.
+        Hata hücresi pandas'taki gibi hücre tipinden anlaşılır - "#N/A" yazılmış
+        metin hücresi metin olarak kalır.
+        """
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import TYPE_ERROR
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet = workbook.worksheets[0]
+            
+            # Dosyadaki boyut bilgisi ilerleme için tahmini toplamdır; okuma bundan
+            # bağımsız olarak gerçek son satıra kadar sürer
+            try:
+                self.progress.set_total(sheet.max_row)
+            except Exception:
+                self.progress.set_total(None)
+            sheet.reset_dimensions()
+            
+            rows = []
+            last_row_with_data = -1
+            for row_number, row in enumerate(sheet.iter_rows()):
+                if row_number % PROGRESS_ROW_STEP == 0:
+                    self.progress.advance(row_number)
+                    if row_number % CHUNK_SIZE == 0:
+                        self.check_cancelled()
+                
+                converted_row = []
+                for cell in row:
+                    value = cell.value
+                    if value is None:
+                        value = ""
+                    elif cell.data_type == TYPE_ERROR:
+                        value = np.nan
+                    elif isinstance(value, float) and value.is_integer():
+                        value = int(value)
+                    converted_row.append(value)
+                
+                # Sondaki boş hücreleri at
+                while converted_row and converted_row[-1] == "":
+                    converted_row.pop()
+                if converted_row:
+                    last_row_with_data = row_number
+                rows.append(converted_row)
+        finally:
+            workbook.close()
+        
+        self.progress.advance(len(rows), force=True)
+        
+        # Sondaki boş satırları at, satırları aynı genişliğe tamamla
+        del rows[last_row_with_data + 1:]
+        if rows:
+            max_width = max(len(row) for row in rows)
+            for row in rows:
+                if len(row) < max_width:
+                    row.extend([""] * (max_width - len(row)))
+        return rows
+    
+    def rows_to_frame(self, rows, header=0):
+        """read_excel_rows satırlarından DataFrame oluştur - pandas.read_excel ile aynı ayrıştırma"""
+        from pandas.io.parsers import TextParser
+        
+        if not rows:
+            return pd.DataFrame()
+        
+        parser = TextParser(rows, header=header, skip_blank_lines=False)
+        try:
+            return parser.read()
+        finally:
+            parser.close()
+    
+    def find_header_row(self, rows):
+        """Excel satırlarında uygun header satırını bul"""
         for header_row in [0, 1, 2, 3, 4]:
             try:
-                test_df = pd.read_excel(file_path, header=header_row)
+                # Sütun isimleri ve altında en az bir satır olup olmadığı yeterli
+                test_df = self.rows_to_frame(rows[:header_row + 2], header=header_row)
                 
                 if test_df.empty:
                     continue
-                    
+                
                 self.log_message(f"Header {header_row} test ediliyor...")
                 
                 sutun_isimleri = [str(col).lower().strip() for col in test_df.columns]
@@ -88,7 +331,7 @@ class KarlilikAnalizi:
                 if has_stok_ismi and veri_sutunu_sayisi >= 2:
                     self.log_message(f"✓ Header satırı {header_row} olarak belirlendi!")
                     return header_row
-                    
+            
             except Exception as e:
                 self.log_message(f"Header {header_row} hatası: {e}")
                 continue
@@ -96,24 +339,18 @@ class KarlilikAnalizi:
         self.log_message("Uygun header bulunamadı, header=1 ile deneniyor...")
         return 1
     
-    def find_stok_column(self, df):
-        """Stok sütununu otomatik bul"""
-        stok_ismi_col = None
-        
-        # Önce "stok ismi" ara
-        for col in df.columns:
-            col_clean = self.turkce_normalize(col)
-            if 'stok' in col_clean and 'ismi' in col_clean:
-                stok_ismi_col = col
-                break
+    def find_stok_column(self, df, interactive=True, profile=None):
+        """Stok sütununu otomatik bul - interactive False ise bulunamazsa sorulmaz, None döner
         
-        # Bulamazsa "stok kodu" ara        
+        profile verilirse (başlık düzeninin kayıtlı eşleşmesi) oradaki sütun kullanılır.
+        """
+        # Profil yoksa önce "stok ismi", bulamazsa "stok kodu" aranır
+        stok_ismi_col = (profile or {}).get('karlilik_stok')
         if not stok_ismi_col:
-            for col in df.columns:
-                col_clean = self.turkce_normalize(col)
-                if 'stok' in col_clean and 'kodu' in col_clean:
-                    stok_ismi_col = col
-                    break
+            stok_ismi_col = COLUMN_MATCHER.match(df.columns, ('karlilik_stok',)).get('karlilik_stok')
+        
+        if not stok_ismi_col and not interactive:
+            return None
         
         # Manuel seçim gerekirse
         if not stok_ismi_col:
@@ -122,7 +359,7 @@ class KarlilikAnalizi:
             columns = list(df.columns)
             sutun_secenekleri = "\n".join([f"{i}: {col}" for i, col in enumerate(columns)])
             
-            secim_str = simpledialog.askstring(
+            secim_str = self.ask_column(
                 "Sütun Seçimi",
                 f"Hangi sütun stok ismi/kodu?\n\n{sutun_secenekleri}\n\nSütun numarasını girin (0-{len(columns)-1}):"
             )
@@ -144,32 +381,29 @@ class KarlilikAnalizi:
         
         return stok_ismi_col
     
-    def find_iskonto_columns(self, df):
-        """İskonto dosyasından fiyat ve stok sütunlarını bul"""
+    def find_iskonto_columns(self, df, interactive=True, profile=None):
+        """İskonto dosyasından fiyat ve stok sütunlarını bul
+        
+        interactive False ise bulunamayan sütun sorulmaz, yerine None döner.
+        profile verilirse (başlık düzeninin kayıtlı eşleşmesi) oradaki sütunlar kullanılır.
+        """
         columns = df.columns.tolist()
         
-        # Fiyat sütunu bul
-        fiyat_col = None
-        for col in columns:
-            col_str = self.turkce_normalize(col)
-            if 'fiyat' in col_str and 'liste' not in col_str:
-                fiyat_col = col
-                break
-        
-        # İskonto stok sütunu bul
-        iskonto_stok_col = None
-        for col in columns:
-            col_clean = self.turkce_normalize(col)
-            if 'stok' in col_clean and ('isim' in col_clean or 'ismi' in col_clean):
-                iskonto_stok_col = col
-                break
+        # Profilde olmayanlar için fiyat ("liste" fiyatı hariç) ve stok ismi sütunu aranır
+        found = COLUMN_MATCHER.match(columns, ISKONTO_ROLES)
+        found.update(profile or {})
+        fiyat_col = found.get('iskonto_fiyat')
+        iskonto_stok_col = found.get('iskonto_stok')
+        
+        if not interactive:
+            return fiyat_col, iskonto_stok_col
         
         # Manuel seçimler
         if not fiyat_col:
             self.log_message("Fiyat sütunu manuel seçim gerekli...")
             sutun_secenekleri = "\n".join([f"{i}: {col}" for i, col in enumerate(columns)])
             
-            secim_str = simpledialog.askstring(
+            secim_str = self.ask_column(
                 "Fiyat Sütunu Seçimi",
                 f"Hangi sütun fiyat bilgisi?\n\n{sutun_secenekleri}\n\nSütun numarasını girin:"
             )
@@ -188,7 +422,7 @@ class KarlilikAnalizi:
             self.log_message("İskonto stok sütunu manuel seçim gerekli...")
             sutun_secenekleri = "\n".join([f"{i}: {col}" for i, col in enumerate(columns)])
             
-            secim_str = simpledialog.askstring(
+            secim_str = self.ask_column(
                 "Stok İsmi Sütunu Seçimi",
                 f"Hangi sütun stok ismi?\n\n{sutun_secenekleri}\n\nSütun numarasını girin:"
             )
@@ -210,12 +444,18 @@ class KarlilikAnalizi:
         fiyat_dict = {}
         baslik_sayisi = 0
         
+        bos_sutun = pd.Series('', index=iskonto_df.index)
+        satirlar = zip(
+            iskonto_df[iskonto_stok_col],
+            iskonto_df['Tarih'] if 'Tarih' in iskonto_df.columns else bos_sutun,
+            iskonto_df['Depo'] if 'Depo' in iskonto_df.columns else bos_sutun,
+            iskonto_df[fiyat_col]
+        )
+        
         try:
-            for idx, row in iskonto_df.iterrows():
-                stok_adi = row[iskonto_stok_col]
-                tarih = row.get('Tarih', '')
-                depo = row.get('Depo', '')
-                fiyat = row[fiyat_col]
+            for sira, (stok_adi, tarih, depo, fiyat) in enumerate(satirlar):
+                if sira % CHUNK_SIZE == 0:
+                    self.check_cancelled()
                 
                 stok_bos = pd.isna(stok_adi) or str(stok_adi).lower() == 'nan'
                 tarih_bos = pd.isna(tarih) or str(tarih).lower() == 'nan'
@@ -236,6 +476,8 @@ class KarlilikAnalizi:
                         if baslik_sayisi <= 5:
                             self.log_message(f"Fiyat eşleşmesi: {gercek_stok_adi} → {fiyat}")
         
+        except AnalysisCancelled:
+            raise
         except Exception as e:
             self.log_message(f"Fiyat işleme hatası: {e}")
         
@@ -245,38 +487,40 @@ class KarlilikAnalizi:
         """Fiyatları eşleştir"""
         eslesen_sayisi = 0
         eslesmeyenler = []
+        stok_serisi = karlilik_df[stok_ismi_col]
+        self.progress.set_total(len(stok_serisi))
         
-        for idx, row in karlilik_df.iterrows():
-            stok_adi = row[stok_ismi_col]
+        for start in range(0, len(stok_serisi), CHUNK_SIZE):
+            self.check_cancelled()
+            self.progress.advance(start)
+            parca = stok_serisi.iloc[start:start + CHUNK_SIZE]
             
-            if stok_adi in fiyat_dict:
-                karlilik_df.at[idx, 'Birim Maliyet'] = fiyat_dict[stok_adi]
-                eslesen_sayisi += 1
-            else:
-                eslesmeyenler.append(stok_adi)
+            # Sözlük araması vektörel - fiyatlar hiçbir zaman NaN değil
+            fiyatlar = parca.map(fiyat_dict)
+            bulunan = fiyatlar.notna()
+            
+            karlilik_df.loc[fiyatlar.index[bulunan], 'Birim Maliyet'] = fiyatlar[bulunan]
+            eslesen_sayisi += int(bulunan.sum())
+            eslesmeyenler.extend(parca[~bulunan].tolist())
         
+        self.progress.advance(len(stok_serisi), force=True)
         return eslesen_sayisi, eslesmeyenler
     
-    def calculate_profits(self, karlilik_df):
-        """Kar hesaplamalarını yap"""
+    def calculate_profits(self, karlilik_df, columns=None):
+        """Kar hesaplamalarını yap
+        
+        columns verilmezse ({'ort_satis_fiyat', 'satis_miktar'} - sütun aşamasının
+        çıktısı) fiyat ve miktar sütunları çerçevenin başlığından bulunur.
+        """
+        if columns is None:
+            columns = COLUMN_MATCHER.match(karlilik_df.columns, ('ort_satis_fiyat', 'satis_miktar'))
+        
         # Birim Kar hesaplama
-        ort_satis_fiyat_col = None
-        for col in karlilik_df.columns:
-            col_str = self.turkce_normalize(col)
-            if 'ort' in col_str and 'satis' in col_str and 'fiyat' in col_str:
-                ort_satis_fiyat_col = col
-                break
-        
-        if not ort_satis_fiyat_col:
-            alternatif_fiyat_sutunlari = ['Ort.Satış\nFiyat', 'Ort Satış Fiyat', 'Ortalama Fiyat']
-            for alt_col in alternatif_fiyat_sutunlari:
-                if alt_col in karlilik_df.columns:
-                    ort_satis_fiyat_col = alt_col
-                    break
+        ort_satis_fiyat_col = columns.get('ort_satis_fiyat')
         
         if ort_satis_fiyat_col and ort_satis_fiyat_col in karlilik_df.columns:
             # Güvenli assignment - pandas uyarısı önlenmesi
-            karlilik_df[ort_satis_fiyat_col] = karlilik_df[ort_satis_fiyat_col].apply(self.clean_numeric)
+            karlilik_df[ort_satis_fiyat_col] = self.clean_numeric_column(karlilik_df[ort_satis_fiyat_col])
             karlilik_df['Birim Kar'] = karlilik_df[ort_satis_fiyat_col] - karlilik_df['Birim Maliyet']
             self.log_message("✓ Birim Kar hesaplandı")
         else:
@@ -284,23 +528,11 @@ class KarlilikAnalizi:
             self.log_message("Ort.Satış Fiyat sütunu bulunamadı")
         
         # Net Kar hesaplama
-        satis_miktar_col = None
-        for col in karlilik_df.columns:
-            col_str = self.turkce_normalize(col)
-            if 'satis' in col_str and 'miktar' in col_str:
-                satis_miktar_col = col
-                break
-        
-        if not satis_miktar_col:
-            alternatif_miktar_sutunlari = ['Satış\nMiktar', 'Satis Miktar', 'Miktar']
-            for alt_col in alternatif_miktar_sutunlari:
-                if alt_col in karlilik_df.columns:
-                    satis_miktar_col = alt_col
-                    break
+        satis_miktar_col = columns.get('satis_miktar')
         
         if satis_miktar_col and satis_miktar_col in karlilik_df.columns:
             # Güvenli assignment - pandas uyarısı önlenmesi
-            karlilik_df[satis_miktar_col] = karlilik_df[satis_miktar_col].apply(self.clean_numeric)
+            karlilik_df[satis_miktar_col] = self.clean_numeric_column(karlilik_df[satis_miktar_col])
             karlilik_df['Net Kar'] = karlilik_df['Birim Kar'] * karlilik_df[satis_miktar_col]
             self.log_message("✓ Net Kar hesaplandı")
         else:
@@ -315,27 +547,11 @@ class KarlilikAnalizi:
         if stok_ismi_col and stok_ismi_col in karlilik_df.columns:
             istenen_sutunlar.append(stok_ismi_col)
         
-        diger_sutunlar = ['Satış Miktar', 'Ort.Satış Fiyat', 'Satış Tutar', 'Birim Maliyet', 'Birim Kar', 'Net Kar']
-        for sutun in diger_sutunlar:
-            if sutun in karlilik_df.columns:
-                istenen_sutunlar.append(sutun)
-        
-        # Alternatif sütun isimleri
-        alternatif_sutunlar = {
-            'Satış Miktar': ['Satış\nMiktar', 'Satis Miktar', 'Miktar'],
-            'Ort.Satış Fiyat': ['Ort.Satış\nFiyat', 'Ort Satış Fiyat', 'Ortalama Fiyat'],
-            'Satış Tutar': ['Satış\nTutar', 'Satis Tutar', 'Tutar'],
-            'Birim Maliyet': ['Birim\nMaliyet', 'Maliyet'],
-            'Birim Kar': ['Birim\nKar', 'Kar'],
-            'Net Kar': ['Net\nKar', 'Toplam Kar']
-        }
-        
-        for standart_isim, alternatifler in alternatif_sutunlar.items():
-            if standart_isim not in istenen_sutunlar:
-                for alt_isim in alternatifler:
-                    if alt_isim in karlilik_df.columns:
-                        istenen_sutunlar.append(alt_isim)
-                        break
+        # Önce standart adıyla bulunan sütunlar, sonra alternatif adlarla bulunanlar
+        bulunan = COLUMN_MATCHER.match_ranked(karlilik_df.columns, RESULT_ROLES)
+        eslesmeler = [bulunan[rol] for rol in RESULT_ROLES if rol in bulunan]
+        istenen_sutunlar.extend(sutun for sutun, sira in eslesmeler if sira == 0)
+        istenen_sutunlar.extend(sutun for sutun, sira in eslesmeler if sira > 0)
         
         # TÜM ÜRÜNLER DAHİL EDİLİR - filtreleme yapılmaz
         try:
@@ -362,18 +578,18 @@ class KarlilikAnalizi:
         
         return sonuc_df
     
-    def save_results(self, sonuc_df, eslesen_sayisi, eslesmeyenler):
-        """Sonuçları Excel dosyası olarak kaydet"""
-        output_path = filedialog.asksaveasfilename(
-            title="Karlılık Analizi Sonuçlarını Kaydet",
-            defaultextension=".xlsx",
-            filetypes=[("Excel dosyaları", "*.xlsx")]
-        )
+    def save_results(self, sonuc_df, eslesen_sayisi, eslesmeyenler, output_path=None):
+        """Sonuçları Excel dosyası olarak kaydet - yol verilmezse kullanıcıya sorulur"""
+        if output_path is None:
+            output_path = self.ask_save_path()
         
         if not output_path:
             self.log_message("Dosya kaydetme iptal edildi")
             return False
         
+        kok, uzanti = os.path.splitext(output_path)
+        gecici_path = f"{kok}.kaydediliyor{uzanti or '.xlsx'}"
+        
         try:
             # Güvenli özet hesaplama
             total_net_kar = sonuc_df['Net Kar'].sum() if 'Net Kar' in sonuc_df.columns else 0
@@ -390,9 +606,23 @@ class KarlilikAnalizi:
             
             doluluk_orani = (eslesen_sayisi / len(sonuc_df) * 100) if len(sonuc_df) > 0 else 0
             
-            # Excel kaydetme
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                sonuc_df.to_excel(writer, sheet_name='Karlılık Analizi', index=False)
+            # Excel kaydetme - önce geçici dosyaya yazılır, iptalde yarım dosya kalmaz
+            with pd.ExcelWriter(gecici_path, engine='openpyxl') as writer:
+                if sonuc_df.empty:
+                    sonuc_df.to_excel(writer, sheet_name='Karlılık Analizi', index=False)
+                
+                # Parça parça yaz - ilk parça başlığı da yazar
+                self.progress.set_total(len(sonuc_df))
+                for start in range(0, len(sonuc_df), CHUNK_SIZE):
+                    self.check_cancelled()
+                    self.progress.advance(start)
+                    sonuc_df.iloc[start:start + CHUNK_SIZE].to_excel(
+                        writer,
+                        sheet_name='Karlılık Analizi',
+                        index=False,
+                        header=(start == 0),
+                        startrow=0 if start == 0 else start + 1
+                    )
                 
                 # Özet sayfası
                 ozet_data = {
@@ -411,159 +641,466 @@ class KarlilikAnalizi:
                 ozet_df = pd.DataFrame(ozet_data)
                 ozet_df.to_excel(writer, sheet_name='Özet', index=False)
             
+            os.replace(gecici_path, output_path)
+            self.progress.advance(len(sonuc_df), force=True)
+            
             self.log_message(f"✓ Sonuçlar kaydedildi: {os.path.basename(output_path)}")
             self.log_message(f"📊 Özet: {eslesen_sayisi} eşleşen / {len(eslesmeyenler)} eşleşmeyen")
             self.log_message(f"📈 Doluluk Oranı: %{doluluk_orani:.1f}")
             
             return True
         
+        except AnalysisCancelled:
+            self.remove_file(gecici_path)
+            raise
         except Exception as e:
+            self.remove_file(gecici_path)
             self.log_message(f"Excel kaydetme hatası: {e}")
             return False
     
-    def analyze(self, karlilik_path, iskonto_path):
-        """Ana analiz fonksiyonu - DataFrame döndürür"""
-        temp_files = []
-        
+    def remove_file(self, path):
+        """Dosyayı sessizce sil"""
         try:
-            self.update_progress(15, "İskonto raporu yükleniyor...")
-            
-            # İskonto raporunu oku
-            iskonto_df = pd.read_excel(iskonto_path)
-            
-            if iskonto_df.empty:
-                self.log_message("✗ İskonto raporu dosyası boş!")
-                return None
-                
-            self.log_message(f"✓ İskonto Raporu: {len(iskonto_df)} satır yüklendi")
-            
-            self.update_progress(25, "Karlılık analizi dosyası işleniyor...")
-            
-            # Karlılık Analizi dosyasını oku - header bul
-            header_row = self.find_header_row(karlilik_path)
-            karlilik_df = pd.read_excel(karlilik_path, header=header_row)
-                
-            if karlilik_df is None or karlilik_df.empty:
-                self.log_message("✗ Karlılık Analizi dosyası boş veya okunamadı!")
-                return None
-                
-            self.log_message("✓ Karlılık Analizi dosyası başarıyla yüklendi")
-            
-            self.update_progress(40, "Sütunlar analiz ediliyor...")
-            
-            # Stok sütunu bul
-            stok_ismi_col = self.find_stok_column(karlilik_df)
-            if not stok_ismi_col:
-                return None
-            
-            self.log_message(f"✓ Stok sütunu: {stok_ismi_col}")
-            
-            # İskonto dosyası sütunları
-            fiyat_col, iskonto_stok_col = self.find_iskonto_columns(iskonto_df)
-            if not fiyat_col or not iskonto_stok_col:
-                return None
-            
-            self.log_message(f"✓ Bulunan sütunlar: Stok={stok_ismi_col}, Fiyat={fiyat_col}")
+            if path and os.path.exists(path):
+                os.unlink(path)
+        except OSError:
+            pass
+    
+    def stage_executor(self, recorder, interactive=True):
+        """Aşama grafiğinin çalıştırıcısı - her aşama stage_<ad> metoduyla hesaplanır
+        
+        interactive False ise (dosya seçilince yapılan hazırlık) bulunamayan
+        sütunlar sorulmaz, sütun aşaması StageDeferred fırlatır.
+        """
+        def execute(stage, inputs):
+            self.check_cancelled()
+            return getattr(self, f"stage_{stage.name}")(inputs, recorder, interactive)
+        return execute
+    
+    def stage_reuse_logger(self, recorder):
+        """Bellekten veya ara kayıttan alınan aşamaları log'a ve rapora yaz"""
+        def on_reuse(stage, where):
+            recorder.metadata.setdefault('reused_stages', {})[stage.name] = where
+            kaynak = "bellekten" if where == 'bellek' else "ara kayıttan"
+            self.log_message(f"✓ {stage.label} {kaynak} alındı, yeniden hesaplanmadı")
+        return on_reuse
+    
+    def stage_karlilik_oku(self, inputs, recorder, interactive):
+        """Karlılık dosyasını oku, başlık satırını bul ve çerçeveye çözümle"""
+        self.progress.start('karlilik_okuma')
+        
+        # Dosya bir kez okunur - header aynı satırlarda aranır
+        with recorder.stage("Karlılık okuma") as stage:
+            karlilik_rows = self.read_excel_rows(inputs['path'])
+            stage.rows_out = len(karlilik_rows)
+        
+        with recorder.stage("Başlık tespiti", rows_in=len(karlilik_rows)) as stage:
+            header_row = self.find_header_row(karlilik_rows)
+            stage.rows_out = len(karlilik_rows) - header_row - 1
+        
+        self.check_cancelled()
+        self.progress.start('cozumleme')
+        with recorder.stage("Karlılık çözümleme", rows_in=len(karlilik_rows)) as stage:
+            frame = self.rows_to_frame(karlilik_rows, header=header_row)
+            stage.rows_out = 0 if frame is None else len(frame)
+        del karlilik_rows
+        
+        if frame is None or frame.empty:
+            self.log_message("✗ Karlılık Analizi dosyası boş veya okunamadı!")
+            return None
+        
+        self.log_message("✓ Karlılık Analizi dosyası başarıyla yüklendi")
+        return frame
+    
+    def stage_iskonto_oku(self, inputs, recorder, interactive):
+        """İskonto raporunu oku"""
+        self.progress.start('iskonto_okuma')
+        with recorder.stage("İskonto okuma") as stage:
+            frame = self.rows_to_frame(self.read_excel_rows(inputs['path']))
+            stage.rows_out = len(frame)
+        
+        if frame.empty:
+            self.log_message("✗ İskonto raporu dosyası boş!")
+            return None
+        
+        self.log_message(f"✓ İskonto Raporu: {len(frame)} satır yüklendi")
+        return frame
+    
+    def stage_sutunlar(self, inputs, recorder, interactive):
+        """Karlılık stok, satış miktar ve ort. satış fiyat sütunlarını, iskonto fiyat ve stok sütunlarını çöz
+        
+        Başlık düzeninin kayıtlı profili varsa oradaki sütunlar soru sorulmadan
+        kullanılır; çözülen eşleşme profillere yazılır.
+        
+        Returns:
+            dict: {'karlilik_stok', 'satis_miktar', 'ort_satis_fiyat', 'iskonto_fiyat',
+            'iskonto_stok', 'auto'} - auto, soru sorulmadıysa ve eşleşme otomatik
+            tespitle aynıysa True (elle cevaplanmış profilden gelen eşleşme
+            otomatik sayılmaz); satış sütunları bulunamazsa None'dır; stok/fiyat
+            seçilmezse None döner
+        """
+        karlilik_frame = inputs['karlilik_oku']
+        iskonto_frame = inputs['iskonto_oku']
+        self.progress.start('sutunlar')
+        
+        karlilik_profili = self.column_profile('karlilik', karlilik_frame.columns)
+        iskonto_profili = self.column_profile('iskonto', iskonto_frame.columns)
+        
+        # Kullanıcıya soru sorulursa bekleme süresi de bu aşamaya yazılır
+        questions = self.column_questions
+        with recorder.stage("Sütun tespiti"):
+            fiyat_col = iskonto_stok_col = None
+            stok_ismi_col = self.find_stok_column(karlilik_frame, interactive, karlilik_profili)
+            if stok_ismi_col:
+                self.log_message(f"✓ Stok sütunu: {stok_ismi_col}")
+                fiyat_col, iskonto_stok_col = self.find_iskonto_columns(iskonto_frame, interactive, iskonto_profili)
             
-            # Sütun kontrolleri
-            if stok_ismi_col not in karlilik_df.columns:
-                self.log_message("✗ Stok sütunu bulunamadı!")
-                return None
-            if iskonto_stok_col not in iskonto_df.columns:
-                self.log_message("✗ İskonto stok sütunu bulunamadı!")
-                return None
-            if fiyat_col not in iskonto_df.columns:
-                self.log_message("✗ Fiyat sütunu bulunamadı!")
-                return None
+            # Kar hesabının sütunları sorulmaz - bulunamazsa kar sıfır yazılır
+            satis_sutunlari = COLUMN_MATCHER.match(karlilik_frame.columns, ('satis_miktar', 'ort_satis_fiyat'))
+            for role in ('satis_miktar', 'ort_satis_fiyat'):
+                if role in karlilik_profili:
+                    satis_sutunlari[role] = karlilik_profili[role]
+        
+        if not stok_ismi_col or not fiyat_col or not iskonto_stok_col:
+            if not interactive:
+                raise StageDeferred("Sütunlar otomatik bulunamadı")
+            return None
+        if stok_ismi_col not in karlilik_frame.columns:
+            self.log_message("✗ Stok sütunu bulunamadı!")
+            return None
+        if iskonto_stok_col not in iskonto_frame.columns:
+            self.log_message("✗ İskonto stok sütunu bulunamadı!")
+            return None
+        if fiyat_col not in iskonto_frame.columns:
+            self.log_message("✗ Fiyat sütunu bulunamadı!")
+            return None
+        
+        self.log_message(f"✓ Bulunan sütunlar: Stok={stok_ismi_col}, Fiyat={fiyat_col}")
+        sutunlar = {
+            'karlilik_stok': stok_ismi_col,
+            'satis_miktar': satis_sutunlari.get('satis_miktar'),
+            'ort_satis_fiyat': satis_sutunlari.get('ort_satis_fiyat'),
+            'iskonto_fiyat': fiyat_col,
+            'iskonto_stok': iskonto_stok_col
+        }
+        otomatik = COLUMN_MATCHER.match(karlilik_frame.columns, KARLILIK_ROLES)
+        otomatik.update(COLUMN_MATCHER.match(iskonto_frame.columns, ISKONTO_ROLES))
+        sutunlar['auto'] = self.column_questions == questions and all(
+            sutunlar[role] == otomatik.get(role) for role in KARLILIK_ROLES + ISKONTO_ROLES
+        )
+        self.remember_columns('karlilik', karlilik_frame.columns, sutunlar, KARLILIK_ROLES)
+        self.remember_columns('iskonto', iskonto_frame.columns, sutunlar, ISKONTO_ROLES)
+        return sutunlar
+    
+    def column_profile(self, kind, columns):
+        """Başlık düzeninin kayıtlı eşleşmesi - {rol: sütun}, yoksa boş sözlük"""
+        if self.column_profiles is None:
+            return {}
+        profile = self.column_profiles.lookup(kind, columns)
+        if profile:
+            self.log_message(f"✓ {INPUT_LABELS[kind]} düzeni tanındı, kayıtlı sütun eşleşmesi kullanılıyor")
+        return profile
+    
+    def remember_columns(self, kind, columns, sutunlar, roles):
+        """Çözülen eşleşmeyi başlık düzeninin profili olarak kaydet - hata analizi etkilemez"""
+        if self.column_profiles is None:
+            return
+        try:
+            self.column_profiles.remember(kind, columns, {role: sutunlar[role] for role in roles})
+        except Exception as e:
+            self.log_message(f"Sütun profili kaydedilemedi: {e}")
+    
+    def stage_fiyat(self, inputs, recorder, interactive):
+        """İskonto raporundan stok -> fiyat sözlüğü"""
+        frame = inputs['iskonto_oku']
+        sutunlar = inputs['sutunlar']
+        iskonto_stok_col = sutunlar['iskonto_stok']
+        self.progress.start('fiyat')
+        
+        with recorder.stage("Fiyat sözlüğü", rows_in=len(frame)) as stage:
+            # İskonto raporu fiyat sözlüğüne ham haliyle girer (fiyat başlık satırlarında
+            # stok ismi boştur); burada yalnızca temizlik sonrası boş kalıp kalmadığına bakılır
+            iskonto_stoklar = frame[iskonto_stok_col]
+            iskonto_stoklar = iskonto_stoklar[iskonto_stoklar.notna()].astype(str).str.strip().str.upper()
+            iskonto_kalan = (~iskonto_stoklar.str.contains('TOPLAM|TOTAL|GENEL', case=False, na=False)).sum()
+            del iskonto_stoklar
             
-            self.update_progress(60, "Veriler temizleniyor...")
+            fiyat_dict = {}
+            if iskonto_kalan > 0:
+                fiyat_dict = self.create_price_dictionary(frame, iskonto_stok_col, sutunlar['iskonto_fiyat'])
+            stage.rows_out = len(fiyat_dict)
+        
+        if iskonto_kalan == 0:
+            self.log_message("✗ Veriler temizleme sonrası boş kaldı!")
+            return None
+        
+        self.log_message(f"✓ {len(fiyat_dict)} stok için fiyat bilgisi alındı")
+        return fiyat_dict
+    
+    def stage_eslestirme(self, inputs, recorder, interactive):
+        """Karlılık verisini temizle ve iskonto fiyatlarıyla eşleştir
+        
+        Returns:
+            dict: {'df', 'eslesen_sayisi', 'eslesmeyenler'}
+        """
+        frame = inputs['karlilik_oku']
+        stok_ismi_col = inputs['sutunlar']['karlilik_stok']
+        self.progress.start('temizleme')
+        
+        with recorder.stage("Temizleme", rows_in=len(frame)) as stage:
+            # Veri temizleme - okunan çerçeve değiştirilmez
+            karlilik_df = frame[frame[stok_ismi_col].notna()].copy()
             
             # Birim Maliyet sütunu ekle
             if 'Birim Maliyet' not in karlilik_df.columns:
                 karlilik_df['Birim Maliyet'] = 0.0
             
-            # Veri temizleme
-            karlilik_df = karlilik_df[karlilik_df[stok_ismi_col].notna()].copy()
-            iskonto_df = iskonto_df[iskonto_df[iskonto_stok_col].notna()].copy()
-            
-            if karlilik_df.empty or iskonto_df.empty:
-                self.log_message("✗ Veriler temizleme sonrası boş kaldı!")
-                return None
-            
-            # String temizleme - güvenli assignment
-            karlilik_df[stok_ismi_col] = karlilik_df[stok_ismi_col].astype(str).str.strip().str.upper()
-            iskonto_df[iskonto_stok_col] = iskonto_df[iskonto_stok_col].astype(str).str.strip().str.upper()
-            
-            # TOPLAM satırlarını kaldır
-            karlilik_df = karlilik_df[~karlilik_df[stok_ismi_col].str.contains('TOPLAM|TOTAL|GENEL', case=False, na=False)].copy()
-            iskonto_df = iskonto_df[~iskonto_df[iskonto_stok_col].str.contains('TOPLAM|TOTAL|GENEL', case=False, na=False)].copy()
-            
-            self.update_progress(70, "Fiyat bilgileri işleniyor...")
-            
-            # Fiyat sütunu temizleme - güvenli assignment
-            iskonto_df[fiyat_col] = iskonto_df[fiyat_col].apply(self.clean_numeric)
-            
-            # CSV işleme
-            try:
-                with tempfile.NamedTemporaryFile(mode='w+', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
-                    csv_path = temp_file.name
-                    temp_files.append(csv_path)
-                
-                temp_df = pd.read_excel(iskonto_path)
-                temp_df.to_csv(csv_path, index=False, encoding='utf-8')
-                csv_df = pd.read_csv(csv_path, encoding='utf-8')
-                iskonto_df = csv_df.copy()
-                
-                del temp_df, csv_df
-                gc.collect()
+            if not karlilik_df.empty:
+                # String temizleme - güvenli assignment
+                karlilik_df[stok_ismi_col] = karlilik_df[stok_ismi_col].astype(str).str.strip().str.upper()
                 
-            except Exception as e:
-                self.log_message(f"CSV çevirme hatası: {e}")
-            
-            self.update_progress(80, "Fiyat eşleştirme yapılıyor...")
-            
-            # Fiyat dictionary oluştur
-            fiyat_dict = self.create_price_dictionary(iskonto_df, iskonto_stok_col, fiyat_col)
-            self.log_message(f"✓ {len(fiyat_dict)} stok için fiyat bilgisi alındı")
-            
-            self.update_progress(85, "Stok eşleştirme yapılıyor...")
-            
-            # Eşleştirme işlemi
-            eslesen_sayisi, eslesmeyenler = self.match_prices(karlilik_df, stok_ismi_col, fiyat_dict)
+                # TOPLAM satırlarını kaldır
+                karlilik_df = karlilik_df[~karlilik_df[stok_ismi_col].str.contains('TOPLAM|TOTAL|GENEL', case=False, na=False)].copy()
+            stage.rows_out = len(karlilik_df)
+        del frame
+        
+        if karlilik_df.empty:
+            self.log_message("✗ Veriler temizleme sonrası boş kaldı!")
+            return None
+        
+        self.check_cancelled()
+        self.progress.start('eslestirme')
+        
+        with recorder.stage("Eşleştirme", rows_in=len(karlilik_df)) as stage:
+            eslesen_sayisi, eslesmeyenler = self.match_prices(karlilik_df, stok_ismi_col, inputs['fiyat'])
             
             # Birim Maliyet temizleme
-            karlilik_df['Birim Maliyet'] = karlilik_df['Birim Maliyet'].apply(self.clean_numeric)
-            
-            self.update_progress(90, "Kar hesaplamaları yapılıyor...")
-            
-            # Kar hesaplamalarını yap
-            self.calculate_profits(karlilik_df)
-            
-            self.log_message(f"✓ Eşleştirme tamamlandı: {eslesen_sayisi} eşleşen, {len(eslesmeyenler)} eşleşmeyen")
+            karlilik_df['Birim Maliyet'] = self.clean_numeric_column(karlilik_df['Birim Maliyet'])
+            stage.rows_out = eslesen_sayisi
+        
+        return {'df': karlilik_df, 'eslesen_sayisi': eslesen_sayisi, 'eslesmeyenler': eslesmeyenler}
+    
+    def stage_kar(self, inputs, recorder, interactive):
+        """Eşleşmiş veride kar hesaplamaları - eşleştirme çıktısı kopyası üzerinde"""
+        eslestirme = inputs['eslestirme']
+        self.progress.start('kar')
+        
+        with recorder.stage("Kar hesaplama", rows_in=len(eslestirme['df'])) as stage:
+            karlilik_df = eslestirme['df'].copy()
+            self.calculate_profits(karlilik_df, inputs['sutunlar'])
+            stage.rows_out = len(karlilik_df)
+        
+        return dict(eslestirme, df=karlilik_df)
+    
+    def stage_sonuc(self, inputs, recorder, interactive):
+        """Kar hesaplanmış veriden sıralı sonuç çerçevesi"""
+        kar = inputs['kar']
+        
+        with recorder.stage("Sonuç hazırlama", rows_in=len(kar['df'])) as stage:
+            sonuc_df = self.prepare_result_dataframe(kar['df'], inputs['sutunlar']['karlilik_stok'])
+            stage.rows_out = len(sonuc_df)
+        
+        self.log_message(f"✓ Eşleştirme tamamlandı: {kar['eslesen_sayisi']} eşleşen, {len(kar['eslesmeyenler'])} eşleşmeyen")
+        return dict(kar, df=sonuc_df)
+    
+    def stage_kaydet(self, inputs, recorder, interactive):
+        """Sonucu kullanıcının seçtiği yola kaydet - kayıt yolu veya None"""
+        sonuc = inputs['sonuc']
+        self.progress.start('kaydetme')
+        
+        # Kayıt yolu ölçüm dışında sorulur - diyalog bekleme süresi yazma süresine karışmaz
+        output_path = self.ask_save_path() or ''
+        with recorder.stage("Kaydetme", rows_in=len(sonuc['df'])) as stage:
+            save_result = self.save_results(sonuc['df'], sonuc['eslesen_sayisi'], sonuc['eslesmeyenler'], output_path)
+            stage.rows_out = len(sonuc['df']) if save_result else 0
+        return output_path if save_result else None
+    
+    def prepare_input(self, kind, sources):
+        """Seçilen dosyayı analiz başlamadan, soru sormadan hazırla
+        
+        Dosyanın okuma aşaması çalışır (bellekte veya ara kayıtta varsa
+        atlanır). Diğer dosya da seçilmiş ve okunmuşsa sütun çözümü ve fiyat
+        sözlüğü de hazırlanır; sütunlar otomatik bulunamazsa sorular analiz
+        başında sorulur. İptal veya geçersiz kılmada AnalysisCancelled fırlatılır.
+        
+        Args:
+            kind: Hazırlanacak dosyanın türü
+            sources: {tür: yol} - seçili dosyalar
+        
+        Returns:
+            dict: {'rows', 'needs_columns'} - needs_columns diğer dosya hazır
+            değilse None; dosya boş veya kullanılamazsa None
+        """
+        recorder = PerformanceRecorder(trace_memory=False)
+        execute = self.stage_executor(recorder, interactive=False)
+        try:
+            frame = self.stage_graph.run(READ_STAGES[kind], sources, execute).get(READ_STAGES[kind])
+            if frame is None:
+                return None
             
-            self.update_progress(95, "Sonuçlar kaydediliyor...")
+            needs_columns = None
+            other = 'iskonto' if kind == 'karlilik' else 'karlilik'
+            if sources.get(other) and self.stage_graph.peek(READ_STAGES[other], sources) is not None:
+                try:
+                    self.stage_graph.run('fiyat', sources, execute)
+                    needs_columns = False
+                except StageDeferred:
+                    needs_columns = True
+            return {'rows': len(frame), 'needs_columns': needs_columns}
+        finally:
+            gc.collect()
+    
+    def column_mapping(self, sutunlar):
+        """Sütun aşamasının çıktısından eşleşme - sonuç önbelleği anahtarının parçası"""
+        return {role: sutunlar[role] for role in KARLILIK_ROLES + ISKONTO_ROLES}
+    
+    def lookup_result(self, sources):
+        """Aynı dosyalar ve sütunlarla kaydedilmiş sonucu ara
+        
+        Sütun aşaması hazırsa onun eşleşmesiyle, değilse otomatik bulunmuş
+        eşleşmeyle aranır; hiçbir dosya okunmaz.
+        """
+        if self.result_cache is None:
+            return None
+        
+        sutunlar = self.stage_graph.peek('sutunlar', sources)
+        mapping = None if sutunlar is None else self.column_mapping(sutunlar)
+        
+        try:
+            return self.result_cache.lookup(sources['karlilik'], sources['iskonto'], mapping)
+        except Exception as e:
+            self.log_message(f"Sonuç önbelleği okunamadı: {e}")
+            return None
+    
+    def reuse_result(self, onceki, recorder):
+        """Önbellekteki sonucu kullan - önceki sonuç dosyası silinmişse yalnızca kaydetme yapılır
+        
+        Returns:
+            str: Sonuç dosyasının yolu; kayıt iptal edilir veya başarısız olursa None
+        """
+        self.log_message("⚡ Aynı dosyalar ve sütunlarla yapılmış analiz bulundu, aşamalar atlandı")
+        self.log_message(f"📊 Özet: {onceki['eslesen_sayisi']} eşleşen / {len(onceki['eslesmeyenler'])} eşleşmeyen")
+        
+        output_path = onceki.get('output')
+        if output_path and os.path.exists(output_path):
+            self.log_message(f"✓ Sonuç dosyası önceki analizde kaydedilmişti: {os.path.basename(output_path)}")
+            return output_path
+        
+        return self.stage_kaydet({'sonuc': onceki}, recorder, True)
+    
+    def store_result(self, fingerprints, mapping, auto_mapping, sonuc_df, eslesen_sayisi, eslesmeyenler, output_path, recorder):
+        """Sonucu önbelleğe yaz - hata analizi etkilemez"""
+        if self.result_cache is None:
+            return
+        try:
+            with recorder.stage("Sonuç önbelleği", rows_in=len(sonuc_df)) as stage:
+                self.result_cache.store(fingerprints, mapping, auto_mapping, sonuc_df,
+                                        eslesen_sayisi, eslesmeyenler, output_path)
+                stage.rows_out = len(sonuc_df)
+        except Exception as e:
+            self.log_message(f"Sonuç önbelleğe yazılamadı: {e}")
+    
+    @traced('analiz')
+    @profile_call('analyze')
+    def analyze(self, karlilik_path, iskonto_path):
+        """Ana analiz fonksiyonu - DataFrame döndürür, iptal/hata durumunda None
+        
+        Her aşamanın süre/bellek ölçümü log'a yazılır; run sonunda rapor
+        last_report'ta tutulur ve başarılı kayıtta sonuç dosyasının yanına
+        JSON olarak kaydedilir. Aşamalar PIPELINE_STAGES grafiğiyle çalışır:
+        girdileri değişmemiş aşamalar bellekten veya ara kayıttan alınır,
+        yarıda kalmış analiz son tamamlanan aşamadan devam eder.
+        result_cache'te aynı girdi, sütun ve kod sürümüyle sonuç varsa hiçbir
+        aşama çalışmaz.
+        """
+        recorder = PerformanceRecorder(log_callback=self.log_message, trace_memory=TRACE_MEMORY)
+        recorder.metadata['inputs'] = {
+            'karlilik': self.describe_input(karlilik_path),
+            'iskonto': self.describe_input(iskonto_path)
+        }
+        self.last_report = None
+        self.last_result_key = None
+        outcome = 'durduruldu'
+        sources = {'karlilik': karlilik_path, 'iskonto': iskonto_path}
+        
+        # Önbellek anahtarı okumadan önceki hâle göre - dosya analiz sırasında
+        # değişirse kaydedilen sonuç bir sonraki aramada eşleşmez
+        fingerprints = (file_fingerprint(karlilik_path), file_fingerprint(iskonto_path))
+        
+        try:
+            self.check_cancelled()
             
-            # Sonuç dataframe'ini hazırla
-            sonuc_df = self.prepare_result_dataframe(karlilik_df, stok_ismi_col)
+            onceki = self.lookup_result(sources)
+            if onceki is not None:
+                recorder.metadata['result_cache'] = 'isabet'
+                output_path = self.reuse_result(onceki, recorder)
+                if not output_path:
+                    return None
+                
+                outcome = 'tamamlandi'
+                recorder.metadata['output'] = output_path
+                self.last_result_key = onceki.get('key')
+                self.last_report = recorder.finish(outcome)
+                return onceki['df']
             
-            # Dosya kaydetme
-            save_result = self.save_results(sonuc_df, eslesen_sayisi, eslesmeyenler)
+            results = self.stage_graph.run(
+                'kaydet', sources, self.stage_executor(recorder),
+                on_reuse=self.stage_reuse_logger(recorder), keep=('sutunlar', 'sonuc')
+            )
+            output_path = results.get('kaydet')
+            if not output_path:
+                return None
             
             # Başarılı kayıt sonrası DataFrame'i döndür
-            if save_result:
-                return sonuc_df
-            else:
-                return None
-                
+            sonuc = results['sonuc']
+            outcome = 'tamamlandi'
+            recorder.metadata['output'] = output_path
+            
+            # Sonuç ara kayıttan geldiyse sütun aşamasına inilmemiştir
+            sutunlar = results.get('sutunlar') or self.stage_graph.peek('sutunlar', sources)
+            if sutunlar is not None:
+                if None not in fingerprints:
+                    self.last_result_key = result_key(fingerprints, self.column_mapping(sutunlar))
+                self.store_result(fingerprints, self.column_mapping(sutunlar), sutunlar['auto'], sonuc['df'],
+                                  sonuc['eslesen_sayisi'], sonuc['eslesmeyenler'], output_path, recorder)
+            self.last_report = recorder.finish(outcome)
+            self.write_report(self.last_report, output_path)
+            return sonuc['df']
+        
+        except AnalysisCancelled:
+            outcome = 'iptal'
+            self.log_message("⏹ Analiz iptal edildi")
+            return None
         except Exception as e:
+            outcome = 'hata'
             self.log_message(f"✗ HATA: {str(e)}")
             return None
         finally:
-            # Temizlik
-            for temp_file in temp_files:
-                try:
-                    if temp_file and os.path.exists(temp_file):
-                        os.unlink(temp_file)
-                except Exception:
-                    pass
-            gc.collect()
\ No newline at end of file
+            if self.last_report is None:
+                self.last_report = recorder.finish(outcome)
+            
+            # Temizlik - iptal edilen aşamanın ara verileri burada bırakılır
+            gc.collect()
+    
+    def describe_input(self, path):
+        """Rapor için girdi dosyası bilgisi"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = None
+        return {'name': os.path.basename(path), 'bytes': size}
+    
+    def write_report(self, report, output_path):
+        """Performans raporunu sonuç dosyasının yanına yaz"""
+        summary = (f"⏱ Toplam: {report['total_wall_seconds']:.2f} sn "
+                   f"(CPU {report['total_cpu_seconds']:.2f} sn)")
+        if report.get('peak_mb') is not None:
+            summary += f", tepe bellek {report['peak_mb']:.1f} MB"
+        self.log_message(summary)
+        
+        try:
+            report_path = report_path_for(output_path)
+            save_report(report, report_path)
+            self.log_message(f"✓ Performans raporu kaydedildi: {os.path.basename(report_path)}")
+        except Exception as e:
+            self.log_message(f"Performans raporu kaydedilemedi: {e}")
\ No newline at end of file
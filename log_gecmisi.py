@@ -0,0 +1,119 @@
+# log_gecmisi.py - Arayüz loglarının dönen dosyalarda saklanması ve aranması
+
+import os
+import threading
+import logging
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+from uygulama_dizini import app_data_dir
+
+
+# Log penceresinde tutulan en fazla satır - eskileri yalnızca dosyada kalır
+MAX_VIEW_LINES = 2000
+
+# Pencere bu kadar satır taşınca tek seferde kırpılır (her insert'te silme yapılmaz)
+TRIM_SLACK_LINES = 200
+
+# Dönen log dosyaları: her biri en fazla 1 MB, 5 yedek
+HISTORY_MAX_BYTES = 1024 * 1024
+HISTORY_BACKUP_COUNT = 5
+
+# Aramada döndürülen en fazla eşleşme (en yeniler)
+SEARCH_LIMIT = 500
+
+HISTORY_FILE_NAME = 'islem_gecmisi.log'
+
+
+class LogHistory:
+    """Log satırlarını dönen dosyaya yazan ve geçmişte arama yapan sınıf
+    
+    write() UI thread'inden, search() arka plan thread'inden çağrılabilir.
+    Dosya açılamazsa geçmiş sessizce devre dışı kalır; arayüz etkilenmez.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path
+        self.handler = None
+        self._lock = threading.Lock()
+        
+        try:
+            if self.path is None:
+                self.path = os.path.join(app_data_dir('loglar'), HISTORY_FILE_NAME)
+            self.handler = RotatingFileHandler(
+                self.path,
+                maxBytes=HISTORY_MAX_BYTES,
+                backupCount=HISTORY_BACKUP_COUNT,
+                encoding='utf-8',
+                delay=True
+            )
+            self.handler.setFormatter(logging.Formatter('%(message)s'))
+        except Exception as e:
+            print(f"Log geçmişi açılamadı: {e}")
+            self.handler = None
+    
+    @property
+    def enabled(self):
+        """Geçmiş dosyası kullanılabiliyor mu"""
+        return self.handler is not None
+    
+    def write(self, entries, timestamp=None):
+        """(message, msg_type) satırlarını dosyaya ekle"""
+        if not self.enabled or not entries:
+            return
+        
+        stamp = (timestamp or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with self._lock:
+                for message, msg_type in entries:
+                    # Çok satırlı mesajlar dosyada tek kayıt kalsın
+                    text = str(message).replace('\n', ' ⏎ ')
+                    self.handler.emit(logging.makeLogRecord({'msg': f"[{stamp}] [{msg_type}] {text}"}))
+        except Exception as e:
+            print(f"Log geçmişi yazma hatası: {e}")
+    
+    def files(self):
+        """Geçmiş dosyaları - en eskiden en yeniye"""
+        if not self.enabled:
+            return []
+        
+        candidates = [f"{self.path}.{i}" for i in range(HISTORY_BACKUP_COUNT, 0, -1)]
+        candidates.append(self.path)
+        return [path for path in candidates if os.path.exists(path)]
+    
+    def search(self, term, limit=SEARCH_LIMIT):
+        """Geçmişte büyük/küçük harf duyarsız arama
+        
+        Returns:
+            (matches, total): en yeni `limit` eşleşme (eskiden yeniye) ve
+            toplam eşleşme sayısı
+        """
+        needle = term.strip().casefold()
+        if not needle:
+            return [], 0
+        
+        with self._lock:
+            if self.handler is not None and self.handler.stream is not None:
+                self.handler.flush()
+            paths = self.files()
+        
+        matches = deque(maxlen=limit)
+        total = 0
+        for path in paths:
+            try:
+                with open(path, encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        if needle in line.casefold():
+                            total += 1
+                            matches.append(line.rstrip('\n'))
+            except OSError as e:
+                print(f"Log geçmişi okuma hatası: {e}")
+        
+        return list(matches), total
+    
+    def close(self):
+        """Dosya tutamacını kapat"""
+        if self.handler is not None:
+            with self._lock:
+                self.handler.close()
@@ -0,0 +1,81 @@
+# on_yukleme.py - Ağır modüllerin pencere açıldıktan sonra arka planda yüklenmesi
+
+import importlib
+import threading
+import time
+
+
+# Arayüz sürecinde ilk analiz sonucu ve dashboard için gereken ağır modüller.
+# Pencere bunlar yüklenmeden açılır; analiz yalnızca yükleme bitene kadar bekler.
+HEAVY_MODULES = (
+    'numpy',
+    'pandas',
+    'paylasimli_bellek',
+    'dashboard_model',
+    'analiz_dashboard'
+)
+
+
+class ModulePreloader:
+    """Modülleri ayrı bir thread'de içe aktaran yükleyici
+    
+    Tk'ye dokunmaz; bitince on_done (thread-safe olmalı) yükleme bilgisiyle
+    çağrılır. Bir modül yüklenemezse hata kaydedilir ve diğerlerine geçilir -
+    asıl hata modül gerçekten kullanıldığında yine görünür.
+    """
+    
+    def __init__(self, modules=HEAVY_MODULES, on_done=None):
+        """
+        Args:
+            modules: İçe aktarılacak modül adları (sırayla)
+            on_done: Yükleme bitince {'seconds', 'durations', 'errors'} alan fonksiyon
+        """
+        self.modules = modules
+        self.on_done = on_done
+        self.durations = {}
+        self.errors = {}
+        self.seconds = None
+        self._ready = threading.Event()
+        self._thread = None
+    
+    @property
+    def ready(self):
+        """Yükleme bitti mi (hatalı da olsa)"""
+        return self._ready.is_set()
+    
+    @property
+    def started(self):
+        return self._thread is not None
+    
+    def start(self):
+        """Yüklemeyi başlat - ikinci çağrı etkisizdir"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="ModulOnYukleme", daemon=True)
+        self._thread.start()
+    
+    def wait(self, timeout=None):
+        """Yükleme bitene kadar bekle - UI thread'inden çağrılmamalı"""
+        return self._ready.wait(timeout)
+    
+    def _run(self):
+        start = time.perf_counter()
+        for name in self.modules:
+            module_start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.errors[name] = str(e)
+            self.durations[name] = time.perf_counter() - module_start
+        self.seconds = time.perf_counter() - start
+        self._ready.set()
+        
+        if self.on_done is not None:
+            try:
+                self.on_done({
+                    'seconds': self.seconds,
+                    'durations': dict(self.durations),
+                    'errors': dict(self.errors)
+                })
+            except Exception as e:
+                print(f"Ön yükleme bildirimi hatası: {e}")
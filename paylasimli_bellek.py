@@ -0,0 +1,203 @@
+# paylasimli_bellek.py - DataFrame'lerin süreçler arası paylaşımlı bellekle aktarımı
+
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+
+# Bundan küçük sütunlar paylaşımlı bloğa değmez, normal pickle ile gider
+SHARED_MIN_BYTES = 64 * 1024
+
+# Metin sütunları bu ayraçla birleştirilip tek UTF-8 tampon olarak gönderilir
+TEXT_SEPARATOR = '\x00'
+
+# Hâlâ dizilerce gösterildiği için kapatılamayan bloklar - sonraki çağrıda tekrar denenir
+_deferred_blocks = []
+
+
+def _is_shareable(values):
+    """Sütun düz bir numpy sayısal/tarih dizisi mi"""
+    return isinstance(values, np.ndarray) and values.dtype.kind in 'biufcmM'
+
+
+def _export_array(values, blocks, min_bytes):
+    """Diziyi paylaşımlı bloğa kopyala ve tanımını döndür"""
+    if not _is_shareable(values):
+        return _export_text(values, blocks, min_bytes) or {'values': values}
+    if values.nbytes < min_bytes:
+        return {'values': values}
+    
+    values = np.ascontiguousarray(values)
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    blocks.append(shm)
+    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[...] = values
+    return {'shm': shm.name, 'dtype': values.dtype.str, 'length': len(values)}
+
+
+def _export_text(values, blocks, min_bytes):
+    """Eksiksiz metin sütununu tek UTF-8 tampona yaz - uygun değilse None
+    
+    Milyonlarca Python str nesnesini tek tek pickle etmek aktarımın en
+    pahalı kısmıdır; birleştirilmiş tampon bunun yaklaşık yarısına mal olur.
+    """
+    if len(values) * 8 < min_bytes:
+        return None
+    if pd.api.types.infer_dtype(values, skipna=False) != 'string' or pd.isna(values).any():
+        return None
+    
+    items = values.tolist()
+    joined = TEXT_SEPARATOR.join(items)
+    # Ayraç metnin içinde geçiyorsa geri bölme güvenilmez olur
+    if joined.count(TEXT_SEPARATOR) != len(items) - 1:
+        return None
+    
+    data = joined.encode('utf-8')
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    blocks.append(shm)
+    shm.buf[:len(data)] = data
+    return {'shm': shm.name, 'text': True, 'nbytes': len(data), 'length': len(items), 'dtype': values.dtype}
+
+
+def _import_text(entry):
+    """Metin tamponunu çöz - blok hemen serbest bırakılır, eşlenmiş kalmaz"""
+    shm = shared_memory.SharedMemory(name=entry['shm'])
+    try:
+        items = bytes(shm.buf[:entry['nbytes']]).decode('utf-8').split(TEXT_SEPARATOR)
+    finally:
+        close_blocks([shm], unlink=True)
+    
+    if entry['dtype'] == object:
+        return np.array(items, dtype=object)
+    return pd.array(items, dtype=entry['dtype'])
+
+
+def _import_array(entry, blocks):
+    """Tanımdaki diziyi kopyalamadan eşle"""
+    if 'shm' not in entry:
+        return entry['values']
+    if entry.get('text'):
+        return _import_text(entry)
+    
+    shm = shared_memory.SharedMemory(name=entry['shm'])
+    blocks.append(shm)
+    return np.ndarray((entry['length'],), dtype=np.dtype(entry['dtype']), buffer=shm.buf)
+
+
+def export_frame(df, min_bytes=SHARED_MIN_BYTES):
+    """DataFrame'in sayısal sütunlarını paylaşımlı belleğe yaz
+    
+    Returns:
+        (descriptor, blocks): descriptor pickle ile karşı sürece gönderilir;
+        blocks karşı taraf eşleyene kadar açık tutulmalı, sonra close_blocks
+        ile kapatılmalıdır (unlink alıcı tarafın sorumluluğundadır).
+    """
+    blocks = []
+    try:
+        columns = []
+        for i in range(df.shape[1]):
+            series = df.iloc[:, i]
+            # Extension dtype'lar (str, kategori, tz'li tarih) olduğu gibi pickle edilir
+            values = series.to_numpy() if isinstance(series.dtype, np.dtype) else series.array
+            columns.append(_export_array(values, blocks, min_bytes))
+        
+        index = df.index
+        if isinstance(index, pd.RangeIndex):
+            index_entry = {'range': (index.start, index.stop, index.step)}
+        elif isinstance(index.dtype, np.dtype) and _is_shareable(index.to_numpy()):
+            index_entry = _export_array(index.to_numpy(), blocks, min_bytes)
+        else:
+            index_entry = {'values': index}
+        
+        descriptor = {
+            'columns': columns,
+            'labels': df.columns,
+            'index': index_entry,
+            'index_name': index.name
+        }
+        return descriptor, blocks
+    
+    except Exception:
+        # Yarım kalan blokları sızdırma
+        close_blocks(blocks, unlink=True)
+        raise
+
+
+def import_frame(descriptor):
+    """export_frame tanımından DataFrame oluştur - sayısal sütunlar kopyalanmaz
+    
+    Returns:
+        (df, SharedFrame): SharedFrame, DataFrame artık kullanılmadığında
+        release() ile serbest bırakılmalıdır.
+    """
+    blocks = []
+    try:
+        index_entry = descriptor['index']
+        if 'range' in index_entry:
+            index = pd.RangeIndex(*index_entry['range'], name=descriptor['index_name'])
+        elif 'shm' in index_entry:
+            index = pd.Index(_import_array(index_entry, blocks), name=descriptor['index_name'], copy=False)
+        else:
+            index = index_entry['values']
+        
+        # dtype açıkça verilir - aksi halde object metin sütunları str'ye çevrilir
+        data = {}
+        for i, entry in enumerate(descriptor['columns']):
+            values = _import_array(entry, blocks)
+            data[i] = pd.Series(values, index=index, dtype=values.dtype, copy=False)
+        
+        df = pd.DataFrame(data, copy=False)
+        df.columns = descriptor['labels']
+        return df, SharedFrame(blocks)
+    
+    except Exception:
+        close_blocks(blocks)
+        raise
+
+
+def close_blocks(blocks, unlink=False):
+    """Blok tutamaçlarını kapat, istenirse belleği de serbest bırak"""
+    # Önceden kapatılamayanları tekrar dene
+    pending = _deferred_blocks[:]
+    _deferred_blocks.clear()
+    for shm in pending:
+        try:
+            shm.close()
+        except BufferError:
+            _deferred_blocks.append(shm)
+    
+    for shm in blocks:
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Paylaşımlı bellek silme hatası: {e}")
+        try:
+            shm.close()
+        except BufferError:
+            # Bloğu gösteren diziler hâlâ yaşıyor; tutamaç onlar ölene kadar saklanır
+            _deferred_blocks.append(shm)
+        except Exception as e:
+            print(f"Paylaşımlı bellek kapatma hatası: {e}")
+    blocks.clear()
+
+
+class SharedFrame:
+    """Alıcı süreçte eşlenmiş paylaşımlı bellek bloklarının sahibi
+    
+    DataFrame ve ondan türetilen görünümler kullanıldığı sürece açık tutulur;
+    release() blokları siler ve tutamaçları kapatır.
+    """
+    
+    def __init__(self, blocks):
+        self.blocks = blocks
+    
+    @property
+    def nbytes(self):
+        """Eşlenmiş toplam bayt"""
+        return sum(shm.size for shm in self.blocks)
+    
+    def release(self):
+        """Blokları serbest bırak"""
+        close_blocks(self.blocks, unlink=True)
\ No newline at end of file
@@ -0,0 +1,144 @@
+# performans.py - Analiz aşamalarının süre ve bellek ölçümü
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+import izleme
+
+
+class StageRecord:
+    """Tek bir aşamanın ölçümü - rows_in/rows_out aşama içinde doldurulur"""
+    
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_bytes = None
+        self.status = 'ok'
+    
+    def to_dict(self):
+        """JSON raporu için sözlük"""
+        return {
+            'name': self.name,
+            'wall_seconds': round(self.wall_seconds, 4),
+            'cpu_seconds': round(self.cpu_seconds, 4),
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'peak_mb': None if self.peak_bytes is None else round(self.peak_bytes / 1024 ** 2, 2),
+            'status': self.status
+        }
+    
+    def summary(self):
+        """Log satırı"""
+        parts = [f"⏱ {self.name}: {self.wall_seconds:.2f} sn (CPU {self.cpu_seconds:.2f} sn)"]
+        if self.rows_in is not None or self.rows_out is not None:
+            rows_in = '-' if self.rows_in is None else f"{self.rows_in:,}"
+            rows_out = '-' if self.rows_out is None else f"{self.rows_out:,}"
+            parts.append(f"{rows_in} → {rows_out} satır")
+        if self.peak_bytes is not None:
+            parts.append(f"tepe bellek {self.peak_bytes / 1024 ** 2:.1f} MB")
+        if self.status != 'ok':
+            parts.append(self.status)
+        return ", ".join(parts)
+
+
+class PerformanceRecorder:
+    """Analiz aşamalarını sırayla ölçen kayıtçı
+    
+    Her aşama stage() bağlamında çalışır; duvar saati, süreç CPU süresi ve
+    (trace_memory açıksa) tracemalloc ile aşama içi tepe bellek kaydedilir.
+    Aşamalar iç içe açılmamalıdır - tepe bellek her aşamada sıfırlanır.
+    """
+    
+    def __init__(self, log_callback=None, trace_memory=True):
+        """
+        Args:
+            log_callback: Her aşama bitince özet satırı alan fonksiyon
+            trace_memory: tracemalloc ile tepe bellek ölçülsün mü
+        """
+        self.log_callback = log_callback
+        self.trace_memory = trace_memory
+        self.stages = []
+        self.metadata = {}
+        self.started_at = datetime.now()
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._owns_tracing = False
+        self._peak_bytes = None
+        
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+    
+    @contextmanager
+    def stage(self, name, rows_in=None):
+        """Aşamayı ölç - bağlam StageRecord döndürür"""
+        record = StageRecord(name, rows_in)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base_bytes = tracemalloc.get_traced_memory()[0]
+        
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        start_trace = izleme.now_us() if izleme.enabled else None
+        try:
+            yield record
+        except BaseException:
+            # İptal mi hata mı olduğu raporun genel sonucunda yazar
+            record.status = 'kesildi'
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - start_wall
+            record.cpu_seconds = time.process_time() - start_cpu
+            if tracing:
+                # Aşamanın kendi ayırdığı tepe - önceki aşamalardan kalan bellek hariç
+                record.peak_bytes = max(tracemalloc.get_traced_memory()[1] - base_bytes, 0)
+                self._peak_bytes = max(self._peak_bytes or 0, tracemalloc.get_traced_memory()[1])
+            self.stages.append(record)
+            if start_trace is not None:
+                izleme.record_span(name, 'analiz', start_trace, izleme.now_us() - start_trace, {
+                    'rows_in': record.rows_in,
+                    'rows_out': record.rows_out,
+                    'status': record.status
+                })
+            if self.log_callback:
+                self.log_callback(record.summary())
+    
+    def finish(self, outcome):
+        """Ölçümü bitir ve raporu döndür
+        
+        Args:
+            outcome: 'tamamlandi', 'iptal', 'hata' veya 'durduruldu'
+        """
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'outcome': outcome,
+            'total_wall_seconds': round(time.perf_counter() - self._start_wall, 4),
+            'total_cpu_seconds': round(time.process_time() - self._start_cpu, 4),
+            'peak_mb': None if self._peak_bytes is None else round(self._peak_bytes / 1024 ** 2, 2),
+            'stages': [record.to_dict() for record in self.stages],
+            **self.metadata
+        }
+
+
+def report_path_for(output_path):
+    """Sonuç dosyasının yanındaki rapor yolu: sonuc.xlsx -> sonuc.performans.json"""
+    root, _ = os.path.splitext(output_path)
+    return f"{root}.performans.json"
+
+
+def save_report(report, path):
+    """Raporu JSON olarak yaz"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
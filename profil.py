@@ -0,0 +1,214 @@
+# profil.py - İsteğe bağlı profil çıkarma (cProfile veya örnekleme)
+#
+# KARLILIK_PROFILE=cprofile (veya 1) : her sarılı çağrı cProfile ile ölçülür,
+#                                       .pstats dosyası yazılır
+# KARLILIK_PROFILE=sampling           : ayrı thread ana iş thread'inin yığınını
+#                                       aralıklarla örnekler - düşük ek yük,
+#                                       flamegraph/speedscope uyumlu .txt yazılır
+# KARLILIK_PROFILE_INTERVAL_MS        : örnekleme aralığı (varsayılan 5 ms)
+#
+# Dosyalar uygulama dizinindeki profiller/ altına yazılır; en çok süre harcayan
+# fonksiyonların özeti log'a gönderilir.
+
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+
+PROFILE_ENV = 'KARLILIK_PROFILE'
+INTERVAL_ENV = 'KARLILIK_PROFILE_INTERVAL_MS'
+
+# Log'a yazılan en yoğun fonksiyon sayısı
+TOP_N = 15
+
+_setting = os.environ.get(PROFILE_ENV, '').strip().lower()
+if _setting in ('1', 'true', 'evet', 'cprofile'):
+    mode = 'cprofile'
+elif _setting in ('sampling', 'ornekleme', 'örnekleme'):
+    mode = 'sampling'
+else:
+    mode = None
+
+try:
+    SAMPLE_INTERVAL = max(float(os.environ.get(INTERVAL_ENV, '5')), 0.5) / 1000
+except ValueError:
+    SAMPLE_INTERVAL = 0.005
+
+# Profil sonuçlarının yazıldığı log fonksiyonu - (message, msg_type) alır
+_log_callback = None
+
+# Aynı anda tek profil - iç içe çağrılar dıştakinin içinde ölçülür
+_active = threading.local()
+
+
+def set_log_callback(callback):
+    """Profil özetlerinin gönderileceği log fonksiyonunu ayarla"""
+    global _log_callback
+    _log_callback = callback
+
+
+def _log(message, msg_type='info'):
+    if _log_callback is not None:
+        try:
+            _log_callback(message, msg_type)
+            return
+        except Exception:
+            pass
+    print(message)
+
+
+def _output_path(label, extension):
+    from uygulama_dizini import app_data_dir
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    safe_label = ''.join(ch if ch.isalnum() else '_' for ch in label)
+    return os.path.join(app_data_dir('profiller'), f"{safe_label}_{stamp}_{os.getpid()}.{extension}")
+
+
+def _location(filename, lineno, funcname):
+    """Kısa fonksiyon konumu: 'func (dosya.py:12)'"""
+    if filename.startswith('<') or filename == '~':
+        return funcname
+    return f"{funcname} ({os.path.basename(filename)}:{lineno})"
+
+
+class SamplingProfiler:
+    """Bir thread'in yığınını aralıklarla örnekleyen profil çıkarıcı
+    
+    sys._current_frames() ile hedef thread'in o anki yığını okunur; kendi
+    süresi (yaprak fonksiyon) ve yığın yolları sayılır. Hedef thread'e
+    hiçbir kanca takılmadığı için ek yük yalnızca örnekleme sıklığına bağlıdır.
+    """
+    
+    def __init__(self, interval=SAMPLE_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples = 0
+        self.leaf_counts = Counter()
+        self.stack_counts = Counter()
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = None
+    
+    def start(self):
+        """Çağıran thread'i (veya verilen thread_id'yi) örneklemeye başla"""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="ProfilOrnekleyici", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Örneklemeyi durdur"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            
+            self.samples += 1
+            self.leaf_counts[stack[0]] += 1
+            self.stack_counts[tuple(reversed(stack))] += 1
+    
+    def hotspots(self, limit=TOP_N):
+        """Kendi süresine göre en yoğun fonksiyonlar: (konum, örnek sayısı) listesi"""
+        return [(_location(*key), count) for key, count in self.leaf_counts.most_common(limit)]
+    
+    def dump(self, path):
+        """Yığınları 'a;b;c sayı' (collapsed stack) biçiminde yaz"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stack_counts.most_common():
+                names = ';'.join(f"{os.path.basename(filename)}:{funcname}" for filename, _, funcname in stack)
+                f.write(f"{names} {count}\n")
+
+
+def _report_cprofile(label, profiler, elapsed):
+    path = _output_path(label, 'pstats')
+    profiler.dump_stats(path)
+    
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:TOP_N]
+    
+    _log(f"🔬 Profil ({label}, cProfile): {elapsed:.2f} sn - {os.path.basename(path)}")
+    for (filename, lineno, funcname), (_, calls, own_time, cumulative, _) in rows:
+        _log(f"   {own_time:7.3f} sn kendi / {cumulative:7.3f} sn toplam  {calls:>8} çağrı  "
+             f"{_location(filename, lineno, funcname)}")
+    return path
+
+
+def _report_sampling(label, sampler):
+    path = _output_path(label, 'txt')
+    sampler.dump(path)
+    
+    _log(f"🔬 Profil ({label}, örnekleme): {sampler.elapsed:.2f} sn, {sampler.samples} örnek "
+         f"({sampler.interval * 1000:.1f} ms aralık) - {os.path.basename(path)}")
+    total = max(sampler.samples, 1)
+    for location, count in sampler.hotspots():
+        _log(f"   %{count * 100 / total:5.1f}  {count:>6} örnek  {location}")
+    return path
+
+
+@contextmanager
+def profiled(label):
+    """Bağlamı seçili modda profille - profil kapalıysa veya dışta bir profil
+    çalışıyorsa hiçbir şey yapmaz"""
+    if mode is None or getattr(_active, 'label', None) is not None:
+        yield
+        return
+    
+    _active.label = label
+    start = time.perf_counter()
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+    else:
+        profiler = SamplingProfiler()
+        profiler.start()
+    
+    try:
+        yield
+    finally:
+        try:
+            if mode == 'cprofile':
+                profiler.disable()
+                _report_cprofile(label, profiler, time.perf_counter() - start)
+            else:
+                profiler.stop()
+                _report_sampling(label, profiler)
+        except Exception as e:
+            _log(f"Profil kaydedilemedi ({label}): {e}", 'warning')
+        finally:
+            _active.label = None
+
+
+def profile_call(label=None):
+    """Fonksiyonu profiled() içinde çalıştıran dekoratör"""
+    def decorator(func):
+        profile_label = label or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if mode is None:
+                return func(*args, **kwargs)
+            with profiled(profile_label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,93 @@
+# son_dosyalar.py - Son analiz edilen karlılık/iskonto dosya çiftleri
+
+import json
+import os
+from datetime import datetime
+
+from girdi_onbellegi import INPUT_KINDS, file_fingerprint
+from uygulama_dizini import app_data_dir
+
+
+# Listede tutulan en fazla çift - en yenisi başta
+MAX_RECENT_PAIRS = 8
+
+RECENT_FILE_NAME = 'son_dosyalar.json'
+
+
+class RecentPairs:
+    """Son analiz edilen dosya çiftlerini kullanıcı dizininde JSON olarak tutan sınıf
+    
+    Her çift analiz anındaki dosya boyutu ve değişiklik zamanıyla saklanır;
+    unchanged() dosyaların o günden beri değişip değişmediğini söyler.
+    Dosya okunamaz veya yazılamazsa liste bellekte çalışmaya devam eder.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path
+        self.pairs = []
+        
+        try:
+            if self.path is None:
+                self.path = os.path.join(app_data_dir(), RECENT_FILE_NAME)
+            self.load()
+        except Exception as e:
+            print(f"Son dosyalar listesi okunamadı: {e}")
+            self.pairs = []
+    
+    def load(self):
+        """Listeyi dosyadan oku - bozuk kayıtlar atlanır"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.pairs = [
+            pair for pair in data.get('pairs', [])
+            if isinstance(pair, dict) and all(pair.get(kind) for kind in INPUT_KINDS)
+        ][:MAX_RECENT_PAIRS]
+    
+    def save(self):
+        """Listeyi dosyaya yaz - yarım yazılmış dosya kalmaması için geçici dosya üzerinden"""
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'pairs': self.pairs}, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Son dosyalar listesi yazılamadı: {e}")
+    
+    def remember(self, karlilik_path, iskonto_path):
+        """Çifti listenin başına al - dosyaların şu anki hâli kaydedilir"""
+        paths = {'karlilik': karlilik_path, 'iskonto': iskonto_path}
+        pair = {'used_at': datetime.now().isoformat(timespec='seconds')}
+        for kind, path in paths.items():
+            fingerprint = file_fingerprint(path)
+            pair[kind] = os.path.abspath(path)
+            pair[f"{kind}_fingerprint"] = None if fingerprint is None else list(fingerprint[1:])
+        
+        self.pairs = [
+            item for item in self.pairs
+            if (item['karlilik'], item['iskonto']) != (pair['karlilik'], pair['iskonto'])
+        ]
+        self.pairs.insert(0, pair)
+        del self.pairs[MAX_RECENT_PAIRS:]
+        self.save()
+        return pair
+    
+    def most_recent(self):
+        """En son kullanılan çift, liste boşsa None"""
+        return self.pairs[0] if self.pairs else None
+    
+    def unchanged(self, pair):
+        """Çiftin iki dosyası da var ve kaydedildiğinden beri değişmemiş mi"""
+        for kind in INPUT_KINDS:
+            fingerprint = file_fingerprint(pair[kind])
+            if fingerprint is None or list(fingerprint[1:]) != pair.get(f"{kind}_fingerprint"):
+                return False
+        return True
+    
+    def label(self, pair):
+        """Menüde gösterilecek kısa ad"""
+        return (f"{os.path.basename(pair['karlilik'])}  +  {os.path.basename(pair['iskonto'])}"
+                f"  ({pair.get('used_at', '').replace('T', ' ')[:16]})")
@@ -0,0 +1,223 @@
+# sonuc_onbellegi.py - Aynı girdi ve sütun eşleşmesiyle tekrarlanan analizlerin sonuç önbelleği
+#
+# Anahtar: iki girdi dosyasının parmak izi (yol, boyut, değişiklik zamanı),
+# çözülen sütun eşleşmesi ve sonucu üreten kodun sürümü. Sonuç çerçevesi ve
+# eşleşme istatistikleri kullanıcı dizininde pickle olarak tutulur; isabette
+# analiz hiçbir aşamayı çalıştırmadan sonucu döndürür. KARLILIK_RESULT_CACHE=0
+# ile kapatılır.
+
+import hashlib
+import json
+import os
+import pickle
+from datetime import datetime
+
+from girdi_onbellegi import file_fingerprint
+from uygulama_dizini import app_data_dir
+
+
+enabled = os.environ.get('KARLILIK_RESULT_CACHE', '1') not in ('', '0')
+
+# Saklanan en fazla sonuç - en uzun süredir kullanılmayan silinir
+MAX_RESULT_ENTRIES = 5
+
+# Sonucu etkileyen kaynak dosyalar - biri değişince eski sonuçlar ve aşama ara
+# kayıtları kullanılmaz (sütun rolleri ve aşama anahtarları da sonucu belirler)
+RESULT_SOURCES = ('karlilik.py', 'sutun_eslestirme.py', 'asama_grafi.py')
+
+# Kaynak dosyalar okunamazsa (ör. paketlenmiş exe) kullanılan sürüm; sonuç
+# hesabı veya saklama biçimi değiştiğinde artırılmalı
+RESULT_FORMAT_VERSION = 1
+
+INDEX_FILE_NAME = 'dizin.json'
+
+_code_version = None
+
+
+def code_version():
+    """Sonucu üreten kodun sürümü - kaynak dosyaların özeti"""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(f"v{RESULT_FORMAT_VERSION}".encode())
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            for name in RESULT_SOURCES:
+                with open(os.path.join(base_dir, name), 'rb') as f:
+                    digest.update(f.read())
+            _code_version = digest.hexdigest()[:16]
+        except OSError:
+            _code_version = f"v{RESULT_FORMAT_VERSION}"
+    return _code_version
+
+
+def normalize_mapping(mapping):
+    """Sütun eşleşmesini JSON'da karşılaştırılabilir hâle getir (sütun adları metne çevrilir)"""
+    return {role: None if column is None else str(column) for role, column in sorted(mapping.items())}
+
+
+def result_key(fingerprints, mapping):
+    """Parmak izleri, eşleşme ve kod sürümünden sonucun anahtarı - aynı anahtar aynı sonucu verir
+    
+    Önbellek kapalıyken de sonucun değişip değişmediğini anlamak için kullanılır.
+    """
+    payload = json.dumps({
+        'inputs': [list(fingerprint) for fingerprint in fingerprints],
+        'mapping': normalize_mapping(mapping),
+        'version': code_version()
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+class ResultCache:
+    """Analiz sonuçlarının disk önbelleği (işçi tarafı)
+    
+    Dizin dosyası her kaydın parmak izlerini, eşleşmesini ve sürümünü tutar;
+    sonuç verisi kayıt başına ayrı pickle dosyasındadır. Bozuk veya eksik
+    kayıt yok sayılır ve silinir - önbellek hatası analizi durdurmaz.
+    """
+    
+    def __init__(self, directory=None, max_entries=MAX_RESULT_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+    
+    def _directory(self):
+        if self.directory is None:
+            self.directory = app_data_dir('sonuc_onbellegi')
+        return self.directory
+    
+    def _index_path(self):
+        return os.path.join(self._directory(), INDEX_FILE_NAME)
+    
+    def _load_index(self):
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                return json.load(f).get('entries', [])
+        except (OSError, ValueError, AttributeError):
+            return []
+    
+    def _save_index(self, entries):
+        path = self._index_path()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': entries}, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
+    
+    def _data_path(self, key):
+        return os.path.join(self._directory(), f"{key}.pickle")
+    
+    def make_key(self, fingerprints, mapping):
+        """Parmak izleri, eşleşme ve kod sürümünden kayıt anahtarı"""
+        return result_key(fingerprints, mapping)
+    
+    def lookup(self, karlilik_path, iskonto_path, mapping=None):
+        """Dosyalar değişmediyse kayıtlı sonucu döndür, yoksa None
+        
+        mapping verilmezse (girdiler henüz çözülmediyse) yalnızca sütunları
+        otomatik bulunmuş kayıtlar kullanılır - aynı dosyada otomatik tespit
+        her zaman aynı sütunları verir. Soru sorularak çözülmüş eşleşmeler
+        ancak aynı eşleşme verildiğinde kullanılır.
+        
+        Returns:
+            dict: {'df', 'eslesen_sayisi', 'eslesmeyenler', 'output', 'mapping', 'key', 'created_at'}
+        """
+        fingerprints = (file_fingerprint(karlilik_path), file_fingerprint(iskonto_path))
+        if None in fingerprints:
+            return None
+        
+        entries = self._load_index()
+        for entry in entries:
+            if mapping is not None:
+                key = self.make_key(fingerprints, mapping)
+            elif entry.get('auto_mapping'):
+                key = self.make_key(fingerprints, entry.get('mapping', {}))
+            else:
+                continue
+            if entry.get('key') != key:
+                continue
+            
+            try:
+                with open(self._data_path(key), 'rb') as f:
+                    payload = pickle.load(f)
+            except Exception as e:
+                print(f"Sonuç önbelleği okunamadı, kayıt siliniyor: {e}")
+                self._remove(key)
+                return None
+            
+            # En son kullanılan başa alınır
+            entry['used_at'] = datetime.now().isoformat(timespec='seconds')
+            entries.remove(entry)
+            entries.insert(0, entry)
+            try:
+                self._save_index(entries)
+            except OSError:
+                pass
+            
+            return dict(payload, output=entry.get('output'), mapping=entry.get('mapping'),
+                        key=key, created_at=entry.get('created_at'))
+        return None
+    
+    def store(self, fingerprints, mapping, auto_mapping, sonuc_df, eslesen_sayisi, eslesmeyenler, output_path):
+        """Sonucu kaydet - fingerprints analiz başlamadan önce alınmış olmalıdır
+        
+        Args:
+            fingerprints: (karlılık, iskonto) file_fingerprint değerleri
+            mapping: {rol: sütun adı} çözülen sütun eşleşmesi
+            auto_mapping: Eşleşme soru sorulmadan ve otomatik tespitle aynı bulunduysa True
+        """
+        if None in fingerprints:
+            return
+        key = self.make_key(fingerprints, mapping)
+        data_path = self._data_path(key)
+        temp_path = f"{data_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump({
+                'df': sonuc_df,
+                'eslesen_sayisi': eslesen_sayisi,
+                'eslesmeyenler': list(eslesmeyenler)
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, data_path)
+        
+        now = datetime.now().isoformat(timespec='seconds')
+        entries = [entry for entry in self._load_index() if entry.get('key') != key]
+        entries.insert(0, {
+            'key': key,
+            'inputs': [os.path.basename(fingerprint[0]) for fingerprint in fingerprints],
+            'mapping': normalize_mapping(mapping),
+            'auto_mapping': bool(auto_mapping),
+            'version': code_version(),
+            'rows': len(sonuc_df),
+            'eslesen_sayisi': eslesen_sayisi,
+            'eslesmeyen_sayisi': len(eslesmeyenler),
+            'output': output_path,
+            'created_at': now,
+            'used_at': now
+        })
+        
+        for entry in entries[self.max_entries:]:
+            self._remove_file(entry.get('key'))
+        self._save_index(entries[:self.max_entries])
+    
+    def _remove(self, key):
+        """Kaydı dizinden ve diskten sil"""
+        self._remove_file(key)
+        try:
+            self._save_index([entry for entry in self._load_index() if entry.get('key') != key])
+        except OSError:
+            pass
+    
+    def _remove_file(self, key):
+        if not key:
+            return
+        try:
+            os.unlink(self._data_path(key))
+        except OSError:
+            pass
+    
+    def clear(self):
+        """Tüm kayıtları sil"""
+        for entry in self._load_index():
+            self._remove_file(entry.get('key'))
+        try:
+            self._save_index([])
+        except OSError:
+            pass
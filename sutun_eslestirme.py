@@ -0,0 +1,104 @@
+# sutun_eslestirme.py - Rapor sütunlarının rollere (stok, fiyat, miktar...) eşlenmesi
+#
+# Her rolün eş anlamlı kuralları modül yüklenirken bir kez derlenir. Eşleştirme
+# sırasında her sütun adı bir kez normalize edilir ve istenen roller aynı
+# geçişte çözülür.
+
+import re
+
+
+# Türkçe karakterlerin karşılıkları - adlar önce küçük harfe çevrilir
+TURKCE_KARSILIKLAR = str.maketrans({
+    'ı': 'i', 'İ': 'i', 'I': 'i',
+    'ş': 's', 'Ş': 's', 'ç': 'c', 'Ç': 'c',
+    'ğ': 'g', 'Ğ': 'g', 'ü': 'u', 'Ü': 'u',
+    'ö': 'o', 'Ö': 'o'
+})
+
+
+def normalize_header(text):
+    """Sütun adını karşılaştırma için küçük harf ve Türkçe karaktersiz hâle getir"""
+    if text is None or text != text:
+        return ""
+    # 'İ'.lower() noktalı 'i̇' verir, tek harfe indirilir
+    return str(text).lower().strip().replace('i̇', 'i').translate(TURKCE_KARSILIKLAR)
+
+
+def contains(*parts, exclude=()):
+    """Normalize edilmiş adda tüm parçaların geçtiği, exclude'dakilerin geçmediği kural
+    
+    Parça tuple ise içindekilerden biri yeterlidir.
+    """
+    lookaheads = []
+    for part in parts:
+        options = part if isinstance(part, tuple) else (part,)
+        lookaheads.append(f"(?=.*(?:{'|'.join(re.escape(option) for option in options)}))")
+    for part in exclude:
+        lookaheads.append(f"(?!.*{re.escape(part)})")
+    return ('desen', re.compile(''.join(lookaheads), re.DOTALL))
+
+
+def exact(name):
+    """Sütun adının birebir eşleştiği kural"""
+    return ('ad', name)
+
+
+# Rol -> öncelik sırasıyla kurallar. Her kural için sütunlar soldan taranır;
+# kuralın eşleşmesi yoksa sıradakine geçilir.
+ROLE_RULES = {
+    'karlilik_stok': (contains('stok', 'ismi'), contains('stok', 'kodu')),
+    'iskonto_fiyat': (contains('fiyat', exclude=('liste',)),),
+    'iskonto_stok': (contains('stok', ('isim', 'ismi')),),
+    'ort_satis_fiyat': (contains('ort', 'satis', 'fiyat'), exact('Ort.Satış\nFiyat'),
+                        exact('Ort Satış Fiyat'), exact('Ortalama Fiyat')),
+    'satis_miktar': (contains('satis', 'miktar'), exact('Satış\nMiktar'), exact('Satis Miktar'), exact('Miktar')),
+    
+    # Sonuç tablosunun sütunları - ilk kural standart ad, diğerleri alternatifler
+    'sonuc_satis_miktar': (exact('Satış Miktar'), exact('Satış\nMiktar'), exact('Satis Miktar'), exact('Miktar')),
+    'sonuc_ort_satis_fiyat': (exact('Ort.Satış Fiyat'), exact('Ort.Satış\nFiyat'),
+                              exact('Ort Satış Fiyat'), exact('Ortalama Fiyat')),
+    'sonuc_satis_tutar': (exact('Satış Tutar'), exact('Satış\nTutar'), exact('Satis Tutar'), exact('Tutar')),
+    'sonuc_birim_maliyet': (exact('Birim Maliyet'), exact('Birim\nMaliyet'), exact('Maliyet')),
+    'sonuc_birim_kar': (exact('Birim Kar'), exact('Birim\nKar'), exact('Kar')),
+    'sonuc_net_kar': (exact('Net Kar'), exact('Net\nKar'), exact('Toplam Kar'))
+}
+
+# Dosya türlerinin profillerde saklanan rolleri
+KARLILIK_ROLES = ('karlilik_stok', 'satis_miktar', 'ort_satis_fiyat')
+ISKONTO_ROLES = ('iskonto_fiyat', 'iskonto_stok')
+
+# Sonuç tablosuna stok sütunundan sonra bu sırayla girenler
+RESULT_ROLES = ('sonuc_satis_miktar', 'sonuc_ort_satis_fiyat', 'sonuc_satis_tutar',
+                'sonuc_birim_maliyet', 'sonuc_birim_kar', 'sonuc_net_kar')
+
+
+class ColumnMatcher:
+    """Derlenmiş rol kurallarıyla sütun eşleştirici"""
+    
+    def __init__(self, rules=ROLE_RULES):
+        self.rules = rules
+    
+    def match_ranked(self, columns, roles=None):
+        """Rolleri çöz - {rol: (sütun, eşleşen kuralın sırası)}, bulunamayan rol yer almaz"""
+        columns = list(columns)
+        normalized = None
+        result = {}
+        for role in (self.rules if roles is None else roles):
+            for rank, (kind, rule) in enumerate(self.rules[role]):
+                if kind == 'ad':
+                    found = next((column for column in columns if column == rule), None)
+                else:
+                    if normalized is None:
+                        normalized = [normalize_header(column) for column in columns]
+                    found = next((column for column, name in zip(columns, normalized) if rule.match(name)), None)
+                if found is not None:
+                    result[role] = (found, rank)
+                    break
+        return result
+    
+    def match(self, columns, roles=None):
+        """Rolleri çöz - {rol: sütun}, bulunamayan rol yer almaz"""
+        return {role: column for role, (column, _) in self.match_ranked(columns, roles).items()}
+
+
+COLUMN_MATCHER = ColumnMatcher()
@@ -0,0 +1,135 @@
+# sutun_profilleri.py - Rapor düzenlerine göre kaydedilmiş sütun eşleşmeleri
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+
+from uygulama_dizini import app_data_dir
+
+
+# Saklanan en fazla profil - en uzun süredir kullanılmayan silinir
+MAX_PROFILES = 50
+
+PROFILES_FILE_NAME = 'sutun_profilleri.json'
+
+
+def header_key(columns):
+    """Başlık satırının özeti - aynı sıradaki aynı sütun adları aynı anahtarı verir"""
+    payload = json.dumps([str(column) for column in columns], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+
+class ColumnProfiles:
+    """Çözülmüş sütun eşleşmelerini başlık özetine göre JSON'da tutan sınıf
+    
+    Profil rol başına sütunun sırasını saklar; başlık özeti aynı olduğu için
+    sıra aynı sütunu gösterir (sayısal sütun adları da bozulmaz). Aynı düzende
+    rapor tekrar geldiğinde eşleşme soru sorulmadan kullanılır. Dosya okunamaz
+    veya yazılamazsa profiller bellekte çalışmaya devam eder; hata log_callback
+    ile bildirilir. Aynı nesne işçinin ana ve ön ısıtma thread'lerinde
+    kullanılır - okuma ve yazmalar kilitle sıralanır.
+    """
+    
+    def __init__(self, path=None, log_callback=None):
+        """
+        Args:
+            path: Profil dosyası (varsayılan: uygulama dizinindeki sutun_profilleri.json)
+            log_callback: (mesaj, tür) - okuma/yazma hataları 'warning' olarak bildirilir
+        """
+        self.path = path
+        self.log_callback = log_callback
+        self.profiles = []
+        self._lock = threading.Lock()
+        
+        try:
+            if self.path is None:
+                self.path = os.path.join(app_data_dir(), PROFILES_FILE_NAME)
+            self.load()
+        except Exception as e:
+            self.log_warning(f"Sütun profilleri okunamadı: {e}")
+            self.profiles = []
+    
+    def log_warning(self, message):
+        """Hata mesajını log kanalına gönder - callback yoksa konsola yaz"""
+        if self.log_callback:
+            self.log_callback(message, 'warning')
+        else:
+            print(message)
+    
+    def load(self):
+        """Profilleri dosyadan oku - bozuk kayıtlar atlanır"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.profiles = [
+            profile for profile in data.get('profiles', [])
+            if isinstance(profile, dict) and profile.get('key') and isinstance(profile.get('roles'), dict)
+        ][:MAX_PROFILES]
+    
+    def save(self):
+        """Profilleri dosyaya yaz - yarım yazılmış dosya kalmaması için benzersiz geçici dosya üzerinden
+        
+        Çağıran kilidi tutmalıdır (remember içinden çağrılır).
+        """
+        if not self.path:
+            return
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(self.path) or None,
+                                             prefix=f"{PROFILES_FILE_NAME}.", suffix='.tmp', delete=False) as f:
+                temp_path = f.name
+                json.dump({'profiles': self.profiles}, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            self.log_warning(f"Sütun profilleri yazılamadı: {e}")
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+    
+    def lookup(self, kind, columns):
+        """Bu başlık için kayıtlı eşleşme - {rol: sütun}, profil yoksa boş sözlük"""
+        columns = list(columns)
+        key = header_key(columns)
+        with self._lock:
+            for profile in self.profiles:
+                if profile['key'] == key and profile.get('kind') == kind:
+                    return {
+                        role: columns[index] for role, index in profile['roles'].items()
+                        if isinstance(index, int) and 0 <= index < len(columns)
+                    }
+        return {}
+    
+    def remember(self, kind, columns, mapping):
+        """Eşleşmeyi başlığın profili olarak kaydet ve listenin başına al
+        
+        Args:
+            kind: Dosya türü ('karlilik'/'iskonto')
+            columns: Çerçevenin sütunları (başlık satırı)
+            mapping: {rol: sütun} - bulunamayan roller (None) kaydedilmez
+        """
+        columns = list(columns)
+        key = header_key(columns)
+        roles = {role: columns.index(column) for role, column in mapping.items() if column in columns}
+        if not roles:
+            return
+        
+        with self._lock:
+            self.profiles = [
+                profile for profile in self.profiles
+                if not (profile['key'] == key and profile.get('kind') == kind)
+            ]
+            self.profiles.insert(0, {
+                'key': key,
+                'kind': kind,
+                'roles': roles,
+                'columns': {role: str(columns[index]) for role, index in roles.items()},
+                'used_at': datetime.now().isoformat(timespec='seconds')
+            })
+            del self.profiles[MAX_PROFILES:]
+            self.save()
@@ -0,0 +1,6 @@
+# conftest.py - Testler depo kökündeki modülleri doğrudan içe aktarır
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,183 @@
+# test_asama_grafi.py - Aşama grafiği, ara sonuç belleği ve disk kayıtları (user-049)
+
+import os
+
+import pytest
+
+from asama_grafi import Stage, StageGraph, StageMemo
+
+
+STAGES = (
+    Stage('a_oku', "A okuma", source='a'),
+    Stage('b_oku', "B okuma", source='b'),
+    Stage('eslesme', "Eşleşme", deps=('a_oku', 'b_oku'), key_output=True),
+    Stage('birlesim', "Birleşim", deps=('a_oku', 'eslesme'), memory=False),
+    Stage('sonuc', "Sonuç", deps=('birlesim', 'b_oku'), memory=False),
+)
+
+
+class Runner:
+    """Aşamaları dosya içerikleriyle hesaplayan ve çağrıları sayan çalıştırıcı"""
+    
+    def __init__(self, mapping='x'):
+        self.mapping = mapping
+        self.calls = []
+        self.reused = []
+    
+    def execute(self, stage, inputs):
+        self.calls.append(stage.name)
+        if stage.source is not None:
+            with open(inputs['path'], encoding='utf-8') as f:
+                return f.read()
+        if stage.name == 'eslesme':
+            return {'sutun': self.mapping}
+        if stage.name == 'birlesim':
+            return f"{inputs['a_oku']}+{inputs['eslesme']['sutun']}"
+        return f"{inputs['birlesim']}|{inputs['b_oku']}"
+    
+    def on_reuse(self, stage, where):
+        self.reused.append((stage.name, where))
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = {}
+    for kind in ('a', 'b'):
+        path = tmp_path / f"{kind}.txt"
+        path.write_text(kind.upper(), encoding='utf-8')
+        paths[kind] = str(path)
+    return paths
+
+
+def rewrite(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    # Değişiklik zamanı çözünürlüğüne takılmamak için boyut da değişir
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10 ** 9))
+
+
+def test_run_without_memo_computes_each_stage_once(sources):
+    runner = Runner()
+    result = StageGraph(STAGES).run('sonuc', sources, runner.execute)
+    
+    assert result == {'sonuc': 'A+x|B'}
+    assert sorted(runner.calls) == ['a_oku', 'b_oku', 'birlesim', 'eslesme', 'sonuc']
+
+
+def test_memory_reuse_skips_unchanged_stages(sources):
+    graph = StageGraph(STAGES, StageMemo())
+    graph.run('sonuc', sources, Runner().execute)
+    
+    runner = Runner()
+    result = graph.run('sonuc', sources, runner.execute, on_reuse=runner.on_reuse)
+    
+    # Bellekte tutulmayan aşamalar (memory=False) yeniden hesaplanır
+    assert result == {'sonuc': 'A+x|B'}
+    assert runner.calls == ['birlesim', 'sonuc']
+    assert ('a_oku', 'bellek') in runner.reused and ('eslesme', 'bellek') in runner.reused
+
+
+def test_changed_source_reruns_only_its_stages(sources):
+    graph = StageGraph(STAGES, StageMemo())
+    graph.run('sonuc', sources, Runner().execute)
+    
+    rewrite(sources['b'], 'B2')
+    runner = Runner()
+    result = graph.run('sonuc', sources, runner.execute)
+    
+    assert result == {'sonuc': 'A+x|B2'}
+    assert 'a_oku' not in runner.calls
+    assert 'b_oku' in runner.calls
+
+
+def test_checkpoints_resume_in_new_memo(sources, tmp_path):
+    checkpoint_dir = str(tmp_path / 'ara')
+    os.mkdir(checkpoint_dir)
+    StageGraph(STAGES, StageMemo(checkpoint_dir)).run('sonuc', sources, Runner().execute)
+    
+    # Yeni süreç gibi: bellek boş, kayıtlar diskte
+    runner = Runner()
+    result = StageGraph(STAGES, StageMemo(checkpoint_dir)).run(
+        'sonuc', sources, runner.execute, on_reuse=runner.on_reuse)
+    
+    assert result == {'sonuc': 'A+x|B'}
+    assert runner.calls == []
+    assert ('sonuc', 'disk') in runner.reused
+    # Aşama başına tek kayıt kalır
+    names = os.listdir(checkpoint_dir)
+    assert len(names) == len(STAGES)
+
+
+def test_stale_checkpoint_is_replaced(sources, tmp_path):
+    checkpoint_dir = str(tmp_path / 'ara')
+    os.mkdir(checkpoint_dir)
+    StageGraph(STAGES, StageMemo(checkpoint_dir)).run('sonuc', sources, Runner().execute)
+    rewrite(sources['a'], 'A2')
+    
+    runner = Runner()
+    result = StageGraph(STAGES, StageMemo(checkpoint_dir)).run('sonuc', sources, runner.execute)
+    
+    assert result == {'sonuc': 'A2+x|B'}
+    assert 'b_oku' not in runner.calls
+    assert len([name for name in os.listdir(checkpoint_dir) if name.startswith('a_oku_')]) == 1
+
+
+def test_unreadable_checkpoint_is_recomputed(sources, tmp_path):
+    checkpoint_dir = str(tmp_path / 'ara')
+    os.mkdir(checkpoint_dir)
+    StageGraph(STAGES, StageMemo(checkpoint_dir)).run('sonuc', sources, Runner().execute)
+    for name in os.listdir(checkpoint_dir):
+        if name.startswith('sonuc_'):
+            with open(os.path.join(checkpoint_dir, name), 'wb') as f:
+                f.write(b'bozuk')
+    
+    runner = Runner()
+    result = StageGraph(STAGES, StageMemo(checkpoint_dir)).run('sonuc', sources, runner.execute)
+    
+    assert result == {'sonuc': 'A+x|B'}
+    assert 'sonuc' in runner.calls
+
+
+def test_changed_key_output_invalidates_consumers(sources, tmp_path):
+    checkpoint_dir = str(tmp_path / 'ara')
+    os.mkdir(checkpoint_dir)
+    memo = StageMemo(checkpoint_dir)
+    graph = StageGraph(STAGES, memo)
+    graph.run('sonuc', sources, Runner('x').execute)
+    
+    # Eşleşme farklı cevaplandı - aynı dosyalarla eski birleşim/sonuç kullanılmamalı
+    memo.discard('eslesme')
+    for name in os.listdir(checkpoint_dir):
+        if name.startswith('eslesme_'):
+            os.unlink(os.path.join(checkpoint_dir, name))
+    
+    runner = Runner('y')
+    result = graph.run('sonuc', sources, runner.execute)
+    
+    assert result == {'sonuc': 'A+y|B'}
+    assert runner.calls == ['eslesme', 'birlesim', 'sonuc']
+    assert graph.peek('eslesme', sources) == {'sutun': 'y'}
+
+
+def test_none_output_stops_run(sources):
+    runner = Runner()
+    
+    def execute(stage, inputs):
+        return None if stage.name == 'eslesme' else runner.execute(stage, inputs)
+    
+    assert StageGraph(STAGES, StageMemo()).run('sonuc', sources, execute) == {}
+    assert 'birlesim' not in runner.calls
+
+
+def test_peek_never_runs_stages(sources):
+    graph = StageGraph(STAGES, StageMemo())
+    assert graph.peek('a_oku', sources) is None
+    
+    graph.run('a_oku', sources, Runner().execute)
+    assert graph.peek('a_oku', sources) == 'A'
+    assert graph.peek('eslesme', sources) is None
+
+
+def test_keep_returns_intermediate_stages(sources):
+    result = StageGraph(STAGES).run('sonuc', sources, Runner().execute, keep=('eslesme',))
+    assert set(result) == {'sonuc', 'eslesme'}
@@ -0,0 +1,119 @@
+# test_donma_izleyici.py - Donma izleyicisinin histogram ve yığın yakalaması (user-040)
+
+import os
+import threading
+
+import donma_izleyici
+from donma_izleyici import StallWatchdog, HISTOGRAM_BUCKETS_MS, bucket_labels
+
+
+class FakeRoot:
+    """after/after_cancel çağrılarını kaydeden Tk yerine geçen nesne"""
+    
+    def __init__(self):
+        self.scheduled = []
+    
+    def after(self, ms, callback):
+        self.scheduled.append((ms, callback))
+        return f"after#{len(self.scheduled)}"
+    
+    def after_cancel(self, job):
+        pass
+
+
+def blocked_thread(filename, function_name):
+    """Verilen dosya adıyla derlenmiş bir fonksiyonun içinde bekleyen thread"""
+    source = f"def {function_name}(event):\n    event.wait()\n"
+    namespace = {}
+    exec(compile(source, filename, 'exec'), namespace)
+    
+    event = threading.Event()
+    thread = threading.Thread(target=namespace[function_name], args=(event,), daemon=True)
+    thread.start()
+    return thread, event
+
+
+def test_bucket_boundaries():
+    assert StallWatchdog._bucket(0) == 0
+    assert StallWatchdog._bucket(15.9) == 0
+    assert StallWatchdog._bucket(16) == 1
+    assert StallWatchdog._bucket(249) == 3
+    assert StallWatchdog._bucket(HISTOGRAM_BUCKETS_MS[-1]) == len(HISTOGRAM_BUCKETS_MS)
+    assert StallWatchdog._bucket(60000) == len(HISTOGRAM_BUCKETS_MS)
+
+
+def test_bucket_labels_match_histogram():
+    labels = bucket_labels()
+    
+    assert len(labels) == len(HISTOGRAM_BUCKETS_MS) + 1
+    assert labels[0] == "<16 ms"
+    assert labels[1] == "16-50 ms"
+    assert labels[-1] == "≥2000 ms"
+
+
+def test_beat_records_latency_and_delivers_reports(monkeypatch):
+    root = FakeRoot()
+    delivered = []
+    watchdog = StallWatchdog(root, report_callback=delivered.append, interval_ms=200)
+    
+    # Kalp atışı 200 ms yerine 500 ms sonra geldi: 300 ms gecikme
+    monkeypatch.setattr(donma_izleyici.time, 'perf_counter', lambda: 10.5)
+    watchdog._last_beat = 10.0
+    watchdog._pending_reports.append({'lag_seconds': 0.26})
+    watchdog._beat()
+    
+    assert watchdog.beats == 1
+    assert abs(watchdog.max_latency - 0.3) < 1e-9
+    assert watchdog.histogram[StallWatchdog._bucket(300)] == 1
+    assert sum(watchdog.histogram) == 1
+    assert abs(delivered[0]['total_seconds'] - 0.3) < 1e-9
+    assert watchdog._pending_reports == []
+    
+    # Sonraki kalp atışı planlanır
+    assert root.scheduled == [(200, watchdog._beat)]
+
+
+def test_beat_stops_rescheduling_after_stop():
+    root = FakeRoot()
+    watchdog = StallWatchdog(root)
+    watchdog._last_beat = 0.0
+    watchdog.stop()
+    watchdog._beat()
+    
+    assert root.scheduled == []
+
+
+def test_capture_reports_innermost_app_frame():
+    filename = os.path.join(donma_izleyici.APP_DIR, 'sahte_arayuz.py')
+    thread, event = blocked_thread(filename, 'uzun_islem')
+    try:
+        watchdog = StallWatchdog(FakeRoot())
+        watchdog._main_thread_id = thread.ident
+        report = watchdog.capture(0.4)
+    finally:
+        event.set()
+        thread.join()
+    
+    assert report['lag_seconds'] == 0.4
+    assert report['location'] == "sahte_arayuz.py:2 uzun_islem"
+    assert any('sahte_arayuz.py' in entry for entry in report['stack'])
+
+
+def test_capture_ignores_modal_dialogs(tmp_path):
+    thread, event = blocked_thread(str(tmp_path / 'simpledialog.py'), 'askstring')
+    try:
+        watchdog = StallWatchdog(FakeRoot())
+        watchdog._main_thread_id = thread.ident
+        report = watchdog.capture(1.0)
+    finally:
+        event.set()
+        thread.join()
+    
+    assert report is None
+
+
+def test_capture_without_main_thread_returns_none():
+    watchdog = StallWatchdog(FakeRoot())
+    watchdog._main_thread_id = -1
+    
+    assert watchdog.capture(1.0) is None
@@ -0,0 +1,105 @@
+# test_ilerleme.py - Satır sayısına dayalı ilerleme ve kalan süre tahmini (user-037)
+
+import pytest
+
+import ilerleme
+from ilerleme import ProgressReporter, RateEstimator, format_duration, format_progress_detail
+
+
+PHASES = {
+    'okuma': (0, 40, "Okunuyor..."),
+    'hesap': (40, 100, "Hesaplanıyor...")
+}
+
+
+@pytest.fixture
+def reports():
+    return []
+
+
+@pytest.fixture
+def reporter(reports, monkeypatch):
+    # Aralık sınırı yok - her advance bildirilir
+    monkeypatch.setattr(ilerleme, 'REPORT_INTERVAL', 0)
+    return ProgressReporter(lambda value, status, detail: reports.append((value, status, detail)), PHASES)
+
+
+def test_phase_range_is_filled_by_done_over_total(reporter, reports):
+    reporter.start('okuma', total=200)
+    reporter.advance(50)
+    reporter.advance(400)
+    
+    assert [value for value, _, _ in reports] == [0, 10, 40]
+    assert reports[-1][1] == "Okunuyor..."
+    assert reports[-1][2] == {'phase': 'okuma', 'done': 400, 'total': 200, 'unit': 'satır'}
+
+
+def test_unknown_total_stays_at_phase_start(reporter, reports):
+    reporter.start('hesap')
+    reporter.advance(1000)
+    reporter.set_total(0)
+    reporter.advance(2000)
+    
+    assert [value for value, _, _ in reports] == [40, 40, 40]
+    assert reports[-1][2]['done'] == 2000
+
+
+def test_advance_is_throttled(reports, monkeypatch):
+    monkeypatch.setattr(ilerleme, 'REPORT_INTERVAL', 3600)
+    reporter = ProgressReporter(lambda *args: reports.append(args), PHASES)
+    reporter.start('okuma', total=10)
+    reporter.advance(5)
+    reporter.advance(10, force=True)
+    
+    assert [value for value, _, _ in reports] == [0, 40]
+
+
+def test_advance_before_start_is_ignored(reporter, reports):
+    reporter.advance(10)
+    assert reports == []
+
+
+def test_rate_estimator_smooths_rates_and_estimates_eta():
+    estimator = RateEstimator(smoothing=0.5, sample_seconds=1.0)
+    detail = {'phase': 'okuma', 'done': 0}
+    
+    assert estimator.update(0, detail, now=0.0) == (None, None)
+    
+    # 1 sn'de %10 ve 1000 satır
+    unit_rate, eta = estimator.update(10, dict(detail, done=1000), now=1.0)
+    assert unit_rate == pytest.approx(1000)
+    assert eta == pytest.approx(9.0)
+    
+    # İkinci örnek %30/sn ve 3000 satır/sn - yarı yarıya karışır
+    unit_rate, eta = estimator.update(40, dict(detail, done=4000), now=2.0)
+    assert unit_rate == pytest.approx(2000)
+    assert eta == pytest.approx(60 / 20)
+
+
+def test_rate_estimator_ignores_short_samples_and_resets_on_phase_change():
+    estimator = RateEstimator(smoothing=0.5, sample_seconds=1.0)
+    estimator.update(0, {'phase': 'okuma', 'done': 0}, now=0.0)
+    assert estimator.update(5, {'phase': 'okuma', 'done': 500}, now=0.5) == (None, None)
+    
+    estimator.update(10, {'phase': 'okuma', 'done': 1000}, now=1.0)
+    unit_rate, eta = estimator.update(20, {'phase': 'hesap', 'done': 10}, now=2.0)
+    
+    # Birim hızı yeni aşamada sıfırdan başlar, yüzde hızı sürer
+    assert unit_rate is None
+    assert eta is not None
+    
+    estimator.reset()
+    assert estimator.update(20, None, now=3.0) == (None, None)
+
+
+def test_format_duration():
+    assert format_duration(44.6) == "45 sn"
+    assert format_duration(190) == "3 dk 10 sn"
+    assert format_duration(3900) == "1 sa 5 dk"
+
+
+def test_format_progress_detail():
+    detail = {'done': 12000, 'total': 20000, 'unit': 'satır'}
+    assert format_progress_detail(detail, 8400, 65) == "12.000 / 20.000 satır · 8.400 satır/sn · kalan ~1 dk 5 sn"
+    assert format_progress_detail({'done': 0, 'unit': 'satır'}) == ""
+    assert format_progress_detail(None, None, 30) == "kalan ~30 sn"
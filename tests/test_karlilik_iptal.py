@@ -0,0 +1,140 @@
+# test_karlilik_iptal.py - Analizin ve arka plan hazırlığının işbirlikçi iptali (user-033)
+
+import multiprocessing
+import os
+
+import pytest
+
+from asama_grafi import StageMemo
+from benchmarks.synthetic_reports import write_iskonto, write_karlilik
+from karlilik import AnalysisCancelled, CancellationToken, GenerationToken, KarlilikAnalizi
+from sonuc_onbellegi import ResultCache
+
+
+ROWS = 200
+
+
+@pytest.fixture(scope='module')
+def reports(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('raporlar')
+    sources = {'karlilik': str(directory / 'karlilik.xlsx'), 'iskonto': str(directory / 'iskonto.xlsx')}
+    write_karlilik(sources['karlilik'], ROWS)
+    write_iskonto(sources['iskonto'], ROWS)
+    return sources
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    for name in ('ara', 'onbellek'):
+        (tmp_path / name).mkdir()
+    return tmp_path
+
+
+def make_analysis(dirs, token, cancel_at=None, on_cancel=None):
+    """Önbellek ve ara kayıtlı analiz - cancel_at aşaması başlarken on_cancel çağrılır"""
+    analiz = KarlilikAnalizi(
+        cancel_token=token,
+        stage_memo=StageMemo(str(dirs / 'ara')),
+        result_cache=ResultCache(str(dirs / 'onbellek')),
+        column_callback=lambda title, prompt: pytest.fail("sütun sorulmamalı"),
+        save_path_callback=lambda: str(dirs / 'sonuc.xlsx')
+    )
+    start = analiz.progress.start
+    
+    def start_phase(phase, total=None):
+        if phase == cancel_at:
+            (on_cancel or token.cancel)()
+        return start(phase, total)
+    
+    analiz.progress.start = start_phase
+    return analiz
+
+
+def assert_nothing_half_written(dirs, analiz):
+    """Yarım ara kayıt, önbellek kaydı veya sonuç dosyası kalmamış olmalı"""
+    assert not [name for name in os.listdir(dirs / 'ara') if not name.endswith('.pickle')]
+    assert analiz.result_cache._load_index() == []
+    assert not os.path.exists(dirs / 'sonuc.xlsx')
+
+
+def test_tokens_raise_when_cancelled_or_superseded():
+    token = CancellationToken()
+    token.check()
+    token.cancel()
+    with pytest.raises(AnalysisCancelled):
+        token.check()
+    token.reset()
+    token.check()
+    
+    counter = multiprocessing.Value('i', 1)
+    generation = GenerationToken(counter, 1)
+    generation.check()
+    counter.value += 1
+    with pytest.raises(AnalysisCancelled):
+        generation.check()
+
+
+def test_cancel_before_start_runs_no_stage(reports, dirs):
+    token = CancellationToken()
+    token.cancel()
+    analiz = make_analysis(dirs, token)
+    
+    assert analiz.analyze(reports['karlilik'], reports['iskonto']) is None
+    assert analiz.last_report['outcome'] == 'iptal'
+    assert os.listdir(dirs / 'ara') == []
+    assert_nothing_half_written(dirs, analiz)
+
+
+def test_token_cancelled_before_stage_stops_at_that_stage(reports, dirs):
+    token = CancellationToken()
+    
+    # Kar aşaması iptale rağmen biter; sonraki aşama başlamadan durulur
+    analiz = make_analysis(dirs, token, cancel_at='kar')
+    
+    assert analiz.analyze(reports['karlilik'], reports['iskonto']) is None
+    assert analiz.last_report['outcome'] == 'iptal'
+    assert analiz.stage_graph.peek('kar', reports) is not None
+    assert analiz.stage_graph.peek('sonuc', reports) is None
+    assert_nothing_half_written(dirs, analiz)
+    
+    with pytest.raises(AnalysisCancelled):
+        analiz.stage_executor(None)(analiz.stage_graph.stages['sonuc'], {})
+
+
+def test_cancel_inside_stage_leaves_no_memo_entry(reports, dirs):
+    token = CancellationToken()
+    analiz = make_analysis(dirs, token, cancel_at='karlilik_okuma')
+    
+    assert analiz.analyze(reports['karlilik'], reports['iskonto']) is None
+    assert analiz.stage_graph.peek('karlilik_oku', reports) is None
+    assert not [name for name in os.listdir(dirs / 'ara') if name.startswith('karlilik_oku_')]
+    assert_nothing_half_written(dirs, analiz)
+    
+    # Yeni analiz yarıda kalan aşamayı baştan yapar ve tamamlanır
+    token.reset()
+    result = make_analysis(dirs, token).analyze(reports['karlilik'], reports['iskonto'])
+    assert len(result) == ROWS
+    assert os.path.exists(dirs / 'sonuc.xlsx')
+
+
+def test_superseded_preparation_is_dropped(reports, dirs):
+    counter = multiprocessing.Value('i', 1)
+    
+    def select_new_file():
+        counter.value += 1
+    
+    # Hazırlık sürerken aynı türde yeni dosya seçildi
+    preparer = make_analysis(dirs, GenerationToken(counter, 1), cancel_at='karlilik_okuma',
+                             on_cancel=select_new_file)
+    with pytest.raises(AnalysisCancelled):
+        preparer.prepare_input('karlilik', reports)
+    
+    assert preparer.stage_graph.peek('karlilik_oku', reports) is None
+    assert os.listdir(dirs / 'ara') == []
+    
+    # Güncel neslin hazırlığı kaydedilir
+    current = make_analysis(dirs, GenerationToken(counter, counter.value))
+    prepared = current.prepare_input('karlilik', reports)
+    assert prepared['rows'] >= ROWS
+    assert prepared['needs_columns'] is None
+    assert current.stage_graph.peek('karlilik_oku', reports) is not None
@@ -0,0 +1,77 @@
+# test_log_gecmisi.py - Log geçmişinin dönen dosyalara yazılması ve aranması (user-035)
+
+import os
+from datetime import datetime
+
+import log_gecmisi
+from log_gecmisi import LogHistory
+
+
+STAMP = datetime(2026, 1, 2, 3, 4, 5)
+
+
+def test_written_lines_are_searchable(tmp_path):
+    history = LogHistory(str(tmp_path / 'gecmis.log'))
+    history.write([("Analiz başladı", 'info'), ("✗ HATA: dosya yok", 'error')], STAMP)
+    
+    # Büyük/küçük harf duyarsız, yazılanlar flush edilmeden de bulunur
+    matches, total = history.search("hata")
+    history.close()
+    
+    assert total == 1
+    assert matches == ["[2026-01-02 03:04:05] [error] ✗ HATA: dosya yok"]
+
+
+def test_multiline_message_stays_one_record(tmp_path):
+    history = LogHistory(str(tmp_path / 'gecmis.log'))
+    history.write([("Satır 1\nSatır 2", 'warning')], STAMP)
+    history.close()
+    
+    with open(history.path, encoding='utf-8') as f:
+        assert f.read().splitlines() == ["[2026-01-02 03:04:05] [warning] Satır 1 ⏎ Satır 2"]
+
+
+def test_search_keeps_newest_matches_and_counts_all(tmp_path):
+    history = LogHistory(str(tmp_path / 'gecmis.log'))
+    history.write([(f"kayıt {i}", 'info') for i in range(10)], STAMP)
+    matches, total = history.search("Kayıt", limit=3)
+    history.close()
+    
+    assert total == 10
+    assert [line.rsplit(' ', 1)[1] for line in matches] == ['7', '8', '9']
+
+
+def test_blank_search_returns_nothing(tmp_path):
+    history = LogHistory(str(tmp_path / 'gecmis.log'))
+    history.write([("kayıt", 'info')], STAMP)
+    assert history.search("   ") == ([], 0)
+    history.close()
+
+
+def test_full_file_spills_to_backups_and_search_spans_them(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_gecmisi, 'HISTORY_MAX_BYTES', 200)
+    monkeypatch.setattr(log_gecmisi, 'HISTORY_BACKUP_COUNT', 2)
+    history = LogHistory(str(tmp_path / 'gecmis.log'))
+    for i in range(30):
+        history.write([(f"satır {i:02d}", 'info')], STAMP)
+    
+    files = history.files()
+    matches, total = history.search("satır")
+    history.close()
+    
+    # En eskiden en yeniye: .2, .1, ana dosya; en eski satırlar silinmiştir
+    assert [os.path.basename(path) for path in files] == ['gecmis.log.2', 'gecmis.log.1', 'gecmis.log']
+    assert 0 < total < 30
+    assert matches[-1].endswith("satır 29")
+    assert [line[-2:] for line in matches] == sorted(line[-2:] for line in matches)
+
+
+def test_unusable_path_disables_history(tmp_path):
+    blocker = tmp_path / 'dosya'
+    blocker.write_text('', encoding='utf-8')
+    history = LogHistory(str(blocker / 'gecmis.log'))
+    
+    # Yazma hatası arayüze yansımaz, arama boş döner
+    history.write([("kayıt", 'info')], STAMP)
+    assert history.search("kayıt") == ([], 0)
+    history.close()
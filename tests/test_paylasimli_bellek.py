@@ -0,0 +1,79 @@
+# test_paylasimli_bellek.py - DataFrame'lerin paylaşımlı bellekle aktarımı (user-032)
+
+import gc
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paylasimli_bellek import TEXT_SEPARATOR, close_blocks, export_frame, import_frame
+
+
+def round_trip(df, min_bytes=0):
+    """Tanımı süreçler arası gibi pickle ile aktar; (kopya, blok sayısı) döndür"""
+    descriptor, blocks = export_frame(df, min_bytes=min_bytes)
+    try:
+        imported, shared = import_frame(pickle.loads(pickle.dumps(descriptor)))
+        # Bloklar serbest bırakılmadan önce veri kopyalanır - eşlenmiş görünüm sonra geçersizdir
+        copy = imported.copy(deep=True)
+        del imported
+        gc.collect()
+        shared.release()
+        return copy, len(blocks)
+    finally:
+        close_blocks(blocks)
+
+
+@pytest.fixture
+def result_frame():
+    n = 1000
+    return pd.DataFrame({
+        'Stok İsmi': pd.array([f"ÜRÜN {i:04d} ğüşıöç" for i in range(n)], dtype='str'),
+        'Satış Miktar': np.arange(n, dtype=np.int64),
+        'Net Kar': np.where(np.arange(n) % 7 == 0, np.nan, np.linspace(-50.0, 50.0, n)),
+        'Tarih': pd.date_range('2026-01-01', periods=n, freq='h')
+    })
+
+
+def test_numeric_text_and_nan_columns_round_trip(result_frame):
+    imported, block_count = round_trip(result_frame)
+    
+    pd.testing.assert_frame_equal(imported, result_frame)
+    assert imported['Net Kar'].isna().sum() == result_frame['Net Kar'].isna().sum()
+    # Metin sütunu da tek tampon olarak paylaşılır
+    assert block_count == 4
+
+
+def test_object_text_with_missing_values_is_pickled(result_frame):
+    df = result_frame.assign(Not=pd.Series(['not', None] * 500, dtype=object))
+    imported, block_count = round_trip(df)
+    
+    pd.testing.assert_frame_equal(imported, df)
+    assert imported['Not'].dtype == object
+    assert block_count == 4
+
+
+def test_text_containing_separator_is_not_split(result_frame):
+    df = result_frame.copy()
+    df.loc[3, 'Stok İsmi'] = f"A{TEXT_SEPARATOR}B"
+    imported, block_count = round_trip(df)
+    
+    assert imported.loc[3, 'Stok İsmi'] == f"A{TEXT_SEPARATOR}B"
+    pd.testing.assert_frame_equal(imported, df)
+    assert block_count == 3
+
+
+def test_index_and_labels_are_kept(result_frame):
+    df = result_frame.set_index(pd.Index(np.arange(1000, 0, -1), name='sira'))
+    df.columns = ['Stok İsmi', 2025, ('Net', 'Kar'), 'Tarih']
+    imported, _ = round_trip(df)
+    
+    pd.testing.assert_frame_equal(imported, df)
+
+
+def test_small_columns_stay_in_descriptor(result_frame):
+    imported, block_count = round_trip(result_frame.head(10), min_bytes=64 * 1024)
+    
+    pd.testing.assert_frame_equal(imported, result_frame.head(10))
+    assert block_count == 0
@@ -0,0 +1,87 @@
+# test_regression_gate.py - Performans gerileme kontrolünün karşılaştırma kuralları (user-043)
+
+import pytest
+
+from benchmarks.regression_gate import best_metrics, compare, compare_metric, parse_tolerances
+
+
+def veri_analizi_run(seconds):
+    """Tek metrikli veri_analizi sonuç sözlüğü"""
+    return {'benchmark': 'veri_analizi', 'methods': {'get_urun_analizi': {'seconds': {'1000': seconds}}}}
+
+
+def test_time_within_tolerance_is_ok():
+    status, change = compare_metric(1.0, 1.2, 'time', {})
+    
+    assert status == 'ok'
+    assert change == pytest.approx(0.2)
+
+
+def test_time_beyond_tolerance_is_regression():
+    assert compare_metric(1.0, 1.3, 'time', {})[0] == 'gerileme'
+    assert compare_metric(1.0, 0.7, 'time', {})[0] == 'iyileşme'
+
+
+def test_noise_floor_hides_large_relative_change():
+    # 2 ms -> 8 ms: %300 yavaşlama ama mutlak fark 10 ms gürültü tabanının altında
+    status, change = compare_metric(0.002, 0.008, 'time', {})
+    
+    assert status == 'ok'
+    assert change == pytest.approx(3.0)
+
+
+def test_memory_noise_floor_in_megabytes():
+    assert compare_metric(20.0, 29.0, 'memory', {})[0] == 'ok'
+    assert compare_metric(100.0, 120.0, 'memory', {})[0] == 'gerileme'
+
+
+def test_throughput_higher_is_better():
+    status, change = compare_metric(1000.0, 700.0, 'throughput', {})
+    
+    assert status == 'gerileme'
+    assert change == pytest.approx(0.3)
+    assert compare_metric(1000.0, 1300.0, 'throughput', {})[0] == 'iyileşme'
+
+
+def test_custom_tolerance_overrides_default():
+    assert compare_metric(1.0, 1.3, 'time', {'time': 0.4})[0] == 'ok'
+    assert parse_tolerances(['time=0.4', 'memory=0.2']) == {'time': 0.4, 'memory': 0.2}
+
+
+def test_zero_baseline_is_never_regression():
+    assert compare_metric(0, 5.0, 'time', {}) == ('ok', 0.0)
+
+
+def test_best_metrics_takes_best_direction_per_kind():
+    runs = [
+        {'benchmark': 'veri_analizi', 'methods': {'a': {'seconds': {'10': 0.5}}}},
+        {'benchmark': 'veri_analizi', 'methods': {'a': {'seconds': {'10': 0.3}}}},
+        {'benchmark': 'veri_analizi', 'methods': {'a': {'seconds': {'10': 0.4}}}}
+    ]
+    
+    assert best_metrics(runs) == {'a / 10 satır': (0.3, 'time')}
+
+
+def test_compare_uses_best_of_repeated_runs():
+    baseline = {'metrics': {'get_urun_analizi / 1000 satır': {'value': 1.0, 'kind': 'time'}}}
+    
+    # İlk ölçüm gürültülü, yeniden ölçüm taban çizgisine yakın
+    rows = compare(baseline, [veri_analizi_run(1.6), veri_analizi_run(1.05)])
+    
+    assert [(row['metric'], row['status']) for row in rows] == [('get_urun_analizi / 1000 satır', 'ok')]
+    assert rows[0]['current'] == 1.05
+
+
+def test_compare_marks_missing_and_new_metrics():
+    baseline = {'metrics': {'eski / 1000 satır': {'value': 1.0, 'kind': 'time'}}}
+    rows = compare(baseline, [veri_analizi_run(1.0)])
+    
+    assert {row['metric']: row['status'] for row in rows} == {
+        'eski / 1000 satır': 'eksik',
+        'get_urun_analizi / 1000 satır': 'yeni'
+    }
+
+
+def test_unknown_benchmark_is_rejected():
+    with pytest.raises(ValueError):
+        best_metrics([{'benchmark': 'bilinmeyen'}])
@@ -0,0 +1,93 @@
+# test_son_dosyalar.py - Son analiz edilen dosya çiftleri listesi (user-047)
+
+import json
+import os
+
+import son_dosyalar
+from son_dosyalar import RecentPairs
+
+
+def make_pair(tmp_path, name):
+    """Diskte var olan karlılık/iskonto dosya çifti"""
+    karlilik = tmp_path / f"{name}_karlilik.xlsx"
+    iskonto = tmp_path / f"{name}_iskonto.xlsx"
+    karlilik.write_bytes(b"karlilik")
+    iskonto.write_bytes(b"iskonto")
+    return str(karlilik), str(iskonto)
+
+
+def test_remember_persists_and_reloads(tmp_path):
+    path = str(tmp_path / 'son.json')
+    karlilik, iskonto = make_pair(tmp_path, 'ocak')
+    RecentPairs(path).remember(karlilik, iskonto)
+    
+    pair = RecentPairs(path).most_recent()
+    assert pair['karlilik'] == os.path.abspath(karlilik)
+    assert pair['iskonto'] == os.path.abspath(iskonto)
+    assert pair['karlilik_fingerprint'][0] == len(b"karlilik")
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_same_pair_moves_to_front_without_duplicate(tmp_path):
+    recent = RecentPairs(str(tmp_path / 'son.json'))
+    ocak = make_pair(tmp_path, 'ocak')
+    subat = make_pair(tmp_path, 'subat')
+    recent.remember(*ocak)
+    recent.remember(*subat)
+    recent.remember(*ocak)
+    
+    assert [os.path.basename(pair['karlilik']) for pair in recent.pairs] == [
+        'ocak_karlilik.xlsx', 'subat_karlilik.xlsx'
+    ]
+
+
+def test_list_is_capped(tmp_path, monkeypatch):
+    monkeypatch.setattr(son_dosyalar, 'MAX_RECENT_PAIRS', 3)
+    recent = RecentPairs(str(tmp_path / 'son.json'))
+    for i in range(5):
+        recent.remember(*make_pair(tmp_path, f"ay{i}"))
+    
+    assert len(recent.pairs) == 3
+    assert os.path.basename(recent.most_recent()['karlilik']) == 'ay4_karlilik.xlsx'
+
+
+def test_unchanged_detects_modified_and_missing_files(tmp_path):
+    recent = RecentPairs(str(tmp_path / 'son.json'))
+    karlilik, iskonto = make_pair(tmp_path, 'ocak')
+    pair = recent.remember(karlilik, iskonto)
+    assert recent.unchanged(pair)
+    
+    with open(iskonto, 'ab') as f:
+        f.write(b" degisti")
+    assert not recent.unchanged(pair)
+    
+    pair = recent.remember(karlilik, iskonto)
+    os.remove(karlilik)
+    assert not recent.unchanged(pair)
+
+
+def test_corrupt_entries_are_skipped(tmp_path):
+    path = tmp_path / 'son.json'
+    path.write_text(json.dumps({'pairs': [
+        {'karlilik': 'a.xlsx', 'iskonto': 'b.xlsx'},
+        {'karlilik': 'yalniz.xlsx'},
+        "bozuk"
+    ]}), encoding='utf-8')
+    
+    assert [pair['karlilik'] for pair in RecentPairs(str(path)).pairs] == ['a.xlsx']
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    path = tmp_path / 'son.json'
+    path.write_text("{bozuk json", encoding='utf-8')
+    
+    recent = RecentPairs(str(path))
+    assert recent.pairs == []
+    assert recent.most_recent() is None
+
+
+def test_label_shows_file_names_and_time(tmp_path):
+    recent = RecentPairs(str(tmp_path / 'son.json'))
+    pair = {'karlilik': '/veri/ocak.xlsx', 'iskonto': '/veri/iskonto.xlsx', 'used_at': '2026-01-02T03:04:05'}
+    
+    assert recent.label(pair) == "ocak.xlsx  +  iskonto.xlsx  (2026-01-02 03:04)"
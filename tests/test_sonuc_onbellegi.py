@@ -0,0 +1,109 @@
+# test_sonuc_onbellegi.py - Analiz sonuç önbelleği (user-048)
+
+import os
+
+import pandas as pd
+import pytest
+
+import sonuc_onbellegi
+from girdi_onbellegi import file_fingerprint
+from sonuc_onbellegi import ResultCache, result_key
+
+
+MAPPING = {
+    'karlilik_stok': 'Stok İsmi',
+    'satis_miktar': 'Satış Miktar',
+    'ort_satis_fiyat': None,
+    'iskonto_fiyat': 'Fiyat',
+    'iskonto_stok': 'Stok İsmi'
+}
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    karlilik = tmp_path / 'karlilik.xlsx'
+    iskonto = tmp_path / 'iskonto.xlsx'
+    karlilik.write_bytes(b'karlilik')
+    iskonto.write_bytes(b'iskonto')
+    return str(karlilik), str(iskonto)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    directory = tmp_path / 'onbellek'
+    directory.mkdir()
+    return ResultCache(str(directory))
+
+
+def store(cache, inputs, mapping=MAPPING, auto_mapping=True, rows=3):
+    fingerprints = tuple(file_fingerprint(path) for path in inputs)
+    df = pd.DataFrame({'Stok İsmi': [f"ÜRÜN {i}" for i in range(rows)], 'Net Kar': range(rows)})
+    cache.store(fingerprints, mapping, auto_mapping, df, rows, ['EKSİK'], '/tmp/sonuc.xlsx')
+    return df
+
+
+def test_stored_result_is_returned(cache, inputs):
+    df = store(cache, inputs)
+    hit = cache.lookup(*inputs, MAPPING)
+    
+    assert hit['df'].equals(df)
+    assert hit['eslesen_sayisi'] == 3
+    assert hit['eslesmeyenler'] == ['EKSİK']
+    assert hit['output'] == '/tmp/sonuc.xlsx'
+    assert hit['key'] == result_key(tuple(file_fingerprint(path) for path in inputs), MAPPING)
+
+
+def test_different_mapping_misses(cache, inputs):
+    store(cache, inputs)
+    assert cache.lookup(*inputs, dict(MAPPING, iskonto_fiyat='Liste Fiyatı')) is None
+
+
+def test_unresolved_lookup_uses_only_automatic_mappings(cache, inputs):
+    store(cache, inputs, auto_mapping=False)
+    assert cache.lookup(*inputs) is None
+    assert cache.lookup(*inputs, MAPPING) is not None
+    
+    store(cache, inputs, auto_mapping=True)
+    assert cache.lookup(*inputs) is not None
+
+
+def test_changed_input_file_misses(cache, inputs):
+    store(cache, inputs)
+    with open(inputs[1], 'ab') as f:
+        f.write(b' yeni satir')
+    assert cache.lookup(*inputs, MAPPING) is None
+
+
+def test_code_version_is_part_of_key(cache, inputs, monkeypatch):
+    store(cache, inputs)
+    monkeypatch.setattr(sonuc_onbellegi, '_code_version', 'baska-surum')
+    assert cache.lookup(*inputs, MAPPING) is None
+
+
+def test_missing_input_file_misses(cache, inputs):
+    store(cache, inputs)
+    os.unlink(inputs[0])
+    assert cache.lookup(*inputs, MAPPING) is None
+
+
+def test_oldest_entries_are_evicted(tmp_path, inputs):
+    directory = tmp_path / 'onbellek'
+    directory.mkdir()
+    cache = ResultCache(str(directory), max_entries=2)
+    for column in ('A', 'B', 'C'):
+        store(cache, inputs, mapping=dict(MAPPING, iskonto_fiyat=column))
+    
+    assert cache.lookup(*inputs, dict(MAPPING, iskonto_fiyat='A')) is None
+    assert cache.lookup(*inputs, dict(MAPPING, iskonto_fiyat='C')) is not None
+    assert len([name for name in os.listdir(cache.directory) if name.endswith('.pickle')]) == 2
+
+
+def test_corrupt_entry_is_removed(cache, inputs):
+    store(cache, inputs)
+    key = result_key(tuple(file_fingerprint(path) for path in inputs), MAPPING)
+    with open(os.path.join(cache.directory, f"{key}.pickle"), 'wb') as f:
+        f.write(b'bozuk')
+    
+    assert cache.lookup(*inputs, MAPPING) is None
+    assert not os.path.exists(os.path.join(cache.directory, f"{key}.pickle"))
+    assert cache._load_index() == []
@@ -0,0 +1,44 @@
+# test_sutun_eslestirme.py - Sütun rolü eşleştiricisi (user-050)
+
+from sutun_eslestirme import COLUMN_MATCHER, ColumnMatcher, ISKONTO_ROLES, KARLILIK_ROLES, contains, exact, normalize_header
+
+
+def test_normalize_header_turkish_characters():
+    assert normalize_header("  Ort.SATIŞ Fiyatı ") == "ort.satis fiyati"
+    assert normalize_header("İSKONTO") == "iskonto"
+    assert normalize_header(None) == ""
+    assert normalize_header(float('nan')) == ""
+
+
+def test_karlilik_roles_resolved_in_one_pass():
+    columns = ['Sıra', 'Stok Kodu', 'Stok İsmi', 'Satış\nMiktar', 'Ort.Satış\nFiyat', 'Satış Tutar']
+    found = COLUMN_MATCHER.match(columns, KARLILIK_ROLES)
+    
+    # "stok ismi" kuralı "stok kodu"ndan önce gelir
+    assert found == {
+        'karlilik_stok': 'Stok İsmi',
+        'satis_miktar': 'Satış\nMiktar',
+        'ort_satis_fiyat': 'Ort.Satış\nFiyat'
+    }
+
+
+def test_karlilik_stok_falls_back_to_stok_kodu():
+    assert COLUMN_MATCHER.match(['Stok Kodu', 'Miktar'], ('karlilik_stok',)) == {'karlilik_stok': 'Stok Kodu'}
+
+
+def test_iskonto_fiyat_excludes_liste_fiyati():
+    columns = ['Stok İsmi', 'Liste Fiyatı', 'İskontolu Fiyat']
+    assert COLUMN_MATCHER.match(columns, ISKONTO_ROLES) == {
+        'iskonto_fiyat': 'İskontolu Fiyat',
+        'iskonto_stok': 'Stok İsmi'
+    }
+
+
+def test_missing_roles_are_left_out():
+    assert COLUMN_MATCHER.match(['A', 'B', 3], KARLILIK_ROLES) == {}
+
+
+def test_match_ranked_reports_rule_order():
+    matcher = ColumnMatcher({'rol': (exact('Miktar'), contains('adet'))})
+    assert matcher.match_ranked(['Satılan Adet', 'Miktar']) == {'rol': ('Miktar', 0)}
+    assert matcher.match_ranked(['Satılan Adet']) == {'rol': ('Satılan Adet', 1)}
@@ -0,0 +1,88 @@
+# test_sutun_profilleri.py - Başlık düzenine göre kaydedilen sütun eşleşmeleri (user-050)
+
+import json
+import os
+import threading
+
+from sutun_profilleri import MAX_PROFILES, ColumnProfiles, header_key
+
+
+KARLILIK_COLUMNS = ['Stok Kodu', 'Ürün Adı', 'Adet', 'Birim Fiyat']
+
+
+def test_header_key_depends_on_names_and_order():
+    assert header_key(KARLILIK_COLUMNS) == header_key(list(KARLILIK_COLUMNS))
+    assert header_key(KARLILIK_COLUMNS) != header_key(list(reversed(KARLILIK_COLUMNS)))
+
+
+def test_remembered_mapping_is_found_by_header(tmp_path):
+    path = str(tmp_path / 'profiller.json')
+    profiles = ColumnProfiles(path)
+    profiles.remember('karlilik', KARLILIK_COLUMNS, {
+        'karlilik_stok': 'Ürün Adı',
+        'satis_miktar': 'Adet',
+        'ort_satis_fiyat': None
+    })
+    
+    # Yeni nesne aynı dosyadan okur; bulunamayan rol (None) saklanmaz
+    reloaded = ColumnProfiles(path)
+    assert reloaded.lookup('karlilik', KARLILIK_COLUMNS) == {'karlilik_stok': 'Ürün Adı', 'satis_miktar': 'Adet'}
+    assert reloaded.lookup('iskonto', KARLILIK_COLUMNS) == {}
+    assert reloaded.lookup('karlilik', KARLILIK_COLUMNS + ['Yeni']) == {}
+
+
+def test_numeric_column_names_survive_round_trip(tmp_path):
+    path = str(tmp_path / 'profiller.json')
+    ColumnProfiles(path).remember('iskonto', ['Stok İsmi', 2024, 2025], {'iskonto_stok': 'Stok İsmi', 'iskonto_fiyat': 2025})
+    assert ColumnProfiles(path).lookup('iskonto', ['Stok İsmi', 2024, 2025]) == {'iskonto_stok': 'Stok İsmi', 'iskonto_fiyat': 2025}
+
+
+def test_profile_count_is_limited(tmp_path):
+    profiles = ColumnProfiles(str(tmp_path / 'profiller.json'))
+    for i in range(MAX_PROFILES + 5):
+        profiles.remember('iskonto', [f"Sütun {i}", 'Fiyat'], {'iskonto_fiyat': 'Fiyat'})
+    
+    assert len(profiles.profiles) == MAX_PROFILES
+    # En uzun süredir kullanılmayanlar silinir
+    assert profiles.lookup('iskonto', ['Sütun 0', 'Fiyat']) == {}
+    assert profiles.lookup('iskonto', [f"Sütun {MAX_PROFILES + 4}", 'Fiyat']) == {'iskonto_fiyat': 'Fiyat'}
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / 'profiller.json'
+    path.write_text('{bozuk', encoding='utf-8')
+    messages = []
+    profiles = ColumnProfiles(str(path), log_callback=lambda message, msg_type: messages.append(msg_type))
+    
+    assert profiles.profiles == []
+    assert messages == ['warning']
+
+
+def test_write_failure_is_logged_and_kept_in_memory(tmp_path):
+    messages = []
+    profiles = ColumnProfiles(str(tmp_path / 'yok' / 'profiller.json'),
+                              log_callback=lambda message, msg_type: messages.append((msg_type, message)))
+    profiles.remember('iskonto', ['Fiyat'], {'iskonto_fiyat': 'Fiyat'})
+    
+    assert [msg_type for msg_type, _ in messages] == ['warning']
+    assert profiles.lookup('iskonto', ['Fiyat']) == {'iskonto_fiyat': 'Fiyat'}
+
+
+def test_concurrent_remember_leaves_valid_file(tmp_path):
+    path = str(tmp_path / 'profiller.json')
+    profiles = ColumnProfiles(path)
+    
+    def remember_many(thread_no):
+        for i in range(20):
+            profiles.remember('iskonto', [f"T{thread_no} {i}", 'Fiyat'], {'iskonto_fiyat': 'Fiyat'})
+    
+    threads = [threading.Thread(target=remember_many, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # Geçici dosya kalmaz, dosya bütün bir JSON'dur
+    assert os.listdir(tmp_path) == ['profiller.json']
+    with open(path, encoding='utf-8') as f:
+        assert len(json.load(f)['profiles']) == MAX_PROFILES
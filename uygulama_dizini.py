@@ -0,0 +1,29 @@
+# uygulama_dizini.py - Uygulamanın kalıcı dosyaları için kullanıcı dizini
+
+import os
+import sys
+
+
+APP_DIR_NAME = 'KarlilikAnalizi'
+
+
+def app_data_dir(*parts):
+    """Kullanıcıya özel uygulama dizinini (gerekirse alt dizinini) döndür ve oluştur
+    
+    Windows'ta %LOCALAPPDATA%, macOS'ta ~/Library/Application Support,
+    diğerlerinde $XDG_DATA_HOME (yoksa ~/.local/share) altında tutulur.
+    KARLILIK_DATA_DIR ortam değişkeni verilmişse o kullanılır.
+    """
+    base = os.environ.get('KARLILIK_DATA_DIR')
+    if not base:
+        if sys.platform == 'win32':
+            root = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+        elif sys.platform == 'darwin':
+            root = os.path.expanduser('~/Library/Application Support')
+        else:
+            root = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+        base = os.path.join(root, APP_DIR_NAME)
+    
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
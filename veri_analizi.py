@@ -1,7 +1,24 @@
 import pandas as pd
 import numpy as np
+from izleme import traced
+from profil import profile_call
 
 class VeriAnalizi:
+    # Görüntüleme çerçevesi sütunları - tablo ve listeler bu hazır metinleri kullanır
+    DISPLAY_COLUMNS = [
+        'ad', 'ad_liste',
+        'net_kar', 'net_kar_liste', 'net_kar_renk',
+        'birim_kar', 'birim_kar_renk',
+        'miktar', 'miktar_liste',
+        'ort_satis', 'ort_satis_renk',
+        'maliyet', 'maliyet_renk'
+    ]
+    
+    # Ortalama satış fiyatı için olası sütun isimleri
+    ORT_SATIS_COLUMNS = ['Ort.Satış Fiyat', 'Ort.Satış\nFiyat', 'Ort Satış Fiyat', 'Ortalama Satış Fiyat']
+    
+    @traced('veri')
+    @profile_call('VeriAnalizi')
     def __init__(self, df):
         """
         Karlılık analizi sonuçlarını analiz eden sınıf
@@ -23,7 +40,7 @@ class VeriAnalizi:
         """Veriyi analiz için temizle - sadece çalışma kopyasında"""
         if self.df.empty:
             return
-            
+        
         try:
             # Sayısal sütunları temizle - çalışma kopyasında
             numeric_columns = ['Birim Maliyet', 'Birim Kar', 'Net Kar']
@@ -47,10 +64,11 @@ class VeriAnalizi:
                     self.df[miktar_col] = self.df[miktar_col].fillna(0)
                 except (KeyError, ValueError, TypeError) as e:
                     print(f"Miktar sütunu temizleme hatası {miktar_col}: {e}")
-                        
+        
         except Exception as e:
             print(f"Genel veri temizleme hatası: {e}")
     
+    @traced('veri')
     def get_kpi_summary(self):
         """Temel KPI özetini döndür"""
         if self.df.empty:
@@ -119,7 +137,7 @@ class VeriAnalizi:
                 'negatif_kar_urun': int(negatif_kar_urun),
                 'toplam_satis_miktar': round(toplam_satis_miktar, 0)
             }
-            
+        
         except Exception as e:
             print(f"KPI hesaplama hatası: {e}")
             return self._get_empty_kpi()
@@ -141,7 +159,7 @@ class VeriAnalizi:
         """Stok ismi sütununu bul"""
         if self.df.empty:
             return None
-            
+        
         # Olasılık sırasına göre arama
         possible_patterns = [
             ['stok', 'ismi'],
@@ -171,7 +189,7 @@ class VeriAnalizi:
         """Satış miktar sütununu bul"""
         if self.df.empty:
             return None
-            
+        
         # Öncelik sırasına göre arama
         possible_names = ['Satış Miktar', 'Satış\nMiktar', 'Satis Miktar', 'Miktar']
         
@@ -199,6 +217,7 @@ class VeriAnalizi:
         
         return None
     
+    @traced('veri')
     def get_top_profitable_products(self, limit=10):
         """En karlı ürünleri döndür"""
         if self.df.empty or 'Net Kar' not in self.df.columns:
@@ -234,13 +253,14 @@ class VeriAnalizi:
             available_cols = [col for col in result_cols if col in top_df.columns]
             if not available_cols:
                 return pd.DataFrame()
-                
-            return top_df[available_cols].reset_index(drop=True)
             
+            return top_df[available_cols].reset_index(drop=True)
+        
         except Exception as e:
             print(f"Top karlı ürünler hatası: {e}")
             return pd.DataFrame()
     
+    @traced('veri')
     def get_top_selling_products(self, limit=10):
         """En çok satan ürünleri döndür"""
         if self.df.empty:
@@ -275,13 +295,14 @@ class VeriAnalizi:
             available_cols = [col for col in result_cols if col in top_df.columns]
             if not available_cols:
                 return pd.DataFrame()
-                
-            return top_df[available_cols].reset_index(drop=True)
             
+            return top_df[available_cols].reset_index(drop=True)
+        
         except Exception as e:
             print(f"Top satan ürünler hatası: {e}")
             return pd.DataFrame()
     
+    @traced('veri')
     def get_low_profit_products(self, limit=10):
         """En düşük karlı ürünleri döndür"""
         if self.df.empty or 'Net Kar' not in self.df.columns:
@@ -316,13 +337,14 @@ class VeriAnalizi:
             available_cols = [col for col in result_cols if col in low_df.columns]
             if not available_cols:
                 return pd.DataFrame()
-                
-            return low_df[available_cols].reset_index(drop=True)
             
+            return low_df[available_cols].reset_index(drop=True)
+        
         except Exception as e:
             print(f"Düşük karlı ürünler hatası: {e}")
             return pd.DataFrame()
     
+    @traced('veri')
     def get_profit_distribution(self):
         """Kar dağılımı analizi - DÜZELTİLMİŞ"""
         if self.df.empty or 'Net Kar' not in self.df.columns:
@@ -380,7 +402,7 @@ class VeriAnalizi:
                 dusuk_karli = len(pozitif_kar[pozitif_kar < q33])
                 orta_karli = len(pozitif_kar[(pozitif_kar >= q33) & (pozitif_kar < q67)])
                 cok_karli = len(pozitif_kar[pozitif_kar >= q67])
-                
+            
             except (ValueError, TypeError):
                 # Quantile hesaplanamıyorsa eşit dağıtım yap
                 pozitif_count = len(pozitif_kar)
@@ -394,7 +416,7 @@ class VeriAnalizi:
                 'dusuk_karli': int(dusuk_karli),
                 'zararda': int(zararda)
             }
-            
+        
         except Exception as e:
             print(f"Kar dağılımı hatası: {e}")
             return {
@@ -406,13 +428,21 @@ class VeriAnalizi:
     
     def search_product(self, search_term):
         """Ürün arama"""
-        if self.df.empty or not search_term:
+        mask = self.search_mask(search_term)
+        if mask is None:
             return pd.DataFrame()
+        return self.df[mask].reset_index(drop=True)
+    
+    @traced('veri')
+    def search_mask(self, search_term):
+        """Ürün arama maskesi - eşleşen satırlar için True, arama yapılamazsa None"""
+        if self.df.empty or not search_term:
+            return None
         
         try:
             stok_col = self.find_stok_column()
             if not stok_col or stok_col not in self.df.columns:
-                return pd.DataFrame()
+                return None
             
             # String tipine çevir ve güvenli arama yap
             search_series = self.df[stok_col].astype(str)
@@ -420,26 +450,160 @@ class VeriAnalizi:
             # Büyük/küçük harf duyarsız arama - regex kapalı
             search_term_clean = str(search_term).strip()
             if not search_term_clean:
-                return pd.DataFrame()
-                
+                return None
+            
             try:
-                mask = search_series.str.contains(search_term_clean, case=False, na=False, regex=False)
-                result = self.df[mask]
-                return result.reset_index(drop=True)
+                return search_series.str.contains(search_term_clean, case=False, na=False, regex=False)
             except Exception as search_error:
                 # Alternatif arama yöntemi
                 print(f"String arama hatası, alternatif yöntem deneniyor: {search_error}")
                 try:
-                    mask = search_series.str.lower().str.contains(search_term_clean.lower(), na=False)
-                    result = self.df[mask]
-                    return result.reset_index(drop=True)
+                    return search_series.str.lower().str.contains(search_term_clean.lower(), na=False)
                 except Exception:
-                    return pd.DataFrame()
-            
+                    return None
+        
         except Exception as e:
             print(f"Ürün arama hatası: {e}")
-            return pd.DataFrame()
+            return None
     
+    @traced('veri')
+    def filter_mask(self, filter_type):
+        """Hızlı filtre maskesi - 'all', 'profitable', 'loss', 'high_sales'"""
+        if self.df.empty:
+            return None
+        
+        try:
+            if filter_type == "all":
+                return pd.Series(True, index=self.df.index)
+            if filter_type in ("profitable", "loss"):
+                if 'Net Kar' not in self.df.columns:
+                    return None
+                kar_series = pd.to_numeric(self.df['Net Kar'], errors='coerce')
+                return kar_series > 0 if filter_type == "profitable" else kar_series < 0
+            if filter_type == "high_sales":
+                miktar_col = self.find_miktar_column()
+                if not miktar_col or miktar_col not in self.df.columns:
+                    return None
+                miktar_series = pd.to_numeric(self.df[miktar_col], errors='coerce')
+                return miktar_series >= miktar_series.quantile(0.75)
+        except (KeyError, ValueError, TypeError) as e:
+            print(f"Filtreleme hatası: {e}")
+        
+        return None
+    
+    @traced('veri')
+    def get_ranked_index(self, column, limit=10, ascending=False):
+        """Sütuna göre sıralanmış ilk N geçerli satırın index'i"""
+        if self.df.empty or not column or column not in self.df.columns:
+            return self.df.index[:0]
+        
+        values = pd.to_numeric(self.df[column], errors='coerce').dropna()
+        ranked = values.nsmallest(limit) if ascending else values.nlargest(limit)
+        return ranked.index
+    
+    @traced('veri')
+    def get_display_frame(self, index=None):
+        """Tablo ve listeler için biçimlendirilmiş metin/renk sütunları
+        
+        Yalnızca index'teki satırlar (verilmezse tümü) biçimlendirilir; biçimler
+        satır satır üretildiği için ekranda gösterilecek satırlarla çağrılmalıdır.
+        Sonuç verilen index'e sahiptir; renk sütunları DashboardComponents.COLORS
+        anahtarlarını içerir.
+        """
+        df = self.df if index is None else self.df.loc[index]
+        index = df.index
+        display = pd.DataFrame(index=index)
+        
+        if df.empty:
+            for col in self.DISPLAY_COLUMNS:
+                display[col] = pd.Series(dtype=object)
+            return display
+        
+        def numeric(col):
+            if col and col in df.columns:
+                return pd.to_numeric(df[col], errors='coerce')
+            return pd.Series(np.nan, index=index)
+        
+        # Ürün adı
+        stok_col = self.find_stok_column()
+        if stok_col and stok_col in df.columns:
+            names = df[stok_col].astype(str).where(df[stok_col].notna(), "Bilinmiyor")
+        else:
+            names = pd.Series("Veri Yok", index=index)
+        display['ad'] = names.where(names.str.len() <= 28, names.str[:25] + "...")
+        display['ad_liste'] = names.where(names.str.len() <= 30, names.str[:30] + "...")
+        
+        # Net Kar
+        net_kar = numeric('Net Kar')
+        display['net_kar'] = self._format_values(net_kar, [
+            (net_kar.abs() >= 1000, lambda v: f"₺{v / 1000:.1f}K"),
+            (net_kar.abs() < 1000, lambda v: f"₺{v:.0f}")
+        ], "N/A")
+        display['net_kar_liste'] = self._format_values(net_kar, [
+            (net_kar.notna(), lambda v: f"₺{v:,.2f}")
+        ], "N/A")
+        display['net_kar_renk'] = self._sign_colors(net_kar)
+        
+        # Birim Kar
+        birim_kar = numeric('Birim Kar')
+        display['birim_kar'] = self._format_values(birim_kar, [
+            (birim_kar.abs() >= 100, lambda v: f"₺{v:.0f}"),
+            (birim_kar.abs() < 100, lambda v: f"₺{v:.1f}")
+        ], "N/A")
+        display['birim_kar_renk'] = self._sign_colors(birim_kar)
+        
+        # Miktar
+        miktar = numeric(self.find_miktar_column())
+        display['miktar'] = self._format_values(miktar, [
+            (miktar >= 1000, lambda v: f"{v / 1000:.1f}K"),
+            (miktar < 1000, lambda v: f"{v:.0f}")
+        ], "N/A")
+        display['miktar_liste'] = self._format_values(miktar, [
+            (miktar.notna(), lambda v: f"{v:,.0f} adet")
+        ], "N/A")
+        
+        # Ortalama satış fiyatı
+        ort_satis_col = next((col for col in self.ORT_SATIS_COLUMNS if col in df.columns), None)
+        ort_satis = numeric(ort_satis_col)
+        display['ort_satis'] = self._format_values(ort_satis, [
+            (ort_satis >= 1000, lambda v: f"₺{v:,.0f}"),
+            (ort_satis < 1000, lambda v: f"₺{v:.2f}")
+        ], "Bilgi yok")
+        display['ort_satis_renk'] = np.where(ort_satis.notna(), 'success', 'text_light')
+        
+        # Birim Maliyet - sadece pozitif değerler gösterilir
+        maliyet = numeric('Birim Maliyet')
+        maliyet = maliyet.where(maliyet > 0)
+        display['maliyet'] = self._format_values(maliyet, [
+            (maliyet >= 1000, lambda v: f"₺{v:,.0f}"),
+            (maliyet < 1000, lambda v: f"₺{v:.2f}")
+        ], "N/A")
+        display['maliyet_renk'] = np.where(maliyet.notna(), 'primary', 'text_light')
+        
+        return display
+    
+    def get_display_rows(self, mask, limit):
+        """Maskenin seçtiği ilk limit satırın görüntüleme metinleri ve toplam eşleşme sayısı"""
+        selected = mask.index[mask.fillna(False).to_numpy(dtype=bool)]
+        return self.get_display_frame(selected[:limit]), len(selected)
+    
+    @staticmethod
+    def _format_values(values, rules, missing):
+        """Her (maske, biçim) kuralını yalnızca eşleşen değerlere uygula"""
+        result = pd.Series(missing, index=values.index, dtype=object)
+        for mask, fmt in rules:
+            mask = mask.fillna(False).astype(bool) & values.notna()
+            if mask.any():
+                result[mask] = values[mask].map(fmt)
+        return result
+    
+    @staticmethod
+    def _sign_colors(values):
+        """Pozitif/sıfır için 'success', negatif için 'danger', eksik için 'text_light'"""
+        colors = np.where(values >= 0, 'success', 'danger')
+        return np.where(values.isna(), 'text_light', colors)
+    
+    @traced('veri')
     def get_summary_stats(self):
         """Özet istatistikler"""
         if self.df.empty:
@@ -488,7 +652,7 @@ class VeriAnalizi:
                     print(f"Miktar istatistik hatası: {e}")
             
             return stats
-            
+        
         except Exception as e:
             print(f"İstatistik hesaplama hatası: {e}")
             return {}
\ No newline at end of file